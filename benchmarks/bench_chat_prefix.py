@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_ollama import StubConfig, StubOllama, silence_logs  # noqa: E402
+from src.application.use_cases import ExtractIncidentInfoUseCase  # noqa: E402
+from src.domain.entities import IncidentText  # noqa: E402
+from src.domain.value_objects import ExtractionPrompt  # noqa: E402
+from src.infrastructure.models import OllamaService  # noqa: E402
+from src.infrastructure.parsers import JsonParser  # noqa: E402
+from src.infrastructure.processors import (  # noqa: E402
+    TextPostprocessor,
+    TextPreprocessor,
+)
+
+
+async def run_mode(
+    stub: StubOllama, chat: bool, prompt_cache: bool, requests: int
+) -> None:
+    prompt = ExtractionPrompt.default_chat() if chat else ExtractionPrompt.default()
+    service = OllamaService(
+        base_url=stub.base_url, chat_prefix=prompt.prefix_messages if chat else None
+    )
+    await service.warmup()
+    use_case = ExtractIncidentInfoUseCase(
+        llm_service=service,
+        text_preprocessor=TextPreprocessor(),
+        json_parser=JsonParser(),
+        text_postprocessor=TextPostprocessor(),
+        prompt=prompt,
+    )
+
+    stub.config.prompt_cache = prompt_cache
+    stub.timings.clear()
+    latencies: List[float] = []
+    for n in range(requests):
+        started = time.perf_counter()
+        await use_case.execute(IncidentText(f"Falha no servidor {n} em São Paulo"))
+        latencies.append(time.perf_counter() - started)
+
+    await service.close()
+
+    # The first call fills the prompt cache, so it is left out of the averages.
+    warm = stub.timings[1:]
+    eval_count = statistics.mean(t["prompt_eval_count"] for t in warm)
+    eval_ms = statistics.mean(t["prompt_eval_duration"] for t in warm) / 1e6
+    label = f"{'/api/chat' if chat else '/api/generate'} " + (
+        "com cache de prefixo" if prompt_cache else "sem cache de prefixo"
+    )
+    print(
+        f"{label:<36} prompt_eval_count {eval_count:6.1f}  "
+        f"prompt_eval_duration {eval_ms:7.1f} ms  "
+        f"latência média {statistics.mean(latencies[1:]) * 1000:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Reuso do prefixo do prompt")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--prompt-delay-per-char", type=float, default=0.0002)
+    args = parser.parse_args()
+    silence_logs()
+
+    config = StubConfig(
+        trailing_text="",
+        token_delay=0.001,
+        prompt_delay_per_char=args.prompt_delay_per_char,
+    )
+    async with StubOllama(config) as stub:
+        for prompt_cache in (False, True):
+            for chat in (False, True):
+                await run_mode(stub, chat, prompt_cache, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
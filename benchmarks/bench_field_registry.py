@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import argparse
+import difflib
+import itertools
+import os
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.infrastructure.processors import (  # noqa: E402
+    DEFAULT_FIELD_ALIASES,
+    TextPostprocessor,
+)
+
+
+class LegacyFieldNormalizer:
+    def normalize_field_names(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        normalized = {}
+        for expected_field, variations in DEFAULT_FIELD_ALIASES.items():
+            value = data.get(expected_field)
+            if value is None:
+                for variation in variations:
+                    if variation in data:
+                        value = data[variation]
+                        break
+                if value is None:
+                    best_match = self._find_best_field_match(expected_field, list(data))
+                    if best_match:
+                        value = data[best_match]
+            if value is not None:
+                normalized[expected_field] = value
+        return normalized
+
+    def _find_best_field_match(
+        self, target_field: str, available_fields: List[str], threshold: float = 0.6
+    ) -> Optional[str]:
+        best_match = None
+        best_ratio = 0.0
+        for field in available_fields:
+            ratio = difflib.SequenceMatcher(
+                None, target_field.lower(), field.lower()
+            ).ratio()
+            if ratio > best_ratio and ratio >= threshold:
+                best_ratio = ratio
+                best_match = field
+        return best_match
+
+
+def key_sets(
+    noise_keys: int, long_key_chars: int
+) -> Dict[str, Callable[[], Dict[str, Any]]]:
+    canonical = {field: "valor" for field in DEFAULT_FIELD_ALIASES}
+    aliases = {
+        "data": "2025-08-13",
+        "lugar": "Recife",
+        "tipo": "Falha",
+        "efeito": "Lento",
+    }
+    typos = {
+        "data_ocorrenica": "2025-08-13",
+        "locall": "Recife",
+        "tipo_incidnte": "Falha",
+    }
+    noise = {f"campo_extra_{n}": n for n in range(noise_keys)}
+    long_keys = {
+        f"{'x' * long_key_chars}_{n}": n for n in range(max(1, noise_keys // 4))
+    }
+    fresh = itertools.count()
+
+    return {
+        "nomes canônicos": lambda: canonical,
+        "aliases": lambda: aliases,
+        "erros de digitação": lambda: typos,
+        f"{noise_keys} chaves desconhecidas": lambda: {**typos, **noise},
+        f"chaves de {long_key_chars} caracteres": lambda: {**aliases, **long_keys},
+        # Every call brings keys never seen before, defeating the memo entirely.
+        "chaves inéditas a cada chamada": lambda: {
+            f"campo_{next(fresh)}_{n}": n for n in range(noise_keys)
+        },
+    }
+
+
+def measure(func: Callable[[], Any], number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    return number / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Normalização de nomes de campos")
+    parser.add_argument("--noise-keys", type=int, default=40)
+    parser.add_argument("--long-key-chars", type=int, default=400)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    legacy = LegacyFieldNormalizer()
+    current = TextPostprocessor()
+
+    print(f"{'conjunto de chaves':<36} {'legado':>12} {'atual':>12}  ganho")
+    for label, make_data in key_sets(args.noise_keys, args.long_key_chars).items():
+        sample = make_data()
+        if not label.startswith("chaves inéditas"):
+            assert legacy.normalize_field_names(
+                sample
+            ) == current.normalize_field_names(sample), label
+
+        legacy_ops = measure(
+            lambda: legacy.normalize_field_names(make_data()), args.number
+        )
+        current_ops = measure(
+            lambda: current.normalize_field_names(make_data()), args.number
+        )
+        print(
+            f"{label:<36} {legacy_ops:>10,.0f}/s {current_ops:>10,.0f}/s  "
+            f"{current_ops / legacy_ops:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.corpus import (  # noqa: E402
+    EXTRACTED_FIELDS,
+    LLM_OUTPUTS,
+    LONG_TEXT,
+    SHORT_TEXTS,
+)
+from benchmarks.stub_ollama import silence_logs  # noqa: E402
+from src.infrastructure.parsers import JsonParser  # noqa: E402
+from src.infrastructure.processors import (  # noqa: E402
+    PortugueseTemporalExtractor,
+    SentenceWindowChunker,
+    TextPostprocessor,
+    TextPreprocessor,
+)
+
+Case = Tuple[str, Callable[[], Any]]
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "..", ".benchmarks", "hot_paths.json"
+)
+
+
+def build_cases() -> List[Case]:
+    preprocessor = TextPreprocessor()
+    chunker = SentenceWindowChunker()
+    parser = JsonParser()
+    postprocessor = TextPostprocessor()
+    temporal = PortugueseTemporalExtractor()
+    long_preprocessed = preprocessor.preprocess(LONG_TEXT)
+    short_preprocessed = [preprocessor.preprocess(text) for text in SHORT_TEXTS]
+
+    cases: List[Case] = [
+        (
+            "preprocess/textos curtos",
+            lambda: [preprocessor.preprocess(text) for text in SHORT_TEXTS],
+        ),
+        ("preprocess/texto longo", lambda: preprocessor.preprocess(LONG_TEXT)),
+        ("chunker/texto longo", lambda: chunker.split(long_preprocessed)),
+        (
+            "temporal/textos curtos",
+            lambda: [temporal.extract(text) for text in short_preprocessed],
+        ),
+    ]
+    for name, output in LLM_OUTPUTS.items():
+        cases.append((f"parse/{name}", lambda output=output: parser.parse(output)))
+    cases.append(
+        (
+            "parse_structured/limpo",
+            lambda: parser.parse_structured(LLM_OUTPUTS["limpo"]),
+        )
+    )
+    for name, fields in EXTRACTED_FIELDS.items():
+        cases.append(
+            (
+                f"postprocess/{name}",
+                lambda fields=fields: postprocessor.build_incident_info(
+                    postprocessor.normalize_field_names(fields)
+                ),
+            )
+        )
+    return cases
+
+
+def calibration() -> None:
+    # Fixed pure-Python workload; its speed tracks how fast the machine is
+    # right now, so comparisons divide it out.
+    total = 0
+    for value in range(2000):
+        total += value % 7
+    "".join(str(value) for value in range(200))
+
+
+def measure(
+    cases: List[Case], repeat: int, min_time: float
+) -> Dict[str, Dict[str, float]]:
+    timers = {}
+    for name, func in cases:
+        timer = timeit.Timer(func)
+        number, elapsed = timer.autorange()
+        timers[name] = (timer, max(1, int(number * min_time / elapsed)))
+
+    # Rounds visit every case in turn, so a burst of noise on the machine
+    # costs one round of each case instead of all rounds of one case; the
+    # fastest round is kept.
+    best = {name: float("inf") for name in timers}
+    for _ in range(repeat):
+        for name, (timer, number) in timers.items():
+            best[name] = min(best[name], timer.timeit(number) / number)
+
+    return {
+        name: {"ops_per_sec": 1 / best[name], "peak_bytes_per_call": peak_bytes(func)}
+        for name, func in cases
+    }
+
+
+def peak_bytes(func: Callable[[], Any]) -> float:
+    # Peak traced memory of one warm call, relative to what was already live.
+    func()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        speed = result["ops_per_sec"] / previous["ops_per_sec"]
+        if speed < 1 - threshold:
+            regressions.append(f"{name}: vazão {speed:.0%} da referência")
+        memory = result["peak_bytes_per_call"]
+        if memory > previous["peak_bytes_per_call"] * (1 + threshold) + 256:
+            regressions.append(
+                f"{name}: memória {memory:,.0f} B "
+                f"(referência {previous['peak_bytes_per_call']:,.0f} B)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks do pré-processamento, parse e pós-processamento"
+    )
+    parser.add_argument("--filter", default="", help="Roda só os casos com este texto")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Grava os resultados como referência",
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="Compara com a referência gravada"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Regressão tolerada (fração) antes de falhar na comparação",
+    )
+    args = parser.parse_args()
+    silence_logs()
+
+    cases = [(name, func) for name, func in build_cases() if args.filter in name]
+    results = measure([("calibração", calibration), *cases], args.repeat, args.min_time)
+    machine_ops = results.pop("calibração")["ops_per_sec"]
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as file:
+            saved = json.load(file)
+        baseline = saved["results"]
+        scale = saved["calibration_ops_per_sec"] / machine_ops
+        print(f"Velocidade da máquina em relação à referência: {1 / scale:.2f}x")
+        for result in results.values():
+            result["ops_per_sec"] *= scale
+
+    for name, result in results.items():
+        line = (
+            f"{name:<36} {result['ops_per_sec']:>12,.0f} ops/s  "
+            f"{result['peak_bytes_per_call']:>9,.0f} B/chamada"
+        )
+        if name in baseline:
+            line += f"  ({result['ops_per_sec'] / baseline[name]['ops_per_sec']:.2f}x)"
+        print(line)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "calibration_ops_per_sec": machine_ops,
+                    "results": results,
+                },
+                file,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"Referência gravada em {os.path.normpath(args.baseline)}")
+
+    if args.compare:
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSÃO {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"Sem regressões acima de {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_ollama import (  # noqa: E402
+    DEFAULT_RESPONSE,
+    StubConfig,
+    StubOllama,
+    silence_logs,
+)
+from src.application.use_cases import (  # noqa: E402
+    ExtractIncidentInfoUseCase,
+    MicroBatchExtractor,
+)
+from src.domain.entities import IncidentText  # noqa: E402
+from src.infrastructure.models import OllamaService  # noqa: E402
+from src.infrastructure.parsers import JsonParser  # noqa: E402
+from src.infrastructure.processors import (  # noqa: E402
+    TextPostprocessor,
+    TextPreprocessor,
+)
+
+_INCIDENT_LINE = re.compile(r"^\s*Incident \d+: ", re.MULTILINE)
+
+
+def respond(payload: Dict[str, Any]) -> str:
+    # The batch prompt's own example holds two "Incident N:" lines.
+    count = len(_INCIDENT_LINE.findall(payload["prompt"])) - 2
+    if count < 1:
+        return DEFAULT_RESPONSE
+
+    result = json.loads(DEFAULT_RESPONSE)
+    return json.dumps({"resultados": [result] * count}, ensure_ascii=False)
+
+
+async def run_mode(stub: StubOllama, batch_size: Optional[int], items: int) -> None:
+    service = OllamaService(base_url=stub.base_url)
+    await service.warmup()
+    json_parser = JsonParser()
+    micro_batcher = (
+        MicroBatchExtractor(service, json_parser, max_batch_size=batch_size)
+        if batch_size
+        else None
+    )
+    use_case = ExtractIncidentInfoUseCase(
+        llm_service=service,
+        text_preprocessor=TextPreprocessor(),
+        json_parser=json_parser,
+        text_postprocessor=TextPostprocessor(),
+        micro_batcher=micro_batcher,
+    )
+
+    requests_before = stub.stats["requests"]
+    started = time.perf_counter()
+    await asyncio.gather(
+        *[
+            use_case.execute(IncidentText(f"Falha no servidor {n} em São Paulo"))
+            for n in range(items)
+        ]
+    )
+    elapsed = time.perf_counter() - started
+    llm_calls = stub.stats["requests"] - requests_before
+
+    await service.close()
+
+    label = f"lotes de até {batch_size}" if batch_size else "um item por prompt"
+    print(
+        f"{label:<22} {items / elapsed:6.1f} itens/s  "
+        f"tempo total {elapsed:6.2f} s  chamadas ao LLM {llm_calls:3d}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-batching de incidentes")
+    parser.add_argument("--items", type=int, default=32)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--prompt-delay-per-char", type=float, default=0.0002)
+    parser.add_argument("--token-delay", type=float, default=0.002)
+    args = parser.parse_args()
+    silence_logs()
+
+    config = StubConfig(
+        trailing_text="",
+        token_delay=args.token_delay,
+        prompt_delay_per_char=args.prompt_delay_per_char,
+        parallel=1,
+        responder=respond,
+    )
+    async with StubOllama(config) as stub:
+        await run_mode(stub, None, args.items)
+        for batch_size in args.batch_sizes:
+            await run_mode(stub, batch_size, args.items)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_ollama import (  # noqa: E402
+    StubConfig,
+    StubOllama,
+    keep_alive_seconds,
+    silence_logs,
+)
+from src.infrastructure.models import (  # noqa: E402
+    OllamaModelResidency,
+    OllamaService,
+)
+
+
+async def run_mode(
+    label: str,
+    args: argparse.Namespace,
+    preload: bool,
+    keep_warm_interval: float,
+) -> None:
+    config = StubConfig(token_delay=0.001, load_delay=args.load_delay)
+    async with StubOllama(config) as stub:
+        residency = OllamaModelResidency(
+            "tinyllama",
+            keep_alive=args.keep_alive,
+            keep_warm_interval=keep_warm_interval,
+        )
+        service = OllamaService(base_url=stub.base_url, residency=residency)
+        await service.warmup()
+        if preload:
+            await service.preload()
+
+        for index in range(args.requests):
+            if index:
+                await asyncio.sleep(args.idle)
+            await service.generate_response("prompt")
+
+        stats = residency.stats()
+        await service.close()
+
+    print(
+        f"{label:<30} frias {stats['cold_starts']}  quentes {stats['warm_requests']}  "
+        f"latência fria {stats['avg_cold_latency_ms']} ms  "
+        f"latência quente {stats['avg_warm_latency_ms']} ms  "
+        f"cargas do modelo {stub.stats['model_loads']}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Latência com o modelo frio e quente")
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument("--idle", type=float, default=1.5)
+    parser.add_argument("--keep-alive", default="1s")
+    parser.add_argument("--load-delay", type=float, default=1.0)
+    args = parser.parse_args()
+    silence_logs()
+
+    await run_mode("sem pré-carga nem ping", args, preload=False, keep_warm_interval=0)
+    await run_mode("pré-carga", args, preload=True, keep_warm_interval=0)
+    await run_mode(
+        "pré-carga + ping de aquecimento",
+        args,
+        preload=True,
+        keep_warm_interval=keep_alive_seconds(args.keep_alive) / 3,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
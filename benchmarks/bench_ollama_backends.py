@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from contextlib import AsyncExitStack
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_ollama import StubConfig, StubOllama, silence_logs  # noqa: E402
+from src.infrastructure.models import (  # noqa: E402
+    OllamaBackend,
+    OllamaBackendPool,
+    OllamaService,
+)
+
+
+async def run(backend_count: int, requests: int, token_delay: float) -> None:
+    async with AsyncExitStack() as stack:
+        stubs = [
+            await stack.enter_async_context(
+                StubOllama(StubConfig(token_delay=token_delay, parallel=1))
+            )
+            for _ in range(backend_count)
+        ]
+        pool = OllamaBackendPool(
+            [OllamaBackend(stub.base_url, max_in_flight=2) for stub in stubs]
+        )
+        service = OllamaService(pool=pool)
+        await service.warmup()
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *[service.generate_response(f"prompt {i}") for i in range(requests)]
+        )
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"{backend_count} backend(s)  {requests / elapsed:6.1f} req/s  "
+            f"tempo total {elapsed:6.2f} s"
+        )
+        for stats in service.backend_stats():
+            print(
+                f"    {stats['url']}  requisições {stats['requests']:3d}  "
+                f"erros {stats['errors']}  latência média {stats['avg_latency_ms']} ms"
+            )
+
+        await service.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Vazão com um ou vários backends")
+    parser.add_argument("--backends", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--token-delay", type=float, default=0.001)
+    args = parser.parse_args()
+    silence_logs()
+
+    for count in range(1, args.backends + 1):
+        await run(count, args.requests, args.token_delay)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
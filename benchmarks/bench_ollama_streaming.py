@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_ollama import StubConfig, StubOllama, silence_logs  # noqa: E402
+from src.infrastructure.models import OllamaService  # noqa: E402
+
+
+async def run_mode(stub: StubOllama, stream: bool, requests: int) -> None:
+    service = OllamaService(base_url=stub.base_url, stream=stream)
+    await service.warmup()
+
+    tokens_before = stub.stats["tokens_generated"]
+    latencies: List[float] = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await service.generate_response("prompt")
+        latencies.append(time.perf_counter() - started)
+    await asyncio.sleep(0.05)
+    tokens = (stub.stats["tokens_generated"] - tokens_before) / requests
+
+    await service.close()
+
+    label = "streaming com parada antecipada" if stream else "sem streaming"
+    print(
+        f"{label:<34} média {statistics.mean(latencies) * 1000:7.1f} ms  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms  "
+        f"tokens gerados/req {tokens:6.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Geração com e sem streaming")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--token-delay", type=float, default=0.005)
+    args = parser.parse_args()
+    silence_logs()
+
+    async with StubOllama(StubConfig(token_delay=args.token_delay)) as stub:
+        print(f"Tokens por resposta completa (JSON + texto extra): {len(stub.tokens())}")
+        await run_mode(stub, stream=False, requests=args.requests)
+        await run_mode(stub, stream=True, requests=args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_ollama import StubConfig, StubOllama, silence_logs  # noqa: E402
+from src.application.use_cases import ExtractIncidentInfoUseCase  # noqa: E402
+from src.domain.entities import IncidentText  # noqa: E402
+from src.domain.exceptions import InvalidJsonResponseError  # noqa: E402
+from src.infrastructure.models import OllamaService  # noqa: E402
+from src.infrastructure.parsers import JsonParser  # noqa: E402
+from src.infrastructure.processors import (  # noqa: E402
+    TextPostprocessor,
+    TextPreprocessor,
+)
+from src.presentation.api.schemas import incident_response_json_schema  # noqa: E402
+
+INCIDENT = "Ontem às 14h, no escritório de São Paulo, houve uma falha no servidor."
+
+
+async def run_mode(stub: StubOllama, structured: bool, requests: int) -> None:
+    service = OllamaService(
+        base_url=stub.base_url,
+        response_schema=incident_response_json_schema() if structured else None,
+    )
+    await service.warmup()
+    use_case = ExtractIncidentInfoUseCase(
+        llm_service=service,
+        text_preprocessor=TextPreprocessor(),
+        json_parser=JsonParser(),
+        text_postprocessor=TextPostprocessor(),
+        structured_output=structured,
+    )
+
+    failures = 0
+    latencies: List[float] = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        try:
+            await use_case.execute(IncidentText(INCIDENT))
+        except InvalidJsonResponseError:
+            failures += 1
+        latencies.append(time.perf_counter() - started)
+
+    await service.close()
+
+    succeeded = requests - failures
+    elapsed = sum(latencies)
+    label = "saída estruturada (format)" if structured else "texto livre + extração"
+    print(
+        f"{label:<28} falhas {failures / requests:6.1%}  "
+        f"média {statistics.mean(latencies) * 1000:7.1f} ms  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms  "
+        f"extrações válidas/s {succeeded / elapsed:6.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Geração livre vs. restrita por schema"
+    )
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--token-delay", type=float, default=0.002)
+    parser.add_argument("--malformed-rate", type=float, default=0.15)
+    args = parser.parse_args()
+    silence_logs()
+
+    config = StubConfig(
+        token_delay=args.token_delay, malformed_rate=args.malformed_rate
+    )
+    async with StubOllama(config) as stub:
+        await run_mode(stub, structured=False, requests=args.requests)
+        await run_mode(stub, structured=True, requests=args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import re
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.infrastructure.processors import TextPreprocessor  # noqa: E402
+
+SAMPLE = (
+    "Anteontem, às 5h, no escritório de Pernambuco, houve uma falha no servidor "
+    "principal que afetou o sistema de notas por cinco horas.  Ontem  às 14h30 ; "
+    "a equipe   reiniciou o serviço,   e hoje às 9h o sistema voltou. "
+)
+
+
+class LegacyTextPreprocessor:
+    def __init__(self) -> None:
+        self._relative_dates = {
+            "hoje": datetime.now().strftime("%Y-%m-%d"),
+            "ontem": (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
+            "anteontem": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d"),
+        }
+
+    def preprocess(self, text: str) -> str:
+        text = re.sub(r"\s+", " ", text.strip())
+        for relative_date, actual_date in self._relative_dates.items():
+            pattern = rf"\b{re.escape(relative_date)}\b"
+            text = re.sub(pattern, actual_date, text, flags=re.IGNORECASE)
+        for pattern, replacement in [
+            (r"\b(\d{1,2})h(\d{2})\b", r"\1:\2"),
+            (r"\b(\d{1,2})h\b", r"\1:00"),
+            (r"\bàs\s+(\d{1,2}:\d{2})\b", r"\1"),
+            (r"\bàs\s+(\d{1,2})h\b", r"\1:00"),
+        ]:
+            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        text = re.sub(r"[,;]\s*", ", ", text)
+        text = re.sub(r"\.\s*", ". ", text)
+        return text.strip()
+
+
+def measure(label: str, statement: str, scope: dict, number: int) -> float:
+    seconds = min(timeit.repeat(statement, globals=scope, number=number, repeat=5))
+    ops_per_second = number / seconds
+    print(f"{label:<40} {ops_per_second:>12,.0f} ops/s")
+    return ops_per_second
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TextPreprocessor throughput")
+    parser.add_argument("--repeat-text", type=int, default=50)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    text = SAMPLE * args.repeat_text
+    legacy = LegacyTextPreprocessor()
+    current = TextPreprocessor()
+    assert legacy.preprocess(text) == current.preprocess(text)
+
+    print(f"Texto com {len(text):,} caracteres, {args.number} chamadas por rodada")
+    scope = {"LegacyTextPreprocessor": LegacyTextPreprocessor, "legacy": legacy}
+    scope.update({"TextPreprocessor": TextPreprocessor, "current": current})
+    scope["text"] = text
+
+    legacy_ops = measure("legado (instância reutilizada)", "legacy.preprocess(text)", scope, args.number)
+    measure(
+        "legado (instância por requisição)",
+        "LegacyTextPreprocessor().preprocess(text)",
+        scope,
+        args.number,
+    )
+    current_ops = measure("atual (instância reutilizada)", "current.preprocess(text)", scope, args.number)
+    measure(
+        "atual (instância por requisição)",
+        "TextPreprocessor().preprocess(text)",
+        scope,
+        args.number,
+    )
+    print(f"Ganho: {current_ops / legacy_ops:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
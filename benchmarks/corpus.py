@@ -0,0 +1,69 @@
+import json
+from typing import Dict
+
+SHORT_TEXTS = [
+    "Ontem às 14h, no escritório de São Paulo, houve uma falha no servidor "
+    "principal que afetou o sistema de faturamento por 2 horas.",
+    "Hoje às 9h30 ocorreu uma queda de energia no datacenter de Recife; os "
+    "serviços de autenticação ficaram indisponíveis.",
+    "Anteontem, às 5h, no escritório de Pernambuco, houve uma falha no "
+    "servidor principal que afetou o sistema de notas por cinco horas.",
+    "Vazamento de dados detectado hoje às 22h no ambiente de homologação em "
+    "Belo Horizonte, expondo registros de 300 clientes.",
+]
+
+_LONG_PARAGRAPH = (
+    "Relatório do incidente: ontem às 23h10 o monitoramento do escritório de "
+    "Porto Alegre registrou aumento de latência no banco de dados principal.  "
+    "Às 23h40 , a equipe de plantão identificou que o disco do servidor de "
+    "réplicas estava cheio ; as consultas de leitura passaram a falhar e o "
+    "sistema de pedidos ficou lento para os clientes da região Sul.\n\n"
+    "Hoje às 1h a réplica foi reconstruída, e às 2h15 o tráfego foi devolvido "
+    "ao cluster.  Impacto estimado: cerca de 1.200 pedidos atrasados e "
+    "reclamações no atendimento. "
+)
+LONG_TEXT = _LONG_PARAGRAPH * 12
+
+_RESULT = {
+    "data_ocorrencia": "2025-08-13 14:00",
+    "local": "São Paulo",
+    "tipo_incidente": "Falha no servidor",
+    "impacto": "Sistema de faturamento indisponível por 2 horas",
+}
+_RESULT_JSON = json.dumps(_RESULT, ensure_ascii=False)
+
+LLM_OUTPUTS: Dict[str, str] = {
+    "limpo": _RESULT_JSON,
+    "cercas markdown": f"```json\n{json.dumps(_RESULT, ensure_ascii=False, indent=2)}\n```",
+    "json aninhado": json.dumps(
+        {
+            **_RESULT,
+            "detalhes": {
+                "sistemas": ["faturamento", "notas"],
+                "equipe": {"nome": "infra", "plantao": True},
+            },
+        },
+        ensure_ascii=False,
+    ),
+    "ruído ao redor": (
+        "Claro! Aqui está a extração solicitada, com base no texto informado:\n\n"
+        f"{_RESULT_JSON}\n\n"
+        "Observação: a data foi inferida a partir de 'ontem'. Se precisar de "
+        "mais campos, {por exemplo} a duração, é só pedir."
+    ),
+    "malformado": (
+        "{'data_ocorrencia': '2025-08-13 14:00', local: 'São Paulo', "
+        "'tipo_incidente': 'Falha no servidor', 'impacto': 'Sistema fora',}"
+    ),
+    "truncado": _RESULT_JSON[:-25],
+}
+
+EXTRACTED_FIELDS: Dict[str, Dict[str, str]] = {
+    "campos corretos": dict(_RESULT),
+    "campos com erros": {
+        "data_ocoorrencia": _RESULT["data_ocorrencia"],
+        "localizacao": _RESULT["local"],
+        "tipo_incidentde": _RESULT["tipo_incidente"],
+        "impactu": _RESULT["impacto"],
+    },
+}
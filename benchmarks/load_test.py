@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shlex
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.corpus import LONG_TEXT, SHORT_TEXTS  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+Sample = Tuple[float, float, str]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@contextmanager
+def process(
+    args: List[str], env: Optional[Dict[str, str]] = None, quiet: bool = False
+) -> Iterator[None]:
+    # The API logs every request to stdout; warnings and tracebacks still
+    # reach stderr.
+    child = subprocess.Popen(
+        args,
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL if quiet else None,
+    )
+    try:
+        yield
+    finally:
+        child.terminate()
+        try:
+            child.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            child.kill()
+
+
+async def wait_until_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"{url} não respondeu em {timeout:.0f} s")
+
+
+async def drive(
+    url: str,
+    rps: float,
+    duration: float,
+    max_in_flight: int,
+    long_text_ratio: float,
+    poisson: bool,
+    seed: int,
+) -> Tuple[List[Sample], int, float]:
+    # Open-loop arrivals: requests are sent on schedule whether or not earlier
+    # ones finished, so a slow server shows up as latency, not as lower load.
+    rng = random.Random(seed)
+    samples: List[Sample] = []
+    dropped = 0
+    in_flight: "set[asyncio.Task[None]]" = set()
+    limits = httpx.Limits(
+        max_connections=max_in_flight, max_keepalive_connections=max_in_flight
+    )
+
+    async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+
+        async def send(text: str) -> None:
+            started = time.perf_counter()
+            try:
+                response = await client.post(f"{url}/extract", json={"text": text})
+                outcome = str(response.status_code)
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            samples.append((started, time.perf_counter() - started, outcome))
+
+        started = time.perf_counter()
+        next_at = started
+        while next_at - started < duration:
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+            if len(in_flight) >= max_in_flight:
+                dropped += 1
+            else:
+                text = (
+                    LONG_TEXT
+                    if rng.random() < long_text_ratio
+                    else rng.choice(SHORT_TEXTS)
+                )
+                task = asyncio.create_task(send(text))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_at += rng.expovariate(rps) if poisson else 1 / rps
+
+        await asyncio.gather(*in_flight)
+        elapsed = time.perf_counter() - started
+
+    return samples, dropped, elapsed
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(
+    samples: List[Sample], dropped: int, elapsed: float, target_rps: float
+) -> Dict[str, Any]:
+    outcomes = Counter(outcome for _, _, outcome in samples)
+    latencies = [latency for _, latency, outcome in samples if outcome == "200"]
+    summary: Dict[str, Any] = {
+        "target_rps": target_rps,
+        "sent": len(samples),
+        "dropped_client_side": dropped,
+        "elapsed_seconds": round(elapsed, 2),
+        "throughput_rps": round(len(samples) / elapsed, 2),
+        "goodput_rps": round(len(latencies) / elapsed, 2),
+        "outcomes": dict(outcomes),
+    }
+    if latencies:
+        summary.update(
+            {
+                f"{name}_ms": round(value * 1000, 1)
+                for name, value in [
+                    ("p50", percentile(latencies, 0.50)),
+                    ("p95", percentile(latencies, 0.95)),
+                    ("p99", percentile(latencies, 0.99)),
+                    ("mean", statistics.mean(latencies)),
+                    ("max", max(latencies)),
+                ]
+            }
+        )
+    return summary
+
+
+def print_report(summary: Dict[str, Any]) -> None:
+    print(
+        f"RPS alvo {summary['target_rps']:.1f}  enviadas {summary['sent']}  "
+        f"descartadas no cliente {summary['dropped_client_side']}  "
+        f"tempo {summary['elapsed_seconds']:.1f} s"
+    )
+    print(
+        f"vazão {summary['throughput_rps']:.1f} req/s  "
+        f"sucesso {summary['goodput_rps']:.1f} req/s  "
+        f"respostas {summary['outcomes']}"
+    )
+    if "p50_ms" in summary:
+        print(
+            f"latência p50 {summary['p50_ms']:.0f} ms  p95 {summary['p95_ms']:.0f} ms  "
+            f"p99 {summary['p99_ms']:.0f} ms  máx {summary['max_ms']:.0f} ms"
+        )
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    await wait_until_up(f"{args.api_url}/health")
+    samples, dropped, elapsed = await drive(
+        args.api_url,
+        args.rps,
+        args.duration,
+        args.max_in_flight,
+        args.long_text_ratio,
+        args.poisson,
+        args.seed,
+    )
+    return report(samples, dropped, elapsed, args.rps)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Teste de carga do /extract contra um Ollama simulado"
+    )
+    parser.add_argument("--rps", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--long-text-ratio", type=float, default=0.0)
+    parser.add_argument(
+        "--poisson", action="store_true", help="Chegadas com intervalos exponenciais"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--api-url", help="API já em execução; sem ela, sobe o Ollama simulado e a API"
+    )
+    parser.add_argument(
+        "--stub-args",
+        default="--latency lognormal:0.2,0.4 --token-delay 0.002",
+        help="Argumentos repassados ao stub_ollama.py",
+    )
+    parser.add_argument(
+        "--api-env",
+        action="append",
+        default=[],
+        metavar="NOME=VALOR",
+        help="Variável de ambiente extra para a API (pode repetir)",
+    )
+    parser.add_argument(
+        "--api-logs", action="store_true", help="Mostra os logs da API iniciada"
+    )
+    parser.add_argument("--json-output", help="Grava o resumo em JSON neste arquivo")
+    args = parser.parse_args()
+
+    if args.api_url:
+        summary = asyncio.run(run(args))
+    else:
+        stub_port, api_port = free_port(), free_port()
+        stub = [sys.executable, "benchmarks/stub_ollama.py", "--port", str(stub_port)]
+        api = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.presentation.api.main:app",
+            "--port",
+            str(api_port),
+            "--log-level",
+            "warning",
+        ]
+        env = {
+            "OLLAMA_BASE_URL": f"http://127.0.0.1:{stub_port}",
+            "EXTRACTION_CACHE_ENABLED": "false",
+            "LLM_COALESCING_ENABLED": "false",
+        }
+        env.update(item.split("=", 1) for item in args.api_env)
+
+        args.api_url = f"http://127.0.0.1:{api_port}"
+        with process(stub + shlex.split(args.stub_args)):
+            asyncio.run(wait_until_up(f"http://127.0.0.1:{stub_port}/api/tags"))
+            with process(api, env, quiet=not args.api_logs):
+                summary = asyncio.run(run(args))
+
+    print_report(summary)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from string import Template
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import structlog
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+DEFAULT_RESPONSE = json.dumps(
+    {
+        "data_ocorrencia": "2025-08-14 14:00",
+        "local": "São Paulo",
+        "tipo_incidente": "Falha no servidor",
+        "impacto": "Sistema de faturamento indisponível por 2 horas",
+    },
+    ensure_ascii=False,
+)
+
+DEFAULT_TRAILING_TEXT = (
+    "\n\nExplanation: the incident happened at the São Paulo office, where the main "
+    "server failed. The billing system was affected for two hours, so the impact "
+    "field describes the unavailability. The date was normalized to the requested "
+    "format and the location keeps only the city name."
+)
+
+DEFAULT_MALFORMED_TEXT = (
+    "Here is the extracted information:\n"
+    "- data_ocorrencia: 2025-08-14 14:00\n"
+    "- local: São Paulo\n"
+    "- tipo_incidente: Falha no servidor"
+)
+
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def keep_alive_seconds(value: Any) -> float:
+    if isinstance(value, str) and value and value[-1] in _DURATION_UNITS:
+        seconds = float(value[:-1]) * _DURATION_UNITS[value[-1]]
+    else:
+        seconds = float(value)
+    return float("inf") if seconds < 0 else seconds
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    kind: str = "fixed"
+    params: Tuple[float, ...] = (0.0,)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        elif self.kind == "lognormal":
+            median, sigma = self.params
+            value = median * rng.lognormvariate(0.0, sigma)
+        elif self.kind == "exponential":
+            value = rng.expovariate(1 / self.params[0])
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.kind}")
+        return max(0.0, value)
+
+
+_LATENCY_ARITY = {
+    "fixed": 1,
+    "uniform": 2,
+    "normal": 2,
+    "lognormal": 2,
+    "exponential": 1,
+}
+
+
+def parse_latency(spec: str) -> LatencyDistribution:
+    # "fixed:0.2", "uniform:0.1,0.4", "normal:0.3,0.05", "lognormal:0.25,0.5"
+    # (median, sigma) or "exponential:0.3" (mean), all in seconds.
+    kind, _, raw = spec.partition(":")
+    params = tuple(float(value) for value in raw.split(",") if value)
+    if _LATENCY_ARITY.get(kind) != len(params):
+        raise ValueError(f"Invalid latency distribution: {spec}")
+    return LatencyDistribution(kind, params)
+
+
+def silence_logs() -> None:
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+
+@dataclass
+class StubConfig:
+    response_text: str = DEFAULT_RESPONSE
+    trailing_text: str = DEFAULT_TRAILING_TEXT
+    token_delay: float = 0.005
+    chars_per_token: int = 4
+    models: List[str] = field(default_factory=lambda: ["tinyllama:latest"])
+    malformed_rate: float = 0.0
+    malformed_text: str = DEFAULT_MALFORMED_TEXT
+    seed: int = 0
+    # Generations served at once, like OLLAMA_NUM_PARALLEL; None means unlimited.
+    parallel: Optional[int] = None
+    # Prompt evaluation time per prompt character, before the first token.
+    prompt_delay_per_char: float = 0.0
+    # Builds the JSON answer from the request payload instead of response_text.
+    responder: Optional[Callable[[Dict[str, Any]], str]] = None
+    # Time to load the model into memory when it is not resident.
+    load_delay: float = 0.0
+    # Used when a request does not send keep_alive, like Ollama's 5m default.
+    default_keep_alive: Any = "5m"
+    # Reuse the evaluated prefix shared with the previous prompt, like the
+    # llama.cpp prompt cache behind Ollama.
+    prompt_cache: bool = False
+    # Extra time before the first token, sampled per request.
+    latency: LatencyDistribution = LatencyDistribution()
+    # Fraction of generate/chat requests answered with error_status.
+    error_rate: float = 0.0
+    error_status: int = 500
+    # Answers picked at random per request instead of response_text; $model
+    # and $request are substituted.
+    response_templates: List[str] = field(default_factory=list)
+    # Time /api/pull takes before the model shows up in /api/tags.
+    pull_delay: float = 0.0
+
+
+class StubOllama:
+    def __init__(self, config: Optional[StubConfig] = None) -> None:
+        self.config = config or StubConfig()
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "tokens_generated": 0,
+            "malformed_responses": 0,
+            "model_loads": 0,
+            "errors": 0,
+            "pulls": 0,
+        }
+        self._random = random.Random(self.config.seed)
+        self._slots = asyncio.Semaphore(self.config.parallel or 1_000_000)
+        self._load_lock = asyncio.Lock()
+        self._loaded_until = 0.0
+        self._cached_prompt = ""
+        self.timings: List[Dict[str, int]] = []
+        self.app = self._build_app()
+        self._server: Optional[uvicorn.Server] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.base_url = ""
+
+    def tokens(self, payload: Optional[Dict[str, Any]] = None) -> List[str]:
+        payload = payload or {}
+        if "prompt" in payload and not payload["prompt"]:
+            return []
+
+        if self.config.responder:
+            response_text = self.config.responder(payload)
+        elif self.config.response_templates:
+            response_text = Template(
+                self._random.choice(self.config.response_templates)
+            ).safe_substitute(
+                model=payload.get("model", ""), request=self.stats["requests"]
+            )
+        else:
+            response_text = self.config.response_text
+        if "format" in payload:
+            # Constrained decoding ends as soon as the schema is satisfied, so the
+            # model can neither ramble after the object nor skip the JSON.
+            text = response_text
+        elif self._random.random() < self.config.malformed_rate:
+            self.stats["malformed_responses"] += 1
+            text = self.config.malformed_text
+        else:
+            text = response_text + self.config.trailing_text
+
+        size = self.config.chars_per_token
+        return [text[start : start + size] for start in range(0, len(text), size)]
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/api/tags")
+        async def tags() -> Dict[str, Any]:
+            return {"models": [{"name": name} for name in self.config.models]}
+
+        @app.post("/api/pull", response_model=None)
+        async def pull(request: Request) -> Any:
+            payload = await request.json()
+            name = payload.get("name") or payload.get("model", "")
+            if payload.get("stream", True):
+                return StreamingResponse(
+                    self._pull_progress(name), media_type="application/x-ndjson"
+                )
+            await self._pull(name)
+            return {"status": "success"}
+
+        @app.post("/api/generate", response_model=None)
+        async def generate(request: Request) -> Any:
+            payload = await request.json()
+            if payload.get("prompt"):
+                payload["prompt"] = render_prompt(
+                    [{"role": "user", "content": payload["prompt"]}]
+                )
+            return await self._respond(payload, chat=False)
+
+        @app.post("/api/chat", response_model=None)
+        async def chat(request: Request) -> Any:
+            payload = await request.json()
+            payload["prompt"] = render_prompt(payload.get("messages", []))
+            return await self._respond(payload, chat=True)
+
+        return app
+
+    async def _pull(self, name: str) -> None:
+        self.stats["pulls"] += 1
+        await asyncio.sleep(self.config.pull_delay)
+        if not any(name in model for model in self.config.models):
+            self.config.models.append(name if ":" in name else f"{name}:latest")
+
+    async def _pull_progress(self, name: str) -> AsyncIterator[str]:
+        yield json.dumps({"status": "pulling manifest"}) + "\n"
+        await self._pull(name)
+        yield json.dumps({"status": "success"}) + "\n"
+
+    async def _respond(self, payload: Dict[str, Any], chat: bool) -> Any:
+        self.stats["requests"] += 1
+        if not any(payload.get("model", "") in model for model in self.config.models):
+            return JSONResponse(
+                {"error": f"model '{payload.get('model')}' not found"}, status_code=404
+            )
+        if self._random.random() < self.config.error_rate:
+            self.stats["errors"] += 1
+            return JSONResponse(
+                {"error": "simulated failure"}, status_code=self.config.error_status
+            )
+
+        tokens = self.tokens(payload)
+
+        if payload.get("stream", True):
+            return StreamingResponse(
+                self._stream_tokens(payload, tokens, chat),
+                media_type="application/x-ndjson",
+            )
+
+        timings: Dict[str, int] = {}
+        generated = [t async for t in self._generation(payload, tokens, timings)]
+        return {
+            "model": payload["model"],
+            **_content("".join(generated), chat),
+            "done": True,
+            **timings,
+        }
+
+    async def _ensure_loaded(self, payload: Dict[str, Any]) -> float:
+        load_duration = 0.0
+
+        async with self._load_lock:
+            if time.monotonic() >= self._loaded_until:
+                self.stats["model_loads"] += 1
+                await asyncio.sleep(self.config.load_delay)
+                load_duration = self.config.load_delay
+
+            keep_alive = payload.get("keep_alive", self.config.default_keep_alive)
+            self._loaded_until = time.monotonic() + keep_alive_seconds(keep_alive)
+
+        return load_duration
+
+    async def _generation(
+        self, payload: Dict[str, Any], tokens: List[str], timings: Dict[str, int]
+    ) -> AsyncIterator[str]:
+        async with self._slots:
+            started = time.monotonic()
+            load_duration = await self._ensure_loaded(payload)
+
+            prompt = payload.get("prompt", "")
+            reused = 0
+            if self.config.prompt_cache:
+                reused = len(os.path.commonprefix([prompt, self._cached_prompt]))
+                self._cached_prompt = prompt
+            evaluated = len(prompt) - reused
+
+            prompt_started = time.monotonic()
+            await asyncio.sleep(
+                evaluated * self.config.prompt_delay_per_char
+                + self.config.latency.sample(self._random)
+            )
+            eval_started = time.monotonic()
+
+            for token in tokens:
+                await asyncio.sleep(self.config.token_delay)
+                self.stats["tokens_generated"] += 1
+                yield token
+
+            finished = time.monotonic()
+
+        timings.update(
+            total_duration=_nanoseconds(finished - started),
+            load_duration=_nanoseconds(load_duration),
+            prompt_eval_count=evaluated // self.config.chars_per_token,
+            prompt_eval_duration=_nanoseconds(eval_started - prompt_started),
+            eval_count=len(tokens),
+            eval_duration=_nanoseconds(finished - eval_started),
+        )
+        self.timings.append(dict(timings))
+
+    async def _stream_tokens(
+        self, payload: Dict[str, Any], tokens: List[str], chat: bool
+    ) -> AsyncIterator[str]:
+        timings: Dict[str, int] = {}
+        async for token in self._generation(payload, tokens, timings):
+            yield json.dumps({**_content(token, chat), "done": False}) + "\n"
+        yield json.dumps({**_content("", chat), "done": True, **timings}) + "\n"
+
+    async def __aenter__(self) -> "StubOllama":
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=0, log_level="error")
+        self._server = uvicorn.Server(config)
+        self._server.install_signal_handlers = lambda: None  # type: ignore[method-assign]
+        self._task = asyncio.create_task(self._server.serve())
+
+        while not self._server.started:
+            await asyncio.sleep(0.01)
+
+        port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._task is not None:
+            await self._task
+
+
+def render_prompt(messages: List[Dict[str, str]]) -> str:
+    # Zephyr-style template used by tinyllama.
+    turns = "".join(
+        f"<|{message['role']}|>\n{message['content']}</s>\n" for message in messages
+    )
+    return f"{turns}<|assistant|>\n"
+
+
+def _content(text: str, chat: bool) -> Dict[str, Any]:
+    if chat:
+        return {"message": {"role": "assistant", "content": text}}
+    return {"response": text}
+
+
+def _nanoseconds(seconds: float) -> int:
+    return int(seconds * 1e9)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor Ollama simulado")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--token-delay", type=float, default=0.005)
+    parser.add_argument(
+        "--latency",
+        type=parse_latency,
+        default=LatencyDistribution(),
+        help="Atraso antes do primeiro token, ex.: lognormal:0.25,0.5",
+    )
+    parser.add_argument("--prompt-delay-per-char", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--trailing-text", default=DEFAULT_TRAILING_TEXT)
+    parser.add_argument(
+        "--responses-file", help="Arquivo JSON com uma lista de respostas modelo"
+    )
+    parser.add_argument("--parallel", type=int)
+    parser.add_argument("--load-delay", type=float, default=0.0)
+    parser.add_argument("--pull-delay", type=float, default=0.0)
+    parser.add_argument("--models", nargs="+", default=["tinyllama:latest"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    templates: List[str] = []
+    if args.responses_file:
+        with open(args.responses_file, encoding="utf-8") as file:
+            templates = [
+                item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
+                for item in json.load(file)
+            ]
+
+    stub = StubOllama(
+        StubConfig(
+            token_delay=args.token_delay,
+            latency=args.latency,
+            prompt_delay_per_char=args.prompt_delay_per_char,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            malformed_rate=args.malformed_rate,
+            trailing_text=args.trailing_text,
+            response_templates=templates,
+            parallel=args.parallel,
+            load_delay=args.load_delay,
+            pull_delay=args.pull_delay,
+            models=args.models,
+            seed=args.seed,
+        )
+    )
+    uvicorn.run(stub.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
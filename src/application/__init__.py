@@ -1,15 +1,35 @@
 from .interfaces import (
+    CachePolicy,
+    ExtractionCacheInterface,
+    FastPathExtractorInterface,
     JsonParserInterface,
     LLMServiceInterface,
+    MetricsRecorderInterface,
+    TextChunkerInterface,
     TextPostprocessorInterface,
     TextPreprocessorInterface,
 )
-from .use_cases import ExtractIncidentInfoUseCase
+from .use_cases import (
+    BatchExtractIncidentInfoUseCase,
+    BatchItem,
+    BatchItemResult,
+    ExtractIncidentInfoUseCase,
+    MicroBatchExtractor,
+)
 
 __all__ = [
+    "CachePolicy",
+    "ExtractionCacheInterface",
+    "FastPathExtractorInterface",
     "LLMServiceInterface",
+    "MetricsRecorderInterface",
     "JsonParserInterface",
+    "TextChunkerInterface",
     "TextPostprocessorInterface",
     "TextPreprocessorInterface",
+    "BatchExtractIncidentInfoUseCase",
+    "BatchItem",
+    "BatchItemResult",
     "ExtractIncidentInfoUseCase",
+    "MicroBatchExtractor",
 ]
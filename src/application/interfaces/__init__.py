@@ -1,13 +1,30 @@
+from .extraction_cache import CachePolicy, ExtractionCacheInterface
+from .fast_path_extractor import FastPathExtractorInterface
+from .job_queue import Job, JobQueueInterface, JobStatus
 from .llm_service import LLMServiceInterface
+from .metrics import MetricsRecorderInterface
 from .text_processing import (
+    JsonFieldReaderInterface,
     JsonParserInterface,
+    TemporalExtractorInterface,
+    TextChunkerInterface,
     TextPostprocessorInterface,
     TextPreprocessorInterface,
 )
 
 __all__ = [
+    "CachePolicy",
+    "ExtractionCacheInterface",
+    "FastPathExtractorInterface",
+    "Job",
+    "JobQueueInterface",
+    "JobStatus",
     "LLMServiceInterface",
+    "MetricsRecorderInterface",
+    "JsonFieldReaderInterface",
     "JsonParserInterface",
+    "TemporalExtractorInterface",
+    "TextChunkerInterface",
     "TextPostprocessorInterface",
     "TextPreprocessorInterface",
 ]
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from ...domain.entities import IncidentInfo
+
+
+class CachePolicy(Enum):
+    USE = "use"
+    BYPASS = "bypass"
+    REFRESH = "refresh"
+
+
+class ExtractionCacheInterface(ABC):
+    @abstractmethod
+    def build_key(self, preprocessed_text: str, prompt_version: str) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[IncidentInfo]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, incident_info: IncidentInfo) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
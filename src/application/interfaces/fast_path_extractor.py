@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from ...domain.entities import IncidentInfo
+
+
+class FastPathExtractorInterface(ABC):
+    @abstractmethod
+    def extract(self, text: str) -> Optional[IncidentInfo]:
+        pass
+
+    @abstractmethod
+    def should_compare(self) -> bool:
+        pass
+
+    @abstractmethod
+    def record_comparison(
+        self, fast_path_info: IncidentInfo, llm_info: IncidentInfo
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
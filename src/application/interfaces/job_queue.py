@@ -0,0 +1,90 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from ...domain.entities import IncidentInfo
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    EXPIRED = "expired"
+
+
+@dataclass(frozen=True)
+class Job:
+    id: str
+    status: JobStatus
+    text: str
+    reference_time: Optional[datetime]
+    attempts: int
+    created_at: float
+    updated_at: float
+    result: Optional[IncidentInfo] = None
+    error_type: Optional[str] = None
+    error: Optional[str] = None
+
+
+class JobQueueInterface(ABC):
+    @abstractmethod
+    def enqueue(self, text: str, reference_time: Optional[datetime]) -> Job:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def acquire_worker_lock(self) -> bool:
+        pass
+
+    @abstractmethod
+    def claim(self) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def next_available_at(self) -> Optional[float]:
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, result: IncidentInfo) -> None:
+        pass
+
+    @abstractmethod
+    def retry(
+        self,
+        job_id: str,
+        error_type: str,
+        error: str,
+        delay: float,
+        count_attempt: bool = True,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, error_type: str, error: str) -> None:
+        pass
+
+    @abstractmethod
+    def release(self, job_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def recover(self) -> int:
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import AsyncGenerator
 
 
 class LLMServiceInterface(ABC):
     @abstractmethod
     async def generate_response(self, prompt: str) -> str:
         pass
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        # Services that cannot stream hand back the whole response as a
+        # single token.
+        yield await self.generate_response(prompt)
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class MetricsRecorderInterface(ABC):
+    @abstractmethod
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    def count_error(self, error_type: str) -> None:
+        pass
@@ -1,12 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...domain.entities import IncidentInfo
 
 
 class TextPreprocessorInterface(ABC):
     @abstractmethod
-    def preprocess(self, text: str) -> str:
+    def preprocess(self, text: str, reference_time: Optional[datetime] = None) -> str:
+        pass
+
+
+class TemporalExtractorInterface(ABC):
+    @abstractmethod
+    def extract(
+        self, text: str, reference_time: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        pass
+
+
+class TextChunkerInterface(ABC):
+    @abstractmethod
+    def split(self, text: str) -> List[str]:
+        pass
+
+
+class JsonFieldReaderInterface(ABC):
+    @abstractmethod
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
         pass
 
 
@@ -15,6 +36,14 @@ class JsonParserInterface(ABC):
     def parse(self, text: str) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def parse_structured(self, text: str) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def field_reader(self) -> JsonFieldReaderInterface:
+        pass
+
 
 class TextPostprocessorInterface(ABC):
     @abstractmethod
@@ -1,3 +1,23 @@
-from .extract_incident_info import ExtractIncidentInfoUseCase
+from .batch_extract_incident_info import (
+    BatchExtractIncidentInfoUseCase,
+    BatchItem,
+    BatchItemResult,
+)
+from .extract_incident_info import (
+    ExtractedField,
+    ExtractIncidentInfoUseCase,
+    ExtractionEvent,
+)
+from .extraction_job_worker import ExtractionJobWorkerPool
+from .micro_batch_extractor import MicroBatchExtractor
 
-__all__ = ["ExtractIncidentInfoUseCase"]
+__all__ = [
+    "BatchExtractIncidentInfoUseCase",
+    "BatchItem",
+    "BatchItemResult",
+    "ExtractedField",
+    "ExtractIncidentInfoUseCase",
+    "ExtractionEvent",
+    "ExtractionJobWorkerPool",
+    "MicroBatchExtractor",
+]
@@ -0,0 +1,83 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncGenerator, AsyncIterable, Optional, Set
+
+from ...domain.entities import IncidentInfo, IncidentText
+from ..interfaces import CachePolicy
+from .extract_incident_info import ExtractIncidentInfoUseCase
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    index: int
+    text: Optional[str] = None
+    error: Optional[Exception] = None
+    reference_time: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    index: int
+    incident_info: Optional[IncidentInfo] = None
+    error: Optional[Exception] = None
+
+
+class BatchExtractIncidentInfoUseCase:
+    def __init__(
+        self, use_case: ExtractIncidentInfoUseCase, max_concurrency: int = 4
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._use_case = use_case
+        self._max_concurrency = max_concurrency
+
+    async def execute(
+        self,
+        items: AsyncIterable[BatchItem],
+        cache_policy: CachePolicy = CachePolicy.USE,
+    ) -> AsyncGenerator[BatchItemResult, None]:
+        pending: Set["asyncio.Task[BatchItemResult]"] = set()
+
+        try:
+            async for item in items:
+                if item.error is not None or item.text is None:
+                    yield BatchItemResult(
+                        index=item.index,
+                        error=item.error or ValueError("Missing incident text"),
+                    )
+                    continue
+
+                if len(pending) >= self._max_concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+
+                pending.add(asyncio.create_task(self._extract_item(item, cache_policy)))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _extract_item(
+        self, item: BatchItem, cache_policy: CachePolicy
+    ) -> BatchItemResult:
+        try:
+            incident_text = IncidentText(
+                content=item.text or "", reference_time=item.reference_time
+            )
+            incident_info = await self._use_case.execute(
+                incident_text, cache_policy=cache_policy
+            )
+            return BatchItemResult(index=item.index, incident_info=incident_info)
+        except Exception as e:
+            return BatchItemResult(index=item.index, error=e)
@@ -1,12 +1,48 @@
+import asyncio
+import copy
+import dataclasses
+import time
+from contextlib import aclosing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
 from ...domain.entities import IncidentInfo, IncidentText
 from ...domain.exceptions import InvalidJsonResponseError
 from ...domain.value_objects import ExtractionPrompt
 from ..interfaces import (
+    CachePolicy,
+    ExtractionCacheInterface,
+    FastPathExtractorInterface,
     JsonParserInterface,
     LLMServiceInterface,
+    MetricsRecorderInterface,
+    TemporalExtractorInterface,
+    TextChunkerInterface,
     TextPostprocessorInterface,
     TextPreprocessorInterface,
 )
+from .micro_batch_extractor import MicroBatchExtractor
+
+
+@dataclass(frozen=True)
+class ExtractedField:
+    name: str
+    value: Any
+
+
+ExtractionEvent = Union[ExtractedField, IncidentInfo]
 
 
 class ExtractIncidentInfoUseCase:
@@ -16,26 +52,387 @@ class ExtractIncidentInfoUseCase:
         text_preprocessor: TextPreprocessorInterface,
         json_parser: JsonParserInterface,
         text_postprocessor: TextPostprocessorInterface,
+        result_cache: Optional[ExtractionCacheInterface] = None,
+        prompt: Optional[ExtractionPrompt] = None,
+        fast_path_extractor: Optional[FastPathExtractorInterface] = None,
+        structured_output: bool = False,
+        micro_batcher: Optional[MicroBatchExtractor] = None,
+        text_chunker: Optional[TextChunkerInterface] = None,
+        max_chunk_concurrency: int = 4,
+        metrics: Optional[MetricsRecorderInterface] = None,
+        temporal_extractor: Optional[TemporalExtractorInterface] = None,
+        dateless_prompt: Optional[ExtractionPrompt] = None,
     ) -> None:
         self._llm_service = llm_service
         self._text_preprocessor = text_preprocessor
         self._json_parser = json_parser
         self._text_postprocessor = text_postprocessor
+        self._result_cache = result_cache
+        self._prompt = prompt or ExtractionPrompt.default()
+        self._fast_path_extractor = fast_path_extractor
+        self._structured_output = structured_output
+        self._micro_batcher = micro_batcher
+        self._text_chunker = text_chunker
+        self._max_chunk_concurrency = max_chunk_concurrency
+        self._metrics = metrics
+        self._temporal_extractor = temporal_extractor
+        self._dateless_prompt = dateless_prompt
+        self._streamed_generation = False
+        self._comparison_tasks: Set["asyncio.Task[None]"] = set()
 
-    async def execute(self, incident_text: IncidentText) -> IncidentInfo:
-        preprocessed_text = self._text_preprocessor.preprocess(incident_text.content)
+    def with_metrics(
+        self, metrics: MetricsRecorderInterface
+    ) -> "ExtractIncidentInfoUseCase":
+        # A shallow copy shares every collaborator, so a per-request recorder
+        # costs one object instead of a new pipeline.
+        use_case = copy.copy(self)
+        use_case._metrics = metrics
+        return use_case
 
-        prompt = ExtractionPrompt.default()
-        formatted_prompt = prompt.content.format(incident_text=preprocessed_text)
+    def with_streamed_generation(self) -> "ExtractIncidentInfoUseCase":
+        # Reading the generation token by token bounds the LLM client timeout
+        # per read instead of over the whole generation, for callers that can
+        # wait longer than a request. Micro-batches are never streamed.
+        use_case = copy.copy(self)
+        use_case._streamed_generation = True
+        use_case._micro_batcher = None
+        return use_case
 
-        llm_response = await self._llm_service.generate_response(formatted_prompt)
+    async def execute(
+        self,
+        incident_text: IncidentText,
+        cache_policy: CachePolicy = CachePolicy.USE,
+    ) -> IncidentInfo:
+        try:
+            return await self._execute(incident_text, cache_policy)
+        except Exception as e:
+            if self._metrics is not None:
+                self._metrics.count_error(type(e).__name__)
+            raise
 
+    async def execute_stream(
+        self,
+        incident_text: IncidentText,
+        cache_policy: CachePolicy = CachePolicy.USE,
+    ) -> AsyncGenerator[ExtractionEvent, None]:
         try:
-            extracted_data = self._json_parser.parse(llm_response)
+            async with aclosing(
+                self._execute_stream(incident_text, cache_policy)
+            ) as events:
+                async for event in events:
+                    yield event
+        except Exception as e:
+            if self._metrics is not None:
+                self._metrics.count_error(type(e).__name__)
+            raise
+
+    async def _execute(
+        self, incident_text: IncidentText, cache_policy: CachePolicy
+    ) -> IncidentInfo:
+        with self._stage("preprocess"):
+            preprocessed_text = self._text_preprocessor.preprocess(
+                incident_text.content, reference_time=incident_text.reference_time
+            )
+
+        reference_time = incident_text.reference_time
+        if self._text_chunker is not None:
+            windows = self._text_chunker.split(preprocessed_text)
+            if len(windows) > 1:
+                return await self._execute_windows(
+                    windows, cache_policy, reference_time
+                )
+
+        return await self._execute_text(preprocessed_text, cache_policy, reference_time)
+
+    async def _execute_stream(
+        self, incident_text: IncidentText, cache_policy: CachePolicy
+    ) -> AsyncGenerator[ExtractionEvent, None]:
+        with self._stage("preprocess"):
+            preprocessed_text = self._text_preprocessor.preprocess(
+                incident_text.content, reference_time=incident_text.reference_time
+            )
+
+        reference_time = incident_text.reference_time
+        emitted: Set[str] = set()
+
+        if self._text_chunker is not None:
+            windows = self._text_chunker.split(preprocessed_text)
+            if len(windows) > 1:
+                # Window results only mean something once merged, so the
+                # fields are all sent together at the end.
+                merged = await self._execute_windows(
+                    windows, cache_policy, reference_time
+                )
+                for event in self._field_events(merged, emitted):
+                    yield event
+                yield merged
+                return
+
+        occurred_at = self._occurred_at(preprocessed_text, reference_time)
+        if occurred_at is not None:
+            resolved_date = IncidentInfo(
+                data_ocorrencia=occurred_at, local="", tipo_incidente="", impacto=""
+            )
+            for event in self._field_events(
+                resolved_date, emitted, ["data_ocorrencia"]
+            ):
+                yield event
+
+        prompt = self._prompt_for(occurred_at)
+        incident_info, cache_key = self._lookup(preprocessed_text, cache_policy, prompt)
+
+        if incident_info is None:
+            response: List[str] = []
+            async with aclosing(
+                self._stream_fields(preprocessed_text, prompt, emitted, response)
+            ) as events:
+                async for event in events:
+                    yield event
+
+            incident_info = self._parse("".join(response))
+            if cache_key is not None and self._result_cache is not None:
+                self._result_cache.set(cache_key, incident_info)
+
+        if occurred_at is not None:
+            incident_info = dataclasses.replace(
+                incident_info, data_ocorrencia=occurred_at
+            )
+
+        # The final result may fill fields the partial reader could not
+        # decode, and those are sent before it.
+        for event in self._field_events(incident_info, emitted):
+            yield event
+        yield incident_info
+
+    async def _execute_windows(
+        self,
+        windows: List[str],
+        cache_policy: CachePolicy,
+        reference_time: Optional[datetime],
+    ) -> IncidentInfo:
+        semaphore = asyncio.Semaphore(self._max_chunk_concurrency)
+
+        async def extract_window(window: str) -> IncidentInfo:
+            async with semaphore:
+                return await self._execute_text(window, cache_policy, reference_time)
+
+        results = await asyncio.gather(
+            *[extract_window(window) for window in windows], return_exceptions=True
+        )
+
+        # A window with nothing the model can turn into JSON is skipped; any
+        # other failure (LLM down, overload) fails the whole request.
+        infos: List[IncidentInfo] = []
+        invalid_json: Optional[InvalidJsonResponseError] = None
+        for result in results:
+            if isinstance(result, InvalidJsonResponseError):
+                invalid_json = invalid_json or result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                infos.append(result)
+
+        if not infos and invalid_json is not None:
+            raise invalid_json
+
+        return IncidentInfo.merge(infos)
+
+    async def _execute_text(
+        self,
+        preprocessed_text: str,
+        cache_policy: CachePolicy,
+        reference_time: Optional[datetime],
+    ) -> IncidentInfo:
+        occurred_at = self._occurred_at(preprocessed_text, reference_time)
+        prompt = self._prompt_for(occurred_at)
+
+        incident_info = await self._resolve(preprocessed_text, cache_policy, prompt)
+        if occurred_at is None:
+            return incident_info
+        return dataclasses.replace(incident_info, data_ocorrencia=occurred_at)
+
+    def _occurred_at(
+        self, preprocessed_text: str, reference_time: Optional[datetime]
+    ) -> Optional[datetime]:
+        if self._temporal_extractor is None:
+            return None
+
+        with self._stage("temporal"):
+            return self._temporal_extractor.extract(preprocessed_text, reference_time)
+
+    def _prompt_for(self, occurred_at: Optional[datetime]) -> ExtractionPrompt:
+        # A date resolved from the text always wins over the model's, and the
+        # model is not asked for it when a prompt without the field exists.
+        if occurred_at is not None and self._dateless_prompt is not None:
+            return self._dateless_prompt
+        return self._prompt
+
+    async def _resolve(
+        self,
+        preprocessed_text: str,
+        cache_policy: CachePolicy,
+        prompt: ExtractionPrompt,
+    ) -> IncidentInfo:
+        incident_info, cache_key = self._lookup(preprocessed_text, cache_policy, prompt)
+        if incident_info is not None:
+            return incident_info
+
+        incident_info = await self._extract(preprocessed_text, prompt)
+        if cache_key is not None and self._result_cache is not None:
+            self._result_cache.set(cache_key, incident_info)
+
+        return incident_info
+
+    def _lookup(
+        self,
+        preprocessed_text: str,
+        cache_policy: CachePolicy,
+        prompt: ExtractionPrompt,
+    ) -> Tuple[Optional[IncidentInfo], Optional[str]]:
+        if self._fast_path_extractor is not None:
+            with self._stage("fast_path"):
+                fast_path_info = self._fast_path_extractor.extract(preprocessed_text)
+            if fast_path_info is not None:
+                if self._fast_path_extractor.should_compare():
+                    self._schedule_comparison(preprocessed_text, fast_path_info)
+                return fast_path_info, None
+
+        if self._result_cache is None or cache_policy is CachePolicy.BYPASS:
+            return None, None
+
+        cache_key = self._result_cache.build_key(preprocessed_text, prompt.version)
+
+        if cache_policy is CachePolicy.REFRESH:
+            self._result_cache.invalidate(cache_key)
+            return None, cache_key
+
+        return self._result_cache.get(cache_key), cache_key
+
+    async def _extract(
+        self, preprocessed_text: str, prompt: ExtractionPrompt
+    ) -> IncidentInfo:
+        if self._micro_batcher is not None:
+            with self._stage("micro_batch"):
+                batched_data = await self._micro_batcher.extract(preprocessed_text)
+            if batched_data is not None:
+                return self._build(batched_data)
+
+        with self._stage("prompt"):
+            formatted_prompt = prompt.content.format(incident_text=preprocessed_text)
+
+        with self._stage("llm"):
+            llm_response = await self._generate(formatted_prompt)
+
+        return self._parse(llm_response)
+
+    async def _generate(self, formatted_prompt: str) -> str:
+        if not self._streamed_generation:
+            return await self._llm_service.generate_response(formatted_prompt)
+
+        async with aclosing(
+            self._llm_service.stream_response(formatted_prompt)
+        ) as tokens:
+            return "".join([token async for token in tokens])
+
+    async def _stream_fields(
+        self,
+        preprocessed_text: str,
+        prompt: ExtractionPrompt,
+        emitted: Set[str],
+        response: List[str],
+    ) -> AsyncGenerator[ExtractedField, None]:
+        with self._stage("prompt"):
+            formatted_prompt = prompt.content.format(incident_text=preprocessed_text)
+
+        reader = self._json_parser.field_reader()
+        with self._stage("llm"):
+            async with aclosing(
+                self._llm_service.stream_response(formatted_prompt)
+            ) as tokens:
+                async for token in tokens:
+                    response.append(token)
+                    for key, value in reader.feed(token):
+                        for event in self._partial_field_events(key, value, emitted):
+                            yield event
+
+    def _partial_field_events(
+        self, key: str, value: Any, emitted: Set[str]
+    ) -> List[ExtractedField]:
+        # Each key is normalized on its own, so when the model repeats a field
+        # under two names the first one streamed is sent; the final result
+        # still follows the usual precedence.
+        normalized_data = self._text_postprocessor.normalize_field_names({key: value})
+        if not normalized_data:
+            return []
+
+        partial_info = self._text_postprocessor.build_incident_info(normalized_data)
+        return self._field_events(partial_info, emitted, normalized_data)
+
+    def _field_events(
+        self,
+        incident_info: IncidentInfo,
+        emitted: Set[str],
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[ExtractedField]:
+        values = incident_info.to_dict()
+        events: List[ExtractedField] = []
+        for name in values if fields is None else fields:
+            if name in values and name not in emitted:
+                emitted.add(name)
+                events.append(ExtractedField(name=name, value=values[name]))
+        return events
+
+    def _parse(self, llm_response: str) -> IncidentInfo:
+        try:
+            with self._stage("parse"):
+                if self._structured_output:
+                    extracted_data = self._json_parser.parse_structured(llm_response)
+                else:
+                    extracted_data = self._json_parser.parse(llm_response)
         except Exception as e:
             raise InvalidJsonResponseError(
                 f"LLM response: {llm_response[:200]}... | Error: {e}"
             )
 
-        normalized_data = self._text_postprocessor.normalize_field_names(extracted_data)
-        return self._text_postprocessor.build_incident_info(normalized_data)
+        return self._build(extracted_data)
+
+    def _build(self, extracted_data: Dict[str, Any]) -> IncidentInfo:
+        with self._stage("postprocess"):
+            normalized_data = self._text_postprocessor.normalize_field_names(
+                extracted_data
+            )
+            return self._text_postprocessor.build_incident_info(normalized_data)
+
+    @contextmanager
+    def _stage(self, stage: str) -> Iterator[None]:
+        if self._metrics is None:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._metrics.observe_stage(stage, time.perf_counter() - started)
+
+    def _schedule_comparison(
+        self, preprocessed_text: str, fast_path_info: IncidentInfo
+    ) -> None:
+        task = asyncio.create_task(
+            self._compare_with_llm(preprocessed_text, fast_path_info)
+        )
+        self._comparison_tasks.add(task)
+        task.add_done_callback(self._comparison_tasks.discard)
+
+    async def _compare_with_llm(
+        self, preprocessed_text: str, fast_path_info: IncidentInfo
+    ) -> None:
+        if self._fast_path_extractor is None:
+            return
+
+        try:
+            llm_info = await self._extract(preprocessed_text, self._prompt)
+        except Exception:
+            return
+
+        self._fast_path_extractor.record_comparison(fast_path_info, llm_info)
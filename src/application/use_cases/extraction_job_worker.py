@@ -0,0 +1,199 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional
+
+from ...domain.entities import IncidentText
+from ...domain.exceptions import IncidentExtractorError, ServiceOverloadedError
+from ..interfaces import Job, JobQueueInterface
+from .extract_incident_info import ExtractIncidentInfoUseCase
+
+UseCaseProvider = Callable[[], AsyncContextManager[ExtractIncidentInfoUseCase]]
+LoopErrorHandler = Callable[[str, Exception, float], None]
+
+
+class ExtractionJobWorkerPool:
+    def __init__(
+        self,
+        queue: JobQueueInterface,
+        use_case_provider: UseCaseProvider,
+        concurrency: int = 2,
+        max_attempts: int = 3,
+        retry_backoff: float = 2.0,
+        poll_interval: float = 1.0,
+        purge_interval: float = 60.0,
+        max_error_backoff: float = 30.0,
+        on_loop_error: Optional[LoopErrorHandler] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self._queue = queue
+        self._use_case_provider = use_case_provider
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._poll_interval = poll_interval
+        self._purge_interval = purge_interval
+        self._max_error_backoff = max_error_backoff
+        self._on_loop_error = on_loop_error
+        self._wakeup = asyncio.Event()
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._running = 0
+        self._active = False
+        self._counters = {
+            "recovered": 0,
+            "succeeded": 0,
+            "retried": 0,
+            "deferred": 0,
+            "failed": 0,
+            "purged": 0,
+            "loop_errors": 0,
+        }
+
+    def start(self) -> None:
+        if self._queue.acquire_worker_lock():
+            self._start_workers()
+        else:
+            # Another process runs this queue's workers; this one still
+            # accepts jobs and takes over if that process goes away.
+            self._tasks = [asyncio.create_task(self._standby())]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue.close()
+
+    def submit(self, text: str, reference_time: Optional[datetime]) -> Job:
+        job = self._queue.enqueue(text, reference_time)
+        self._wakeup.set()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._queue.get(job_id)
+
+    async def run_once(self) -> bool:
+        job = self._queue.claim()
+        if job is None:
+            return False
+
+        self._running += 1
+        try:
+            await self._process(job)
+        finally:
+            self._running -= 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._queue.stats(),
+            "active": self._active,
+            "workers": self._concurrency,
+            "busy_workers": self._running,
+            "processed": {**self._counters},
+        }
+
+    def _start_workers(self) -> None:
+        self._active = True
+        self._counters["recovered"] += self._queue.recover()
+        self._tasks.extend(
+            asyncio.create_task(self._work()) for _ in range(self._concurrency)
+        )
+        self._tasks.append(asyncio.create_task(self._purge()))
+
+    async def _standby(self) -> None:
+        while not self._queue.acquire_worker_lock():
+            await asyncio.sleep(self._poll_interval)
+        self._start_workers()
+
+    async def _work(self) -> None:
+        failures = 0
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                failures += 1
+                await self._back_off("work", e, failures)
+                continue
+
+            failures = 0
+            if claimed:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._idle_timeout())
+            except asyncio.TimeoutError:
+                pass
+
+    async def _purge(self) -> None:
+        failures = 0
+        while True:
+            try:
+                self._counters["purged"] += self._queue.purge_expired()
+            except Exception as e:
+                failures += 1
+                await self._back_off("purge", e, failures)
+                continue
+
+            failures = 0
+            await asyncio.sleep(self._purge_interval)
+
+    async def _back_off(self, loop: str, error: Exception, failures: int) -> None:
+        # A queue error such as a locked database must not end the loop: the
+        # task would die silently and the pool would still look active.
+        delay = min(self._poll_interval * 2 ** (failures - 1), self._max_error_backoff)
+        self._counters["loop_errors"] += 1
+        if self._on_loop_error is not None:
+            self._on_loop_error(loop, error, delay)
+        await asyncio.sleep(delay)
+
+    def _idle_timeout(self) -> float:
+        # A job waiting out a retry delay becomes ready without any submit, so
+        # the sleep never extends past its turn.
+        next_available_at = self._queue.next_available_at()
+        if next_available_at is None:
+            return self._poll_interval
+        return min(self._poll_interval, max(0.0, next_available_at - time.time()))
+
+    async def _process(self, job: Job) -> None:
+        try:
+            async with self._use_case_provider() as use_case:
+                incident_info = await use_case.execute(
+                    IncidentText(content=job.text, reference_time=job.reference_time)
+                )
+        except asyncio.CancelledError:
+            # Shutdown is not the job's fault, so the attempt is given back.
+            self._queue.release(job.id)
+            raise
+        except ServiceOverloadedError as e:
+            # The job never reached the model, so the attempt is given back;
+            # the job TTL still bounds how long it can keep being deferred.
+            self._queue.retry(
+                job.id,
+                type(e).__name__,
+                str(e),
+                float(e.retry_after),
+                count_attempt=False,
+            )
+            self._counters["deferred"] += 1
+        except IncidentExtractorError as e:
+            self._retry_or_fail(job, e, self._retry_backoff * 2 ** (job.attempts - 1))
+        except Exception as e:
+            self._queue.fail(job.id, type(e).__name__, str(e))
+            self._counters["failed"] += 1
+        else:
+            self._queue.complete(job.id, incident_info)
+            self._counters["succeeded"] += 1
+
+    def _retry_or_fail(self, job: Job, error: Exception, delay: float) -> None:
+        if job.attempts < self._max_attempts:
+            self._queue.retry(job.id, type(error).__name__, str(error), delay)
+            self._counters["retried"] += 1
+        else:
+            self._queue.fail(job.id, type(error).__name__, str(error))
+            self._counters["failed"] += 1
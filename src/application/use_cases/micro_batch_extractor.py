@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ...domain.value_objects import ExtractionPrompt
+from ..interfaces import JsonParserInterface, LLMServiceInterface
+
+_PendingItem = Tuple[str, "asyncio.Future[Optional[Dict[str, Any]]]"]
+
+
+class MicroBatchExtractor:
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        json_parser: JsonParserInterface,
+        prompt: Optional[ExtractionPrompt] = None,
+        max_batch_size: int = 8,
+        max_wait: float = 0.01,
+    ) -> None:
+        if max_batch_size < 2:
+            raise ValueError("max_batch_size must be at least 2")
+
+        self._llm_service = llm_service
+        self._json_parser = json_parser
+        self._prompt = prompt or ExtractionPrompt.default_batch()
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._pending: List[_PendingItem] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._counters = {"batches": 0, "batched_items": 0, "fallbacks": 0}
+
+    async def extract(self, preprocessed_text: str) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Optional[Dict[str, Any]]]" = loop.create_future()
+        self._pending.append((preprocessed_text, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._counters, "pending": len(self._pending)}
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        batch = [item for item in batch if not item[1].done()]
+
+        if len(batch) == 1:
+            # A lone item gains nothing from the batch prompt, so the caller
+            # runs the regular single-item extraction.
+            batch[0][1].set_result(None)
+            return
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[_PendingItem]) -> None:
+        incidents = "\n".join(
+            f"Incident {number}: {text}"
+            for number, (text, _) in enumerate(batch, start=1)
+        )
+        prompt = self._prompt.content.format(incidents=incidents)
+
+        try:
+            response = await self._llm_service.generate_response(prompt)
+        except Exception as e:
+            # A failing LLM would fail the single-item retries as well, so the
+            # error goes to every waiter instead of multiplying the load.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        results = self._split(response, len(batch))
+        if results is None:
+            self._counters["fallbacks"] += 1
+        else:
+            self._counters["batches"] += 1
+            self._counters["batched_items"] += len(batch)
+
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(None if results is None else results[index])
+
+    def _split(self, response: str, size: int) -> Optional[List[Dict[str, Any]]]:
+        try:
+            data = self._json_parser.parse(response)
+        except Exception:
+            return None
+
+        results = data.get("resultados")
+        if not isinstance(results, list) or len(results) != size:
+            return None
+        if not all(isinstance(result, dict) for result in results):
+            return None
+
+        return results
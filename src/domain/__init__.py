@@ -3,9 +3,10 @@ from .exceptions import (
     IncidentExtractorError,
     InvalidJsonResponseError,
     LLMServiceError,
+    ServiceOverloadedError,
     TextPreprocessingError,
 )
-from .value_objects import ExtractionPrompt, LLMResponse
+from .value_objects import ChatMessage, ExtractionPrompt, LLMResponse
 
 __all__ = [
     "IncidentInfo",
@@ -13,7 +14,9 @@ __all__ = [
     "IncidentExtractorError",
     "InvalidJsonResponseError",
     "LLMServiceError",
+    "ServiceOverloadedError",
     "TextPreprocessingError",
+    "ChatMessage",
     "ExtractionPrompt",
     "LLMResponse",
 ]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -21,3 +21,52 @@ class IncidentInfo:
             "tipo_incidente": self.tipo_incidente,
             "impacto": self.impacto,
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IncidentInfo":
+        data_ocorrencia = data.get("data_ocorrencia")
+
+        return cls(
+            data_ocorrencia=(
+                datetime.strptime(data_ocorrencia, "%Y-%m-%d %H:%M")
+                if data_ocorrencia
+                else None
+            ),
+            local=data["local"],
+            tipo_incidente=data["tipo_incidente"],
+            impacto=data["impacto"],
+        )
+
+    @classmethod
+    def merge(cls, infos: Sequence["IncidentInfo"]) -> "IncidentInfo":
+        if not infos:
+            raise ValueError("Cannot merge an empty list of incidents")
+
+        dates = [info.data_ocorrencia for info in infos if info.data_ocorrencia]
+        impacts = [info.impacto.strip() for info in infos if info.impacto.strip()]
+
+        return cls(
+            data_ocorrencia=min(dates) if dates else None,
+            local=_most_frequent(info.local for info in infos),
+            tipo_incidente=_most_frequent(info.tipo_incidente for info in infos),
+            impacto="; ".join(dict.fromkeys(impacts)),
+        )
+
+
+def _most_frequent(values: Iterable[str]) -> str:
+    counts: Dict[str, int] = {}
+    first_spelling: Dict[str, str] = {}
+
+    for value in values:
+        value = value.strip()
+        if not value:
+            continue
+        key = value.casefold()
+        counts[key] = counts.get(key, 0) + 1
+        first_spelling.setdefault(key, value)
+
+    if not counts:
+        return ""
+
+    # max() keeps the first key among ties, i.e. the earliest mention.
+    return first_spelling[max(counts, key=lambda key: counts[key])]
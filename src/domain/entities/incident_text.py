@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
 
 @dataclass(frozen=True)
 class IncidentText:
     content: str
+    reference_time: Optional[datetime] = None
 
     def __post_init__(self) -> None:
         if not self.content.strip():
@@ -12,3 +12,11 @@ class InvalidJsonResponseError(IncidentExtractorError):
 
 class TextPreprocessingError(IncidentExtractorError):
     """Error during text preprocessing"""
+
+
+class ServiceOverloadedError(IncidentExtractorError):
+    """LLM admission queue is full or the wait for a slot timed out"""
+
+    def __init__(self, message: str, retry_after: int = 1) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -1,4 +1,5 @@
+from .chat_message import ChatMessage
 from .extraction_prompt import ExtractionPrompt
 from .llm_response import LLMResponse
 
-__all__ = ["ExtractionPrompt", "LLMResponse"]
+__all__ = ["ChatMessage", "ExtractionPrompt", "LLMResponse"]
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
+from typing import Tuple
+
+from .chat_message import ChatMessage
 
 
 @dataclass(frozen=True)
 class ExtractionPrompt:
     content: str
+    version: str = "1"
+    prefix_messages: Tuple[ChatMessage, ...] = ()
 
     def __str__(self) -> str:
         return self.content
@@ -33,4 +38,96 @@ class ExtractionPrompt:
         JSON response:
         """
 
-        return cls(content=prompt)
+        return cls(content=prompt, version="1")
+
+    @classmethod
+    def default_without_date(cls) -> "ExtractionPrompt":
+        prompt = """
+        You are an incident analysis specialist. Extract the following information from the provided text and return ONLY a valid JSON with the requested fields:
+        - local: location where the incident occurred
+        - tipo_incidente: category or type of the incident
+        - impacto: brief description of the impact caused
+
+        Example of an incident:
+          2025-08-14 14:00, at the São Paulo office, there was a failure in the main server that affected the billing system for 2 hours.
+
+        Example of JSON response:
+        {{
+          "local": "São Paulo",
+          "tipo_incidente": "Server failure",
+          "impacto": "Billing system unavailable for 2 hours"
+        }}
+        
+        Based on this, process the below now
+        Incident text: {incident_text}
+        JSON response:
+        """
+
+        return cls(content=prompt, version="1-sem-data")
+
+    @classmethod
+    def default_batch(cls) -> "ExtractionPrompt":
+        prompt = """
+        You are an incident analysis specialist. Each numbered incident below is independent. For each one, extract the following information:
+        - data_ocorrencia: date and time of the incident in the format "YYYY-MM-DD HH:MM" (null if not mentioned)
+        - local: location where the incident occurred
+        - tipo_incidente: category or type of the incident
+        - impacto: brief description of the impact caused
+
+        Return ONLY a valid JSON object with a "resultados" array holding one object per incident, in the same order as the incidents.
+
+        Example of incidents:
+          Incident 1: 2025-08-14 14:00, at the São Paulo office, there was a failure in the main server that affected the billing system for 2 hours.
+          Incident 2: 2025-08-15 09:30, power outage at the Recife data center stopped the internal network for 30 minutes.
+
+        Example of JSON response:
+        {{
+          "resultados": [
+            {{
+              "data_ocorrencia": "2025-08-14 14:00",
+              "local": "São Paulo",
+              "tipo_incidente": "Server failure",
+              "impacto": "Billing system unavailable for 2 hours"
+            }},
+            {{
+              "data_ocorrencia": "2025-08-15 09:30",
+              "local": "Recife",
+              "tipo_incidente": "Power outage",
+              "impacto": "Internal network unavailable for 30 minutes"
+            }}
+          ]
+        }}
+
+        Based on this, process the below now
+        {incidents}
+        JSON response:
+        """
+
+        return cls(content=prompt, version="batch-1")
+
+    @classmethod
+    def default_chat(cls) -> "ExtractionPrompt":
+        system = """You are an incident analysis specialist. Extract the following information from the incident text sent by the user and return ONLY a valid JSON with the requested fields:
+- data_ocorrencia: date and time of the incident in the format "YYYY-MM-DD HH:MM" (null if not mentioned)
+- local: location where the incident occurred
+- tipo_incidente: category or type of the incident
+- impacto: brief description of the impact caused"""
+
+        example_incident = "Incident text: 2025-08-14 14:00, at the São Paulo office, there was a failure in the main server that affected the billing system for 2 hours."
+
+        example_response = """{
+  "data_ocorrencia": "2025-08-14 14:00",
+  "local": "São Paulo",
+  "tipo_incidente": "Server failure",
+  "impacto": "Billing system unavailable for 2 hours"
+}"""
+
+        return cls(
+            content="Incident text: {incident_text}",
+            version="chat-1",
+            prefix_messages=(
+                ChatMessage(role="system", content=system),
+                ChatMessage(role="user", content=example_incident),
+                ChatMessage(role="assistant", content=example_response),
+            ),
+        )
@@ -1,8 +1,14 @@
-from .models import OllamaService
+from .cache import ExtractionResultCache, SqliteCacheStore
+from .extractors import RuleBasedExtractor
+from .models import CoalescingLLMService, OllamaService
 from .parsers import JsonParser
 from .processors import TextPostprocessor, TextPreprocessor
 
 __all__ = [
+    "ExtractionResultCache",
+    "SqliteCacheStore",
+    "RuleBasedExtractor",
+    "CoalescingLLMService",
     "OllamaService",
     "JsonParser",
     "TextPostprocessor",
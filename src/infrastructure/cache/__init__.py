@@ -0,0 +1,4 @@
+from .extraction_cache import ExtractionResultCache
+from .sqlite_cache_store import SqliteCacheStore
+
+__all__ = ["ExtractionResultCache", "SqliteCacheStore"]
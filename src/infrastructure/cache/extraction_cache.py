@@ -0,0 +1,98 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ...application.interfaces import ExtractionCacheInterface
+from ...domain.entities import IncidentInfo
+from .sqlite_cache_store import SqliteCacheStore
+
+
+class ExtractionResultCache(ExtractionCacheInterface):
+    def __init__(
+        self,
+        model: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        store: Optional[SqliteCacheStore] = None,
+    ) -> None:
+        self._model = model
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._store = store
+        self._entries: "OrderedDict[str, Tuple[float, IncidentInfo]]" = OrderedDict()
+        self._counters = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    def build_key(self, preprocessed_text: str, prompt_version: str) -> str:
+        payload = json.dumps(
+            [self._model, prompt_version, preprocessed_text], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[IncidentInfo]:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expires_at, incident_info = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                self._counters["memory_hits"] += 1
+                return incident_info
+
+            del self._entries[key]
+            self._counters["expirations"] += 1
+
+        if self._store is not None:
+            stored = self._store.get(key)
+            if stored is not None:
+                self._remember(key, stored)
+                self._counters["hits"] += 1
+                self._counters["disk_hits"] += 1
+                return stored
+
+        self._counters["misses"] += 1
+        return None
+
+    def set(self, key: str, incident_info: IncidentInfo) -> None:
+        self._remember(key, incident_info)
+
+        if self._store is not None:
+            self._store.set(key, incident_info)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._counters["invalidations"] += 1
+
+        if self._store is not None:
+            self._store.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._counters,
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "persistent": self._store is not None,
+            "disk_purged": self._store.purged if self._store is not None else 0,
+        }
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+
+    def _remember(self, key: str, incident_info: IncidentInfo) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, incident_info)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
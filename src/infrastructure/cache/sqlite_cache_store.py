@@ -0,0 +1,81 @@
+import json
+import sqlite3
+import time
+from typing import Optional
+
+from ...domain.entities import IncidentInfo
+
+
+class SqliteCacheStore:
+    def __init__(
+        self, path: str, ttl_seconds: float, purge_every_sets: int = 500
+    ) -> None:
+        if purge_every_sets < 1:
+            raise ValueError("purge_every_sets must be at least 1")
+
+        self._ttl_seconds = ttl_seconds
+        self._purge_every_sets = purge_every_sets
+        self._sets_since_purge = 0
+        self._purged = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS extraction_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS extraction_cache_expiry "
+            "ON extraction_cache (expires_at)"
+        )
+        self._connection.commit()
+        self.purge_expired()
+
+    @property
+    def purged(self) -> int:
+        return self._purged
+
+    def get(self, key: str) -> Optional[IncidentInfo]:
+        row = self._connection.execute(
+            "SELECT value FROM extraction_cache WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return IncidentInfo.from_dict(json.loads(row[0]))
+
+    def set(self, key: str, incident_info: IncidentInfo) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO extraction_cache (key, value, expires_at) "
+            "VALUES (?, ?, ?)",
+            (
+                key,
+                json.dumps(incident_info.to_dict(), ensure_ascii=False),
+                time.time() + self._ttl_seconds,
+            ),
+        )
+        self._connection.commit()
+
+        # Keys that are never requested again would otherwise stay on disk
+        # forever, so expired rows are swept as the table grows.
+        self._sets_since_purge += 1
+        if self._sets_since_purge >= self._purge_every_sets:
+            self.purge_expired()
+
+    def delete(self, key: str) -> None:
+        self._connection.execute("DELETE FROM extraction_cache WHERE key = ?", (key,))
+        self._connection.commit()
+
+    def purge_expired(self) -> int:
+        cursor = self._connection.execute(
+            "DELETE FROM extraction_cache WHERE expires_at <= ?", (time.time(),)
+        )
+        self._connection.commit()
+        self._sets_since_purge = 0
+        self._purged += cursor.rowcount
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._connection.close()
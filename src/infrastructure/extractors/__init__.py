@@ -0,0 +1,3 @@
+from .rule_based_extractor import ExtractionRule, RuleBasedExtractor, default_rules
+
+__all__ = ["ExtractionRule", "RuleBasedExtractor", "default_rules"]
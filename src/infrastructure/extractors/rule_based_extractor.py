@@ -0,0 +1,256 @@
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern
+
+import structlog
+
+from ...application.interfaces import FastPathExtractorInterface
+from ...domain.entities import IncidentInfo
+
+logger = structlog.get_logger()
+
+INCIDENT_FIELDS = ("data_ocorrencia", "local", "tipo_incidente", "impacto")
+
+DEFAULT_LOCATIONS = [
+    "Acre", "Alagoas", "Amapá", "Amazonas", "Bahia", "Ceará", "Distrito Federal",
+    "Espírito Santo", "Goiás", "Maranhão", "Mato Grosso", "Mato Grosso do Sul",
+    "Minas Gerais", "Pará", "Paraíba", "Paraná", "Pernambuco", "Piauí",
+    "Rio de Janeiro", "Rio Grande do Norte", "Rio Grande do Sul", "Rondônia",
+    "Roraima", "Santa Catarina", "São Paulo", "Sergipe", "Tocantins",
+    "Aracaju", "Belém", "Belo Horizonte", "Boa Vista", "Brasília", "Campo Grande",
+    "Cuiabá", "Curitiba", "Florianópolis", "Fortaleza", "Goiânia", "João Pessoa",
+    "Macapá", "Maceió", "Manaus", "Natal", "Palmas", "Porto Alegre", "Porto Velho",
+    "Recife", "Rio Branco", "Salvador", "São Luís", "Teresina", "Vitória",
+]  # fmt: skip
+
+INCIDENT_KEYWORDS = (
+    "falha|queda|pane|interrupção|indisponibilidade|instabilidade|lentidão|"
+    "vazamento|incêndio|ataque|invasão|erro|problema"
+)
+
+
+@dataclass(frozen=True)
+class ExtractionRule:
+    name: str
+    field: str
+    pattern: Pattern[str]
+    confidence: float
+    convert: Callable[["re.Match[str]"], Any]
+
+
+def _iso_datetime(match: "re.Match[str]") -> Optional[datetime]:
+    try:
+        return datetime.strptime(
+            f"{match['date']} {match['hour'] or '0'}:{match['minute'] or '00'}",
+            "%Y-%m-%d %H:%M",
+        )
+    except ValueError:
+        return None
+
+
+def _br_datetime(match: "re.Match[str]") -> Optional[datetime]:
+    try:
+        return datetime(
+            int(match["year"]),
+            int(match["month"]),
+            int(match["day"]),
+            int(match["hour"] or 0),
+            int(match["minute"] or 0),
+        )
+    except ValueError:
+        return None
+
+
+def _sentence_value(match: "re.Match[str]") -> str:
+    value = match["value"].strip()
+    return value[:1].upper() + value[1:]
+
+
+def _plain_value(match: "re.Match[str]") -> str:
+    return match["value"].strip()
+
+
+def gazetteer_rule(
+    name: str, field: str, terms: Iterable[str], confidence: float
+) -> ExtractionRule:
+    alternation = "|".join(
+        re.escape(term) for term in sorted(terms, key=len, reverse=True)
+    )
+    return ExtractionRule(
+        name=name,
+        field=field,
+        pattern=re.compile(rf"\b(?P<value>{alternation})\b"),
+        confidence=confidence,
+        convert=_plain_value,
+    )
+
+
+def default_rules(locations: Iterable[str] = DEFAULT_LOCATIONS) -> List[ExtractionRule]:
+    return [
+        ExtractionRule(
+            name="iso_datetime",
+            field="data_ocorrencia",
+            pattern=re.compile(
+                r"\b(?P<date>\d{4}-\d{2}-\d{2}),?\s+(?:às\s+)?"
+                r"(?P<hour>\d{1,2}):(?P<minute>\d{2})\b"
+            ),
+            confidence=0.95,
+            convert=_iso_datetime,
+        ),
+        ExtractionRule(
+            name="br_datetime",
+            field="data_ocorrencia",
+            pattern=re.compile(
+                r"\b(?P<day>\d{1,2})/(?P<month>\d{1,2})/(?P<year>\d{4}),?\s+"
+                r"(?:às\s+)?(?P<hour>\d{1,2}):(?P<minute>\d{2})\b"
+            ),
+            confidence=0.9,
+            convert=_br_datetime,
+        ),
+        ExtractionRule(
+            name="iso_date",
+            field="data_ocorrencia",
+            pattern=re.compile(
+                r"\b(?P<date>\d{4}-\d{2}-\d{2})\b(?P<hour>)(?P<minute>)"
+            ),
+            confidence=0.7,
+            convert=_iso_datetime,
+        ),
+        ExtractionRule(
+            name="site_location",
+            field="local",
+            pattern=re.compile(
+                r"\b(?:[Nn][oa]|[Ee]m)\s+(?:escritório|filial|unidade|sede|agência|"
+                r"loja|fábrica|centro de distribuição|data ?center)\s+"
+                r"(?:de|do|da|em)\s+"
+                r"(?P<value>[A-ZÀ-Ý]\w*(?:\s+(?:d[aeo]s?\s+)?[A-ZÀ-Ý]\w*)*)"
+            ),
+            confidence=0.9,
+            convert=_plain_value,
+        ),
+        gazetteer_rule("known_location", "local", locations, confidence=0.8),
+        ExtractionRule(
+            name="houve_incident",
+            field="tipo_incidente",
+            pattern=re.compile(
+                rf"\bhouve\s+(?:uma?\s+)?(?P<value>(?:{INCIDENT_KEYWORDS})\b.*?)"
+                r"(?=\s+que\b|,|\.|$)",
+                re.IGNORECASE,
+            ),
+            confidence=0.9,
+            convert=_sentence_value,
+        ),
+        ExtractionRule(
+            name="incident_keyword",
+            field="tipo_incidente",
+            pattern=re.compile(
+                rf"\b(?P<value>(?:{INCIDENT_KEYWORDS})\s+(?:n[ao]s?|d[ao]s?|de|em)\s+"
+                r".*?)(?=\s+que\b|,|\.|$)",
+                re.IGNORECASE,
+            ),
+            confidence=0.7,
+            convert=_sentence_value,
+        ),
+        ExtractionRule(
+            name="que_impact",
+            field="impacto",
+            pattern=re.compile(
+                r"\bque\s+(?P<value>(?:afetou|afetaram|deixou|deixaram|impactou|"
+                r"impactaram|interrompeu|interromperam|derrubou|paralisou|causou|"
+                r"comprometeu)\b[^.]*)",
+                re.IGNORECASE,
+            ),
+            confidence=0.85,
+            convert=_sentence_value,
+        ),
+    ]
+
+
+class RuleBasedExtractor(FastPathExtractorInterface):
+    def __init__(
+        self,
+        rules: Optional[List[ExtractionRule]] = None,
+        min_confidence: float = 0.8,
+        sample_rate: float = 0.0,
+    ) -> None:
+        self._rules = rules if rules is not None else default_rules()
+        self._min_confidence = min_confidence
+        self._sample_rate = sample_rate
+        self._rule_hits: Counter[str] = Counter()
+        self._field_mismatches: Counter[str] = Counter()
+        self._counters = {
+            "attempts": 0,
+            "hits": 0,
+            "fallbacks": 0,
+            "comparisons": 0,
+            "mismatches": 0,
+        }
+
+    def extract(self, text: str) -> Optional[IncidentInfo]:
+        self._counters["attempts"] += 1
+
+        values: Dict[str, Any] = {}
+        confidences: Dict[str, float] = {}
+
+        for rule in self._rules:
+            if confidences.get(rule.field, 0.0) >= rule.confidence:
+                continue
+
+            match = rule.pattern.search(text)
+            if match is None:
+                continue
+
+            value = rule.convert(match)
+            if not value:
+                continue
+
+            self._rule_hits[rule.name] += 1
+            values[rule.field] = value
+            confidences[rule.field] = rule.confidence
+
+        if any(
+            confidences.get(field, 0.0) < self._min_confidence
+            for field in INCIDENT_FIELDS
+        ):
+            self._counters["fallbacks"] += 1
+            return None
+
+        self._counters["hits"] += 1
+        return IncidentInfo(**values)
+
+    def should_compare(self) -> bool:
+        return random.random() < self._sample_rate
+
+    def record_comparison(
+        self, fast_path_info: IncidentInfo, llm_info: IncidentInfo
+    ) -> None:
+        fast_path_data = fast_path_info.to_dict()
+        llm_data = llm_info.to_dict()
+
+        mismatched = [
+            field
+            for field in INCIDENT_FIELDS
+            if str(fast_path_data[field] or "").strip().lower()
+            != str(llm_data[field] or "").strip().lower()
+        ]
+
+        self._counters["comparisons"] += 1
+        if mismatched:
+            self._counters["mismatches"] += 1
+            self._field_mismatches.update(mismatched)
+            logger.info(
+                "Fast path result differs from LLM",
+                fields=mismatched,
+                fast_path=fast_path_data,
+                llm=llm_data,
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._counters,
+            "rule_hits": dict(self._rule_hits),
+            "field_mismatches": dict(self._field_mismatches),
+        }
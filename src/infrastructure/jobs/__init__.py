@@ -0,0 +1,3 @@
+from .sqlite_job_queue import SqliteJobQueue
+
+__all__ = ["SqliteJobQueue"]
@@ -0,0 +1,264 @@
+import fcntl
+import json
+import os
+import sqlite3
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ...application.interfaces import Job, JobQueueInterface, JobStatus
+from ...domain.entities import IncidentInfo
+
+_COLUMNS = (
+    "id, status, text, reference_time, attempts, created_at, updated_at, "
+    "result, error_type, error"
+)
+
+_FINISHED = (
+    JobStatus.SUCCEEDED.value,
+    JobStatus.FAILED.value,
+    JobStatus.EXPIRED.value,
+)
+
+
+class SqliteJobQueue(JobQueueInterface):
+    def __init__(self, path: str, ttl_seconds: float = 86400.0) -> None:
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._worker_lock: Optional[int] = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS extraction_jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, text TEXT NOT NULL, "
+            "reference_time TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+            "available_at REAL NOT NULL, expires_at REAL NOT NULL, "
+            "result TEXT, error_type TEXT, error TEXT)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS extraction_jobs_ready "
+            "ON extraction_jobs (status, available_at)"
+        )
+        self._connection.commit()
+
+    def enqueue(self, text: str, reference_time: Optional[datetime]) -> Job:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connection.execute(
+            "INSERT INTO extraction_jobs (id, status, text, reference_time, "
+            "created_at, updated_at, available_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                JobStatus.QUEUED.value,
+                text,
+                reference_time.isoformat() if reference_time else None,
+                now,
+                now,
+                now,
+                now + self._ttl_seconds,
+            ),
+        )
+        self._connection.commit()
+        return Job(
+            id=job_id,
+            status=JobStatus.QUEUED,
+            text=text,
+            reference_time=reference_time,
+            attempts=0,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._connection.execute(
+            f"SELECT {_COLUMNS} FROM extraction_jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._to_job(row) if row is not None else None
+
+    def acquire_worker_lock(self) -> bool:
+        # Several server processes can share one database file; only the one
+        # holding this lock runs jobs, so recover() never requeues a job that
+        # a live process is still working on.
+        if self._worker_lock is not None or self._path == ":memory:":
+            return True
+
+        fd = os.open(f"{self._path}.lock", os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self._worker_lock = fd
+        return True
+
+    def claim(self) -> Optional[Job]:
+        now = time.time()
+        # Select and update run back to back on the event loop thread, so no
+        # other worker can claim the same row in between.
+        row = self._connection.execute(
+            "SELECT id FROM extraction_jobs "
+            "WHERE status = ? AND available_at <= ? AND expires_at > ? "
+            "ORDER BY available_at, created_at LIMIT 1",
+            (JobStatus.QUEUED.value, now, now),
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, attempts = attempts + 1, "
+            "updated_at = ? WHERE id = ?",
+            (JobStatus.RUNNING.value, now, row[0]),
+        )
+        self._connection.commit()
+        return self.get(row[0])
+
+    def next_available_at(self) -> Optional[float]:
+        row = self._connection.execute(
+            "SELECT MIN(available_at) FROM extraction_jobs "
+            "WHERE status = ? AND expires_at > ?",
+            (JobStatus.QUEUED.value, time.time()),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def complete(self, job_id: str, result: IncidentInfo) -> None:
+        now = time.time()
+        self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, result = ?, error_type = NULL, "
+            "error = NULL, updated_at = ?, expires_at = ? WHERE id = ?",
+            (
+                JobStatus.SUCCEEDED.value,
+                json.dumps(result.to_dict(), ensure_ascii=False),
+                now,
+                now + self._ttl_seconds,
+                job_id,
+            ),
+        )
+        self._connection.commit()
+
+    def retry(
+        self,
+        job_id: str,
+        error_type: str,
+        error: str,
+        delay: float,
+        count_attempt: bool = True,
+    ) -> None:
+        now = time.time()
+        self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, error_type = ?, error = ?, "
+            "attempts = MAX(attempts - ?, 0), updated_at = ?, available_at = ? "
+            "WHERE id = ?",
+            (
+                JobStatus.QUEUED.value,
+                error_type,
+                error,
+                0 if count_attempt else 1,
+                now,
+                now + delay,
+                job_id,
+            ),
+        )
+        self._connection.commit()
+
+    def fail(self, job_id: str, error_type: str, error: str) -> None:
+        now = time.time()
+        self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, error_type = ?, error = ?, "
+            "updated_at = ?, expires_at = ? WHERE id = ?",
+            (
+                JobStatus.FAILED.value,
+                error_type,
+                error,
+                now,
+                now + self._ttl_seconds,
+                job_id,
+            ),
+        )
+        self._connection.commit()
+
+    def release(self, job_id: str) -> None:
+        self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, attempts = MAX(attempts - 1, 0), "
+            "updated_at = ? WHERE id = ? AND status = ?",
+            (JobStatus.QUEUED.value, time.time(), job_id, JobStatus.RUNNING.value),
+        )
+        self._connection.commit()
+
+    def recover(self) -> int:
+        # Jobs left running by a previous process keep the attempt they used,
+        # so a job that crashes the process still runs out of retries.
+        cursor = self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, updated_at = ? WHERE status = ?",
+            (JobStatus.QUEUED.value, time.time(), JobStatus.RUNNING.value),
+        )
+        self._connection.commit()
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        self._connection.execute(
+            "UPDATE extraction_jobs SET status = ?, updated_at = ?, expires_at = ? "
+            "WHERE status = ? AND expires_at <= ?",
+            (
+                JobStatus.EXPIRED.value,
+                now,
+                now + self._ttl_seconds,
+                JobStatus.QUEUED.value,
+                now,
+            ),
+        )
+        cursor = self._connection.execute(
+            "DELETE FROM extraction_jobs "
+            f"WHERE status IN ({', '.join('?' for _ in _FINISHED)}) "
+            "AND expires_at <= ?",
+            (*_FINISHED, now),
+        )
+        self._connection.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        counts = {status.value: 0 for status in JobStatus}
+        for status, count in self._connection.execute(
+            "SELECT status, COUNT(*) FROM extraction_jobs GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def close(self) -> None:
+        self._connection.close()
+        if self._worker_lock is not None:
+            os.close(self._worker_lock)
+            self._worker_lock = None
+
+    def _to_job(self, row: Tuple[Any, ...]) -> Job:
+        (
+            job_id,
+            status,
+            text,
+            reference_time,
+            attempts,
+            created_at,
+            updated_at,
+            result,
+            error_type,
+            error,
+        ) = row
+        return Job(
+            id=job_id,
+            status=JobStatus(status),
+            text=text,
+            reference_time=(
+                datetime.fromisoformat(reference_time) if reference_time else None
+            ),
+            attempts=attempts,
+            created_at=created_at,
+            updated_at=updated_at,
+            result=IncidentInfo.from_dict(json.loads(result)) if result else None,
+            error_type=error_type,
+            error=error,
+        )
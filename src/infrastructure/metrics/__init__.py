@@ -0,0 +1,11 @@
+from .pipeline_metrics import PipelineMetrics
+from .prometheus import Counter, Histogram, MetricsRegistry
+from .request_timings import RequestTimings
+
+__all__ = [
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "PipelineMetrics",
+    "RequestTimings",
+]
@@ -0,0 +1,70 @@
+from typing import Any, Dict
+
+from ...application.interfaces import MetricsRecorderInterface
+from .prometheus import MetricsRegistry
+
+_TOKEN_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+class PipelineMetrics(MetricsRecorderInterface):
+    def __init__(self) -> None:
+        self._registry = MetricsRegistry()
+        self.stage_duration = self._registry.histogram(
+            "incident_extractor_stage_duration_seconds",
+            "Time spent in each extraction pipeline stage",
+            ("stage",),
+        )
+        self.errors = self._registry.counter(
+            "incident_extractor_errors_total",
+            "Failed extractions by error class",
+            ("error_type",),
+        )
+        self.prompt_eval_tokens = self._registry.counter(
+            "ollama_prompt_eval_tokens_total",
+            "Prompt tokens evaluated by Ollama (prompt_eval_count)",
+        )
+        self.eval_tokens = self._registry.counter(
+            "ollama_eval_tokens_total",
+            "Tokens generated by Ollama (eval_count)",
+        )
+        self.prompt_tokens = self._registry.histogram(
+            "ollama_prompt_eval_count",
+            "Prompt tokens evaluated per Ollama request",
+            buckets=_TOKEN_BUCKETS,
+        )
+        self.eval_duration = self._registry.histogram(
+            "ollama_eval_duration_seconds",
+            "Generation time reported by Ollama (eval_duration)",
+        )
+        self.prompt_eval_duration = self._registry.histogram(
+            "ollama_prompt_eval_duration_seconds",
+            "Prompt evaluation time reported by Ollama (prompt_eval_duration)",
+        )
+        self.load_duration = self._registry.histogram(
+            "ollama_load_duration_seconds",
+            "Model load time reported by Ollama (load_duration)",
+        )
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self.stage_duration.observe(seconds, stage)
+
+    def count_error(self, error_type: str) -> None:
+        self.errors.inc(error_type)
+
+    def record_ollama(self, timings: Dict[str, Any]) -> None:
+        # Ollama reports durations in nanoseconds; fields are missing when a
+        # streamed generation stops before the final chunk.
+        if "prompt_eval_count" in timings:
+            self.prompt_eval_tokens.inc(amount=timings["prompt_eval_count"])
+            self.prompt_tokens.observe(timings["prompt_eval_count"])
+        if "eval_count" in timings:
+            self.eval_tokens.inc(amount=timings["eval_count"])
+        if "eval_duration" in timings:
+            self.eval_duration.observe(timings["eval_duration"] / 1e9)
+        if "prompt_eval_duration" in timings:
+            self.prompt_eval_duration.observe(timings["prompt_eval_duration"] / 1e9)
+        if "load_duration" in timings:
+            self.load_duration.observe(timings["load_duration"] / 1e9)
+
+    def render(self) -> str:
+        return self._registry.render()
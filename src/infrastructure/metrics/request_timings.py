@@ -0,0 +1,36 @@
+from typing import Dict, Optional
+
+from ...application.interfaces import MetricsRecorderInterface
+
+
+class RequestTimings(MetricsRecorderInterface):
+    def __init__(self, delegate: Optional[MetricsRecorderInterface] = None) -> None:
+        self._delegate = delegate
+        self._durations: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        return dict(self._durations)
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self._durations[stage] = self._durations.get(stage, 0.0) + seconds
+        self._counts[stage] = self._counts.get(stage, 0) + 1
+        if self._delegate is not None:
+            self._delegate.observe_stage(stage, seconds)
+
+    def count_error(self, error_type: str) -> None:
+        if self._delegate is not None:
+            self._delegate.count_error(error_type)
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        # Stages that ran more than once (long-text windows, batch items) are
+        # summed, with the number of runs in the description.
+        entries = [
+            f"{stage};dur={seconds * 1000:.2f}"
+            + (f';desc="{self._counts[stage]}x"' if self._counts[stage] > 1 else "")
+            for stage, seconds in self._durations.items()
+        ]
+        if total is not None:
+            entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
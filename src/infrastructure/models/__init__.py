@@ -1,3 +1,24 @@
+from .admission_controlled_llm_service import AdmissionControlledLLMService
+from .coalescing_llm_service import CoalescingLLMService
+from .host_concurrency_limited_llm_service import HostConcurrencyLimitedLLMService
+from .model_residency import OllamaModelResidency, parse_keep_alive
+from .ollama_backend_pool import (
+    OllamaBackend,
+    OllamaBackendConfig,
+    OllamaBackendPool,
+    parse_backend_configs,
+)
 from .ollama_service import OllamaService
 
-__all__ = ["OllamaService"]
+__all__ = [
+    "AdmissionControlledLLMService",
+    "CoalescingLLMService",
+    "HostConcurrencyLimitedLLMService",
+    "OllamaBackend",
+    "OllamaBackendConfig",
+    "OllamaBackendPool",
+    "OllamaModelResidency",
+    "OllamaService",
+    "parse_backend_configs",
+    "parse_keep_alive",
+]
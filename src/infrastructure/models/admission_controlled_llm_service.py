@@ -0,0 +1,148 @@
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Deque, Dict
+
+import structlog
+
+from ...application.interfaces import LLMServiceInterface
+from ...domain.exceptions import ServiceOverloadedError
+
+logger = structlog.get_logger()
+
+_SERVICE_TIME_SMOOTHING = 0.2
+
+
+class AdmissionControlledLLMService(LLMServiceInterface):
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        max_concurrency: int = 4,
+        max_queue_depth: int = 32,
+        queue_timeout: float = 20.0,
+    ) -> None:
+        self._llm_service = llm_service
+        self._max_concurrency = max_concurrency
+        self._max_queue_depth = max_queue_depth
+        self._queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._service_time = 1.0
+        self._counters = {"admitted": 0, "rejected": 0, "timed_out": 0}
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def saturated(self) -> bool:
+        return (
+            self._in_flight >= self._max_concurrency
+            and self.queue_depth >= self._max_queue_depth
+        )
+
+    def retry_after(self) -> int:
+        backlog = self.queue_depth + 1
+        return max(1, math.ceil(self._service_time * backlog / self._max_concurrency))
+
+    async def generate_response(self, prompt: str) -> str:
+        await self._admit()
+
+        started = time.monotonic()
+        try:
+            return await self._llm_service.generate_response(prompt)
+        finally:
+            self._record_service_time(time.monotonic() - started)
+            self._release()
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        await self._admit()
+
+        # The slot is held until the last token, as the generation keeps the
+        # backend busy for the whole stream.
+        started = time.monotonic()
+        try:
+            async with aclosing(self._llm_service.stream_response(prompt)) as tokens:
+                async for token in tokens:
+                    yield token
+        finally:
+            self._record_service_time(time.monotonic() - started)
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        admitted = self._counters["admitted"]
+        return {
+            **self._counters,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_concurrency": self._max_concurrency,
+            "max_queue_depth": self._max_queue_depth,
+            "saturated": self.saturated,
+            "avg_queue_wait_ms": (
+                round(self._queue_wait_total / admitted * 1000, 1) if admitted else 0.0
+            ),
+            "max_queue_wait_ms": round(self._queue_wait_max * 1000, 1),
+        }
+
+    async def _admit(self) -> None:
+        if self._in_flight < self._max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self._record_admission(0.0)
+            return
+
+        if self.queue_depth >= self._max_queue_depth:
+            self._counters["rejected"] += 1
+            logger.warning("LLM queue full, rejecting request", **self.stats())
+            raise ServiceOverloadedError(
+                "LLM request queue is full", retry_after=self.retry_after()
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self._queue_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            self._counters["timed_out"] += 1
+            logger.warning("Timed out waiting for LLM slot", **self.stats())
+            raise ServiceOverloadedError(
+                "Timed out waiting for an LLM slot", retry_after=self.retry_after()
+            )
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+        self._record_admission(time.monotonic() - started)
+
+    def _abandon(self, waiter: "asyncio.Future[None]") -> None:
+        if waiter.done() and not waiter.cancelled():
+            # The slot was handed over just before the waiter gave up.
+            self._release()
+        else:
+            waiter.cancel()
+            self._waiters.remove(waiter)
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot passes straight to the next waiter, so in_flight is
+                # unchanged and late arrivals cannot jump the queue.
+                waiter.set_result(None)
+                return
+
+        self._in_flight -= 1
+
+    def _record_admission(self, waited: float) -> None:
+        self._counters["admitted"] += 1
+        self._queue_wait_total += waited
+        self._queue_wait_max = max(self._queue_wait_max, waited)
+
+    def _record_service_time(self, elapsed: float) -> None:
+        self._service_time += _SERVICE_TIME_SMOOTHING * (elapsed - self._service_time)
@@ -0,0 +1,58 @@
+import asyncio
+from contextlib import aclosing
+from functools import partial
+from typing import Any, AsyncGenerator, Dict
+
+from ...application.interfaces import LLMServiceInterface
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Task[str]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class CoalescingLLMService(LLMServiceInterface):
+    def __init__(self, llm_service: LLMServiceInterface) -> None:
+        self._llm_service = llm_service
+        self._in_flight: Dict[str, _Flight] = {}
+        self._counters = {"calls": 0, "leaders": 0, "coalesced": 0}
+
+    async def generate_response(self, prompt: str) -> str:
+        self._counters["calls"] += 1
+
+        flight = self._in_flight.get(prompt)
+        if flight is None:
+            flight = _Flight(
+                asyncio.create_task(self._llm_service.generate_response(prompt))
+            )
+            self._in_flight[prompt] = flight
+            flight.task.add_done_callback(partial(self._on_done, prompt, flight))
+            self._counters["leaders"] += 1
+        else:
+            self._counters["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._forget(prompt, flight)
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        # Tokens go to a single consumer, so streams are never shared.
+        async with aclosing(self._llm_service.stream_response(prompt)) as tokens:
+            async for token in tokens:
+                yield token
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._counters, "in_flight": len(self._in_flight)}
+
+    def _on_done(self, prompt: str, flight: _Flight, _: "asyncio.Task[str]") -> None:
+        self._forget(prompt, flight)
+
+    def _forget(self, prompt: str, flight: _Flight) -> None:
+        if self._in_flight.get(prompt) is flight:
+            del self._in_flight[prompt]
@@ -0,0 +1,203 @@
+import asyncio
+import fcntl
+import json
+import math
+import os
+import time
+from contextlib import aclosing, asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Set
+
+import structlog
+
+from ...application.interfaces import LLMServiceInterface
+from ...domain.exceptions import ServiceOverloadedError
+
+logger = structlog.get_logger()
+
+_SERVICE_TIME_SMOOTHING = 0.2
+_HOLDER_RECORD_SIZE = 256
+
+
+class HostConcurrencyLimitedLLMService(LLMServiceInterface):
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        lock_dir: str,
+        max_concurrency: int = 4,
+        acquire_timeout: float = 20.0,
+        poll_interval: float = 0.01,
+        max_poll_interval: float = 0.1,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._llm_service = llm_service
+        self._max_concurrency = max_concurrency
+        self._acquire_timeout = acquire_timeout
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+
+        # One lock file per slot: flock is released by the kernel when the
+        # holding process exits, so a crashed worker never leaks a slot.
+        os.makedirs(lock_dir, exist_ok=True)
+        self._paths = [
+            os.path.join(lock_dir, f"slot-{slot}.lock")
+            for slot in range(max_concurrency)
+        ]
+        self._fds: Optional[List[int]] = [
+            os.open(path, os.O_RDWR | os.O_CREAT, 0o666) for path in self._paths
+        ]
+        self._held: Set[int] = set()
+        self._service_time = 1.0
+        self._counters = {"acquired": 0, "waited": 0, "timed_out": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self._service_time))
+
+    async def generate_response(self, prompt: str) -> str:
+        async with self._slot():
+            return await self._llm_service.generate_response(prompt)
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        async with self._slot():
+            async with aclosing(self._llm_service.stream_response(prompt)) as tokens:
+                async for token in tokens:
+                    yield token
+
+    def holders(self) -> List[Dict[str, Any]]:
+        if self._fds is None:
+            return []
+
+        now = time.time()
+        holders = []
+        for slot, path in enumerate(self._paths):
+            if slot not in self._held and not _locked_elsewhere(path):
+                continue
+
+            holder: Dict[str, Any] = {"slot": slot, "pid": None, "held_ms": None}
+            record = _read_record(self._fds[slot])
+            if record is not None:
+                holder["pid"] = record.get("pid")
+                acquired_at = record.get("acquired_at")
+                if isinstance(acquired_at, (int, float)):
+                    holder["held_ms"] = round((now - acquired_at) * 1000, 1)
+            holders.append(holder)
+        return holders
+
+    def stats(self) -> Dict[str, Any]:
+        acquired = self._counters["acquired"]
+        holders = self.holders()
+        return {
+            **self._counters,
+            "max_concurrency": self._max_concurrency,
+            "in_flight": len(holders),
+            "in_flight_local": len(self._held),
+            "holders": holders,
+            "avg_wait_ms": (
+                round(self._wait_total / acquired * 1000, 1) if acquired else 0.0
+            ),
+            "max_wait_ms": round(self._wait_max * 1000, 1),
+        }
+
+    def close(self) -> None:
+        if self._fds is None:
+            return
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = None
+        self._held.clear()
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        started = time.monotonic()
+        slot = self._try_acquire()
+
+        if slot is None:
+            # Other processes give no wakeup signal, so the wait is a poll with
+            # a short, growing interval.
+            self._counters["waited"] += 1
+            deadline = started + self._acquire_timeout
+            delay = self._poll_interval
+            while slot is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timed_out"] += 1
+                    logger.warning(
+                        "Timed out waiting for host-wide LLM slot",
+                        max_concurrency=self._max_concurrency,
+                        in_flight_local=len(self._held),
+                    )
+                    raise ServiceOverloadedError(
+                        "Timed out waiting for a host-wide LLM slot",
+                        retry_after=self.retry_after(),
+                    )
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, self._max_poll_interval)
+                slot = self._try_acquire()
+
+        waited = time.monotonic() - started
+        self._counters["acquired"] += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+
+        acquired_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(slot)
+            elapsed = time.monotonic() - acquired_at
+            self._service_time += _SERVICE_TIME_SMOOTHING * (
+                elapsed - self._service_time
+            )
+
+    def _try_acquire(self) -> Optional[int]:
+        if self._fds is None:
+            raise RuntimeError("Host concurrency limiter is closed")
+
+        for slot, fd in enumerate(self._fds):
+            # flock belongs to the open file, so a slot this process already
+            # holds would be granted again; it has to be skipped here.
+            if slot in self._held:
+                continue
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+
+            self._held.add(slot)
+            record = json.dumps({"pid": os.getpid(), "acquired_at": time.time()})
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, record.encode(), 0)
+            return slot
+
+        return None
+
+    def _release(self, slot: int) -> None:
+        self._held.discard(slot)
+        if self._fds is None:
+            return
+        os.ftruncate(self._fds[slot], 0)
+        fcntl.flock(self._fds[slot], fcntl.LOCK_UN)
+
+
+def _locked_elsewhere(path: str) -> bool:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return False
+    finally:
+        os.close(fd)
+
+
+def _read_record(fd: int) -> Optional[Dict[str, Any]]:
+    try:
+        record = json.loads(os.pread(fd, _HOLDER_RECORD_SIZE, 0))
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
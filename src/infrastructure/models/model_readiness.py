@@ -0,0 +1,131 @@
+import asyncio
+import time
+from typing import Any, Optional, Set
+
+import httpx
+import structlog
+
+from ...domain.exceptions import LLMServiceError
+
+logger = structlog.get_logger()
+
+
+class OllamaModelReadiness:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        model: str,
+        ttl_seconds: float = 300.0,
+        pull_timeout: float = 1800.0,
+    ) -> None:
+        self._client = client
+        self._base_url = base_url.rstrip("/")
+        self._model = model
+        self._ttl_seconds = ttl_seconds
+        self._pull_timeout = pull_timeout
+        self._ready = False
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self._pull_task: Optional["asyncio.Task[None]"] = None
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready and (time.monotonic() - self._checked_at) < self._ttl_seconds
+
+    @property
+    def is_pulling(self) -> bool:
+        return self._pull_task is not None and not self._pull_task.done()
+
+    async def ensure_ready(self) -> None:
+        if self.is_ready:
+            return
+
+        async with self._lock:
+            if self.is_ready:
+                return
+
+            if self.is_pulling:
+                raise LLMServiceError(
+                    f"Model {self._model} is being downloaded, try again later"
+                )
+
+            try:
+                available = await self._is_model_available()
+            except Exception as e:
+                logger.error("Failed to ensure model is ready", error=str(e))
+                raise LLMServiceError(f"Model preparation failed: {e}") from e
+
+            if available:
+                self._mark_ready()
+                return
+
+            self._start_pull()
+            raise LLMServiceError(
+                f"Model {self._model} is not available, download started"
+            )
+
+    async def warmup(self) -> None:
+        try:
+            await self.ensure_ready()
+            logger.info("Model ready", model=self._model)
+        except LLMServiceError as e:
+            logger.warning("Model not ready", model=self._model, error=str(e))
+
+    def mark_missing(self) -> None:
+        self._ready = False
+        logger.warning("Ollama reported model missing", model=self._model)
+
+        task = asyncio.create_task(self.warmup())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def close(self) -> None:
+        tasks = list(self._background_tasks)
+        if self._pull_task is not None:
+            tasks.append(self._pull_task)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _is_model_available(self) -> bool:
+        response = await self._client.get(f"{self._base_url}/api/tags")
+        response.raise_for_status()
+
+        return is_model_listed(response.json(), self._model)
+
+    def _mark_ready(self) -> None:
+        self._ready = True
+        self._checked_at = time.monotonic()
+
+    def _start_pull(self) -> None:
+        if self.is_pulling:
+            return
+
+        self._ready = False
+        self._pull_task = asyncio.create_task(self._pull_model())
+
+    async def _pull_model(self) -> None:
+        try:
+            logger.info("Downloading model", model=self._model)
+            response = await self._client.post(
+                f"{self._base_url}/api/pull",
+                json={"name": self._model, "stream": False},
+                timeout=self._pull_timeout,
+            )
+            response.raise_for_status()
+            self._mark_ready()
+            logger.info("Model downloaded successfully", model=self._model)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Failed to download model", model=self._model, error=str(e))
+
+
+def is_model_listed(tags: Any, model: str) -> bool:
+    if not isinstance(tags, dict):
+        return False
+    names = [entry.get("name", "") for entry in tags.get("models", [])]
+    return any(model in name for name in names)
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
+
+import structlog
+
+from .ollama_backend_pool import OllamaBackend
+
+logger = structlog.get_logger()
+
+KeepAlive = Union[str, int]
+
+OLLAMA_TIMING_FIELDS = (
+    "total_duration",
+    "load_duration",
+    "prompt_eval_count",
+    "prompt_eval_duration",
+    "eval_count",
+    "eval_duration",
+)
+
+
+def parse_keep_alive(value: Optional[str]) -> Optional[KeepAlive]:
+    if value is None or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+class OllamaModelResidency:
+    def __init__(
+        self,
+        model: str,
+        keep_alive: Optional[KeepAlive] = None,
+        keep_warm_interval: float = 0.0,
+        cold_start_threshold: float = 0.5,
+    ) -> None:
+        self._model = model
+        self._keep_alive = keep_alive
+        self._keep_warm_interval = keep_warm_interval
+        self._cold_start_threshold = cold_start_threshold
+        self._last_used: Dict[str, float] = {}
+        self._keep_warm_task: Optional["asyncio.Task[None]"] = None
+        self._pings: Set["asyncio.Task[None]"] = set()
+        self._counters = {
+            "preloads": 0,
+            "keep_warm_pings": 0,
+            "cold_starts": 0,
+            "warm_requests": 0,
+            "unknown_load": 0,
+        }
+        self._latency_totals = {"cold": 0.0, "warm": 0.0}
+        self._load_duration_total = 0.0
+
+    @property
+    def keep_alive(self) -> Optional[KeepAlive]:
+        return self._keep_alive
+
+    def apply(self, payload: Dict[str, Any]) -> None:
+        if self._keep_alive is not None:
+            payload["keep_alive"] = self._keep_alive
+
+    def mark_used(self, backend: OllamaBackend) -> None:
+        self._last_used[backend.base_url] = time.monotonic()
+
+    def record(self, timings: Dict[str, Any], latency: float) -> None:
+        load_duration = timings.get("load_duration")
+        if load_duration is None:
+            # Streaming generations that stop early never read the final chunk.
+            self._counters["unknown_load"] += 1
+            return
+
+        load_seconds = load_duration / 1e9
+        self._load_duration_total += load_seconds
+        kind = "cold" if load_seconds >= self._cold_start_threshold else "warm"
+        self._counters["cold_starts" if kind == "cold" else "warm_requests"] += 1
+        self._latency_totals[kind] += latency
+
+        if kind == "cold":
+            logger.info(
+                "Model loaded during request",
+                model=self._model,
+                load_duration_ms=round(load_seconds * 1000, 1),
+            )
+
+    async def preload(self, backends: Sequence[OllamaBackend]) -> None:
+        await asyncio.gather(*[self._load(backend, "preload") for backend in backends])
+
+    def start(self, backends: Sequence[OllamaBackend]) -> None:
+        if self._keep_warm_interval <= 0:
+            return
+        if self._keep_warm_task is None or self._keep_warm_task.done():
+            self._keep_warm_task = asyncio.create_task(
+                self._keep_warm_loop(list(backends))
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        cold = self._counters["cold_starts"]
+        warm = self._counters["warm_requests"]
+        return {
+            "keep_alive": self._keep_alive,
+            "keep_warm_interval_seconds": self._keep_warm_interval,
+            **self._counters,
+            "avg_cold_latency_ms": _average_ms(self._latency_totals["cold"], cold),
+            "avg_warm_latency_ms": _average_ms(self._latency_totals["warm"], warm),
+            "avg_load_duration_ms": _average_ms(self._load_duration_total, cold + warm),
+        }
+
+    async def close(self) -> None:
+        tasks: List["asyncio.Task[None]"] = list(self._pings)
+        if self._keep_warm_task is not None:
+            tasks.append(self._keep_warm_task)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _keep_warm_loop(self, backends: List[OllamaBackend]) -> None:
+        while True:
+            await asyncio.sleep(self._keep_warm_interval)
+            now = time.monotonic()
+
+            for backend in backends:
+                idle = now - self._last_used.get(backend.base_url, 0.0)
+                if backend.healthy and idle >= self._keep_warm_interval:
+                    task = asyncio.create_task(self._load(backend, "keep_warm"))
+                    self._pings.add(task)
+                    task.add_done_callback(self._pings.discard)
+
+    async def _load(self, backend: OllamaBackend, reason: str) -> None:
+        # A generate call without a prompt only loads the model and refreshes
+        # its keep_alive timer.
+        payload: Dict[str, Any] = {"model": self._model, "stream": False}
+        self.apply(payload)
+
+        try:
+            response = await backend.client.post(
+                f"{backend.base_url}/api/generate", json=payload
+            )
+            response.raise_for_status()
+            load_duration = response.json().get("load_duration", 0) / 1e9
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Failed to load model",
+                url=backend.base_url,
+                model=self._model,
+                error=str(e),
+            )
+            return
+
+        self._counters["preloads" if reason == "preload" else "keep_warm_pings"] += 1
+        self.mark_used(backend)
+        logger.info(
+            "Model loaded",
+            url=backend.base_url,
+            model=self._model,
+            reason=reason,
+            load_duration_ms=round(load_duration * 1000, 1),
+        )
+
+
+def _average_ms(total: float, count: int) -> Optional[float]:
+    return round(total / count * 1000, 1) if count else None
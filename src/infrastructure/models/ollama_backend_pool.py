@@ -0,0 +1,271 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import httpx
+import structlog
+
+from .model_readiness import is_model_listed
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class OllamaBackendConfig:
+    base_url: str
+    max_in_flight: int = 4
+    max_connections: int = 10
+
+
+def parse_backend_configs(
+    spec: str, max_in_flight: int = 4, max_connections: int = 10
+) -> List[OllamaBackendConfig]:
+    configs: List[OllamaBackendConfig] = []
+
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+
+        url, *options = [part.strip() for part in entry.split(";")]
+        settings = {"max_in_flight": max_in_flight, "max_connections": max_connections}
+        for option in options:
+            name, _, value = option.partition("=")
+            if name not in settings:
+                raise ValueError(f"Unknown backend option: {name}")
+            settings[name] = int(value)
+
+        configs.append(OllamaBackendConfig(base_url=url.rstrip("/"), **settings))
+
+    if not configs:
+        raise ValueError("At least one Ollama backend is required")
+
+    return configs
+
+
+class OllamaBackend:
+    def __init__(
+        self,
+        base_url: str,
+        max_in_flight: int = 4,
+        max_connections: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.max_in_flight = max_in_flight
+        self.client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self.healthy = True
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self._counters = {"requests": 0, "errors": 0, "ejections": 0}
+        self._latency_total = 0.0
+        self._last_latency = 0.0
+
+    @classmethod
+    def from_config(
+        cls, config: OllamaBackendConfig, timeout: float = 30.0
+    ) -> "OllamaBackend":
+        return cls(
+            base_url=config.base_url,
+            max_in_flight=config.max_in_flight,
+            max_connections=config.max_connections,
+            timeout=timeout,
+        )
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.outstanding < self.max_in_flight
+
+    def record(self, latency: float, failed: bool) -> None:
+        self._counters["requests"] += 1
+        self._latency_total += latency
+        self._last_latency = latency
+        if failed:
+            self._counters["errors"] += 1
+            self.consecutive_failures += 1
+        else:
+            self.consecutive_failures = 0
+
+    def eject(self, reason: str) -> None:
+        if not self.healthy:
+            return
+        self.healthy = False
+        self._counters["ejections"] += 1
+        logger.warning("Ejecting Ollama backend", url=self.base_url, reason=reason)
+
+    def readmit(self) -> None:
+        if self.healthy:
+            return
+        self.healthy = True
+        self.consecutive_failures = 0
+        logger.info("Readmitting Ollama backend", url=self.base_url)
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self._counters["requests"]
+        return {
+            "url": self.base_url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "max_in_flight": self.max_in_flight,
+            **self._counters,
+            "avg_latency_ms": (
+                round(self._latency_total / requests * 1000, 1) if requests else None
+            ),
+            "last_latency_ms": (
+                round(self._last_latency * 1000, 1) if requests else None
+            ),
+        }
+
+
+class OllamaBackendPool:
+    def __init__(
+        self,
+        backends: Sequence[OllamaBackend],
+        health_check_interval: float = 10.0,
+        health_check_timeout: float = 2.0,
+        failure_threshold: int = 3,
+        model: Optional[str] = None,
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one Ollama backend is required")
+
+        self._backends = list(backends)
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._failure_threshold = failure_threshold
+        self._model = model
+        self._waiters: List["asyncio.Future[None]"] = []
+        self._next_index = 0
+        self._health_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def backends(self) -> List[OllamaBackend]:
+        return list(self._backends)
+
+    def start(self) -> None:
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[OllamaBackend]:
+        backend = await self._acquire()
+        started = time.monotonic()
+        failed = False
+
+        try:
+            yield backend
+        except BaseException as e:
+            failed = is_backend_failure(e)
+            raise
+        finally:
+            backend.record(time.monotonic() - started, failed)
+            if failed and backend.consecutive_failures >= self._failure_threshold:
+                backend.eject(f"{backend.consecutive_failures} consecutive failures")
+            backend.outstanding -= 1
+            self._wake_waiters()
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*[self._check_backend(b) for b in self._backends])
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [backend.stats() for backend in self._backends]
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+
+        for backend in self._backends:
+            await backend.client.aclose()
+
+    async def _acquire(self) -> OllamaBackend:
+        while True:
+            backend = self._pick()
+            if backend is not None:
+                backend.outstanding += 1
+                return backend
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _wake_waiters(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _pick(self) -> Optional[OllamaBackend]:
+        candidates = [b for b in self._backends if b.healthy]
+        if not candidates:
+            # With every backend ejected, keep routing instead of failing every
+            # request until the next health check.
+            candidates = self._backends
+
+        # Rotating the start index spreads ties instead of always favouring the
+        # first backend in the list.
+        count = len(self._backends)
+        start = self._next_index
+        self._next_index = (start + 1) % count
+        ordered = sorted(
+            candidates,
+            key=lambda b: (b.outstanding, (self._backends.index(b) - start) % count),
+        )
+
+        for backend in ordered:
+            if backend.has_capacity:
+                return backend
+        return None
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            await self.check_health()
+
+    async def _check_backend(self, backend: OllamaBackend) -> None:
+        try:
+            response = await backend.client.get(
+                f"{backend.base_url}/api/tags", timeout=self._health_check_timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            backend.eject(f"health check failed: {e}")
+            return
+
+        if not backend.healthy:
+            # A backend ejected for lacking the model answers /api/tags just
+            # fine; it only returns once the model shows up in the listing.
+            if self._model is not None and not _lists_model(response, self._model):
+                return
+            backend.readmit()
+            self._wake_waiters()
+
+
+def is_backend_failure(error: BaseException) -> bool:
+    cause: Optional[BaseException] = error
+    while cause is not None:
+        if isinstance(cause, httpx.TransportError):
+            return True
+        if isinstance(cause, httpx.HTTPStatusError):
+            return cause.response.status_code >= 500
+        cause = cause.__cause__
+    return False
+
+
+def _lists_model(response: httpx.Response, model: str) -> bool:
+    try:
+        return is_model_listed(response.json(), model)
+    except ValueError:
+        return False
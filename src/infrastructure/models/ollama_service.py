@@ -1,88 +1,295 @@
+import asyncio
 import json
-from typing import cast
+import time
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 import httpx
 import structlog
 
 from ...application.interfaces import LLMServiceInterface
 from ...domain.exceptions import LLMServiceError
+from ...domain.value_objects import ChatMessage
+from ..metrics import PipelineMetrics
+from ..parsers import JsonObjectScanner
+from .model_readiness import OllamaModelReadiness
+from .model_residency import OLLAMA_TIMING_FIELDS, OllamaModelResidency
+from .ollama_backend_pool import OllamaBackend, OllamaBackendPool
 
 logger = structlog.get_logger()
 
 
 class OllamaService(LLMServiceInterface):
     def __init__(
-        self, base_url: str = "http://localhost:11434", model: str = "tinyllama"
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "tinyllama",
+        readiness_ttl: float = 300.0,
+        client: Optional[httpx.AsyncClient] = None,
+        stream: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None,
+        pool: Optional[OllamaBackendPool] = None,
+        residency: Optional[OllamaModelResidency] = None,
+        chat_prefix: Optional[Sequence[ChatMessage]] = None,
+        metrics: Optional[PipelineMetrics] = None,
     ) -> None:
-        self._base_url = base_url.rstrip("/")
         self._model = model
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._stream = stream
+        self._response_schema = response_schema
+        self._pool = pool or OllamaBackendPool(
+            [OllamaBackend(base_url, client=client or httpx.AsyncClient(timeout=30.0))]
+        )
+        self._readiness: Dict[OllamaBackend, OllamaModelReadiness] = {
+            backend: OllamaModelReadiness(
+                client=backend.client,
+                base_url=backend.base_url,
+                model=self._model,
+                ttl_seconds=readiness_ttl,
+            )
+            for backend in self._pool.backends
+        }
+        self._residency = residency or OllamaModelResidency(model)
+        self._chat_prefix: Optional[List[Dict[str, str]]] = (
+            [{"role": m.role, "content": m.content} for m in chat_prefix]
+            if chat_prefix is not None
+            else None
+        )
+        self._metrics = metrics
 
-    async def _ensure_model_ready(self) -> None:
-        try:
-            list_url = f"{self._base_url}/api/tags"
-            response = await self._client.get(list_url)
-            response.raise_for_status()
+    async def warmup(self) -> None:
+        await asyncio.gather(*[r.warmup() for r in self._readiness.values()])
+        self._pool.start()
+        self._residency.start(self._pool.backends)
 
-            models_data = response.json()
-            available_models = [
-                model["name"] for model in models_data.get("models", [])
-            ]
+    async def preload(self) -> None:
+        ready = [b for b, r in self._readiness.items() if r.is_ready]
+        await self._residency.preload(ready)
+
+    async def generate_response(self, prompt: str) -> str:
+        async with self._ready_lease() as (backend, readiness):
+            return await self._generate_on(backend, readiness, prompt)
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        async with self._ready_lease() as (backend, readiness):
+            url, payload = self._payload(backend, prompt, stream=True)
+            with self._translate_errors(readiness):
+                logger.info("Streaming request to Ollama", model=self._model, url=url)
+
+                self._residency.mark_used(backend)
+                started = time.monotonic()
+                scanner = JsonObjectScanner()
+                timings: Dict[str, Any] = {}
+
+                async with aclosing(
+                    self._chunks(backend.client, url, payload)
+                ) as chunks:
+                    async for chunk in chunks:
+                        token = _content(chunk) or ""
+                        if token:
+                            yield token
+
+                        if scanner.feed(token):
+                            logger.debug("JSON object closed, stopping generation")
+                            break
+                        if chunk.get("done"):
+                            timings = _timings(chunk)
+                            break
+
+                self._residency.record(timings, time.monotonic() - started)
+                if self._metrics is not None:
+                    self._metrics.record_ollama(timings)
 
-            if any(self._model in model for model in available_models):
-                return
+    @asynccontextmanager
+    async def _ready_lease(
+        self,
+    ) -> AsyncIterator[Tuple[OllamaBackend, OllamaModelReadiness]]:
+        tried: Set[OllamaBackend] = set()
+        while True:
+            async with self._pool.lease() as backend:
+                readiness = self._readiness[backend]
+                try:
+                    await readiness.ensure_ready()
+                except LLMServiceError as e:
+                    # With every backend ejected the pool hands out ejected
+                    # ones again, so a repeat also means nothing is left.
+                    repeated = backend in tried
+                    tried.add(backend)
+                    if len(self._readiness) > 1:
+                        # A backend without the model is taken out of rotation
+                        # until the health check sees the model listed, and
+                        # the request moves to another one.
+                        backend.eject(f"model not ready: {e}")
+                    if repeated or len(tried) == len(self._readiness):
+                        raise
+                else:
+                    yield backend, readiness
+                    return
 
-            logger.info("Downloading model", model=self._model)
-            pull_url = f"{self._base_url}/api/pull"
-            pull_response = await self._client.post(
-                pull_url, json={"name": self._model}
+    async def _generate_on(
+        self, backend: OllamaBackend, readiness: OllamaModelReadiness, prompt: str
+    ) -> str:
+        url, payload = self._payload(backend, prompt, stream=self._stream)
+
+        with self._translate_errors(readiness):
+            logger.info(
+                "Sending request to Ollama",
+                model=self._model,
+                url=url,
+                stream=self._stream,
             )
-            pull_response.raise_for_status()
-            logger.info("Model downloaded successfully", model=self._model)
 
-        except Exception as e:
-            logger.error("Failed to ensure model is ready", error=str(e))
-            raise LLMServiceError(f"Model preparation failed: {e}")
+            self._residency.mark_used(backend)
+            started = time.monotonic()
 
-    async def generate_response(self, prompt: str) -> str:
-        await self._ensure_model_ready()
-        url = f"{self._base_url}/api/generate"
+            if self._stream:
+                content, timings = await self._generate_streaming(
+                    backend.client, url, payload
+                )
+            else:
+                content, timings = await self._generate(backend.client, url, payload)
+
+            self._residency.record(timings, time.monotonic() - started)
+            if self._metrics is not None:
+                self._metrics.record_ollama(timings)
+
+            logger.info("Received response from Ollama", content_length=len(content))
 
-        payload = {
+            return content
+
+    def _payload(
+        self, backend: OllamaBackend, prompt: str, stream: bool
+    ) -> Tuple[str, Dict[str, Any]]:
+        payload: Dict[str, Any] = {
             "model": self._model,
-            "prompt": prompt,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": 0.1,
                 "top_p": 0.9,
             },
         }
 
-        try:
-            logger.info("Sending request to Ollama", model=self._model, url=url)
-
-            response = await self._client.post(url, json=payload)
-            response.raise_for_status()
-
-            response_data = response.json()
-
-            if "response" not in response_data:
-                raise LLMServiceError("Invalid response format from Ollama")
+        if self._chat_prefix is not None:
+            # The system message and few-shot turns are identical on every call,
+            # so the runtime can reuse their evaluated prefix.
+            url = f"{backend.base_url}/api/chat"
+            payload["messages"] = [
+                *self._chat_prefix,
+                {"role": "user", "content": prompt},
+            ]
+        else:
+            url = f"{backend.base_url}/api/generate"
+            payload["prompt"] = prompt
 
-            content = cast(str, response_data["response"]).strip()
-            logger.info("Received response from Ollama", content_length=len(content))
+        if self._response_schema is not None:
+            payload["format"] = self._response_schema
+        self._residency.apply(payload)
 
-            return content
+        return url, payload
 
+    @contextmanager
+    def _translate_errors(self, readiness: OllamaModelReadiness) -> Iterator[None]:
+        try:
+            yield
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                readiness.mark_missing()
+            logger.error("HTTP error communicating with Ollama", error=str(e))
+            raise LLMServiceError(f"HTTP error: {e}") from e
         except httpx.HTTPError as e:
             logger.error("HTTP error communicating with Ollama", error=str(e))
-            raise LLMServiceError(f"HTTP error: {e}")
+            raise LLMServiceError(f"HTTP error: {e}") from e
         except json.JSONDecodeError as e:
             logger.error("Failed to decode JSON response from Ollama", error=str(e))
-            raise LLMServiceError(f"Invalid JSON response: {e}")
+            raise LLMServiceError(f"Invalid JSON response: {e}") from e
         except Exception as e:
             logger.error("Unexpected error communicating with Ollama", error=str(e))
-            raise LLMServiceError(f"Unexpected error: {e}")
+            raise LLMServiceError(f"Unexpected error: {e}") from e
+
+    async def _generate(
+        self, client: httpx.AsyncClient, url: str, payload: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+
+        response_data = response.json()
+
+        content = _content(response_data)
+        if content is None:
+            raise LLMServiceError("Invalid response format from Ollama")
+
+        return content.strip(), _timings(response_data)
+
+    async def _generate_streaming(
+        self, client: httpx.AsyncClient, url: str, payload: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        scanner = JsonObjectScanner()
+        tokens: List[str] = []
+
+        async with aclosing(self._chunks(client, url, payload)) as chunks:
+            async for chunk in chunks:
+                token = _content(chunk) or ""
+                tokens.append(token)
+
+                completed = scanner.feed(token)
+                if completed:
+                    # Leaving the stream early closes the connection, which
+                    # makes Ollama abort the rest of the generation.
+                    logger.debug("JSON object closed, stopping generation")
+                    return completed[0], {}
+
+                if chunk.get("done"):
+                    return "".join(tokens).strip(), _timings(chunk)
+
+        return "".join(tokens).strip(), {}
+
+    async def _chunks(
+        self, client: httpx.AsyncClient, url: str, payload: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        async with client.stream("POST", url, json=payload) as response:
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise LLMServiceError(f"Ollama error: {chunk['error']}")
+                yield chunk
+
+    def backend_stats(self) -> List[Dict[str, Any]]:
+        return self._pool.stats()
 
     async def close(self) -> None:
-        await self._client.aclose()
+        await self._residency.close()
+        for readiness in self._readiness.values():
+            await readiness.close()
+        await self._pool.close()
+
+
+def _content(response_data: Dict[str, Any]) -> Optional[str]:
+    if "message" in response_data:
+        return cast(str, response_data["message"].get("content", ""))
+    if "response" in response_data:
+        return cast(str, response_data["response"])
+    return None
+
+
+def _timings(response_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        field: response_data[field]
+        for field in OLLAMA_TIMING_FIELDS
+        if field in response_data
+    }
@@ -1,3 +1,5 @@
+from .json_field_reader import JsonFieldReader
 from .json_parser import JsonParser
+from .json_scanner import JsonObjectScanner, find_json_objects
 
-__all__ = ["JsonParser"]
+__all__ = ["JsonFieldReader", "JsonParser", "JsonObjectScanner", "find_json_objects"]
@@ -0,0 +1,97 @@
+import json
+import re
+from typing import Any, List, Tuple
+
+from ...application.interfaces import JsonFieldReaderInterface
+
+_STRUCTURAL_CHARS = re.compile(r'[{}\[\]",\\]')
+
+
+class JsonFieldReader(JsonFieldReaderInterface):
+    def __init__(self) -> None:
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._pending_escape = False
+        self._fields_read = 0
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        fields: List[Tuple[str, Any]] = []
+        if self._closed:
+            return fields
+
+        start = 0
+        position = 0
+
+        if self._pending_escape and chunk:
+            self._pending_escape = False
+            position = 1
+
+        while True:
+            match = _STRUCTURAL_CHARS.search(chunk, position)
+            if match is None:
+                break
+
+            index = match.start()
+            char = chunk[index]
+            position = index + 1
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    start = position
+                continue
+
+            if self._in_string:
+                if char == "\\":
+                    if index + 1 < len(chunk):
+                        position = index + 2
+                    else:
+                        self._pending_escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete(chunk[start:index], fields)
+                    # Braces in the prose before the answer open an object
+                    # with no members; reading goes on until one that has.
+                    if self._fields_read:
+                        self._closed = True
+                        return fields
+            elif char == "," and self._depth == 1:
+                self._complete(chunk[start:index], fields)
+                start = position
+
+        if self._depth > 0:
+            self._member.append(chunk[start:])
+
+        return fields
+
+    def _complete(self, tail: str, fields: List[Tuple[str, Any]]) -> None:
+        # Each top-level member is decoded on its own as soon as the comma or
+        # brace after it arrives, so a value is never re-parsed.
+        self._member.append(tail)
+        member = "".join(self._member).strip()
+        self._member = []
+        if not member:
+            return
+
+        try:
+            data = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            return
+
+        fields.extend(data.items())
+        self._fields_read += len(data)
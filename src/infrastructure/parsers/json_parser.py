@@ -1,44 +1,61 @@
 import json
-import re
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, Optional
+
+import structlog
 
 from ...application.interfaces import JsonParserInterface
 from ...domain.exceptions import InvalidJsonResponseError
+from .json_field_reader import JsonFieldReader
+from .json_repair import repair_json
+from .json_scanner import JsonObjectScanner
 
+logger = structlog.get_logger()
 
-class JsonParser(JsonParserInterface):
-    def parse(self, text: str) -> Dict[str, Any]:
-        cleaned_text = self._extract_json_from_text(text)
-
-        try:
-            return cast(Dict[str, Any], json.loads(cleaned_text))
-        except json.JSONDecodeError as e:
-            raise InvalidJsonResponseError(f"Failed to parse JSON: {e}")
 
-    def _extract_json_from_text(self, text: str) -> str:
-        text = text.strip()
+class JsonParser(JsonParserInterface):
+    def __init__(self, repair: bool = True) -> None:
+        self._repair = repair
 
-        json_patterns = [
-            r"```json\s*(\{.*?\})\s*```",
-            r"```\s*(\{.*?\})\s*```",
-            r"(\{.*?\})",
-        ]
+    def parse(self, text: str) -> Dict[str, Any]:
+        scanner = JsonObjectScanner()
+        candidates = scanner.feed(text)
+        errors: List[str] = []
+
+        for candidate in candidates:
+            data = self._load_object(candidate, errors)
+            if data is not None:
+                return data
+
+        if self._repair:
+            pending = scanner.pending()
+            for candidate in candidates + ([pending] if pending else []):
+                data = self._load_object(repair_json(candidate), errors)
+                if data is not None:
+                    logger.info("Repaired malformed JSON from LLM response")
+                    return data
+
+        if errors:
+            raise InvalidJsonResponseError(f"Failed to parse JSON: {errors[0]}")
+        raise InvalidJsonResponseError("No valid JSON found in response")
 
-        for pattern in json_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            if matches:
-                json_text = cast(str, matches[0]).strip()
-                if self._is_valid_json_structure(json_text):
-                    return json_text
+    def parse_structured(self, text: str) -> Dict[str, Any]:
+        errors: List[str] = []
+        data = self._load_object(text, errors)
 
-        if text.startswith("{") and text.endswith("}"):
-            return text
+        if data is None:
+            raise InvalidJsonResponseError(
+                f"Structured response is not a JSON object: {errors[0] if errors else text[:200]}"
+            )
+        return data
 
-        raise InvalidJsonResponseError("No valid JSON found in response")
+    def field_reader(self) -> JsonFieldReader:
+        return JsonFieldReader()
 
-    def _is_valid_json_structure(self, text: str) -> bool:
+    def _load_object(self, text: str, errors: List[str]) -> Optional[Dict[str, Any]]:
         try:
             data = json.loads(text)
-            return isinstance(data, dict)
-        except json.JSONDecodeError:
-            return False
+        except json.JSONDecodeError as e:
+            errors.append(str(e))
+            return None
+
+        return data if isinstance(data, dict) else None
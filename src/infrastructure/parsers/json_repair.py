@@ -0,0 +1,112 @@
+import json
+import re
+from typing import List, Tuple
+
+_IDENTIFIER = re.compile(r"[^\W\d][\w-]*")
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+
+_LITERALS = {
+    "None": "null",
+    "null": "null",
+    "True": "true",
+    "true": "true",
+    "False": "false",
+    "false": "false",
+}
+
+
+def repair_json(text: str) -> str:
+    output: List[str] = []
+    closers: List[str] = []
+    position = 0
+
+    while position < len(text):
+        char = text[position]
+
+        if char in "\"'":
+            string, position = _read_string(text, position)
+            output.append(string)
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+            output.append(char)
+            position += 1
+        elif char in "}]":
+            _drop_trailing_comma(output)
+            if closers:
+                closers.pop()
+            output.append(char)
+            position += 1
+        elif char.isdigit() or char == "-":
+            number = _NUMBER.match(text, position)
+            token = number.group() if number else char
+            output.append(token)
+            position += len(token)
+        elif char.isalpha() or char == "_":
+            match = _IDENTIFIER.match(text, position)
+            word = match.group() if match else char
+            position += len(word)
+
+            if word in _LITERALS and not _is_followed_by_colon(text, position):
+                output.append(_LITERALS[word])
+            else:
+                output.append(json.dumps(word, ensure_ascii=False))
+        else:
+            output.append(char)
+            position += 1
+
+    if closers:
+        _drop_trailing_comma(output)
+        if _last_significant(output) == ":":
+            output.append("null")
+        output.extend(reversed(closers))
+
+    return "".join(output)
+
+
+def _read_string(text: str, start: int) -> Tuple[str, int]:
+    quote = text[start]
+    characters: List[str] = []
+    position = start + 1
+
+    while position < len(text):
+        char = text[position]
+
+        if char == "\\" and position + 1 < len(text):
+            escaped = text[position + 1]
+            characters.append("'" if escaped == "'" else char + escaped)
+            position += 2
+            continue
+
+        if char == quote:
+            return '"' + "".join(characters) + '"', position + 1
+
+        if char == '"':
+            characters.append('\\"')
+        elif char == "\n":
+            characters.append("\\n")
+        elif char != "\\":
+            characters.append(char)
+        position += 1
+
+    return '"' + "".join(characters) + '"', position
+
+
+def _is_followed_by_colon(text: str, position: int) -> bool:
+    while position < len(text) and text[position].isspace():
+        position += 1
+    return position < len(text) and text[position] == ":"
+
+
+def _last_significant(output: List[str]) -> str:
+    for fragment in reversed(output):
+        if fragment.strip():
+            return fragment.strip()[-1]
+    return ""
+
+
+def _drop_trailing_comma(output: List[str]) -> None:
+    index = len(output) - 1
+    while index >= 0 and output[index].isspace():
+        index -= 1
+    if index >= 0 and output[index] == ",":
+        del output[index]
@@ -0,0 +1,79 @@
+import re
+from typing import List, Optional
+
+_STRUCTURAL_CHARS = re.compile(r'[{}"\\]')
+
+
+class JsonObjectScanner:
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._pending_escape = False
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def in_string(self) -> bool:
+        return self._in_string
+
+    def pending(self) -> Optional[str]:
+        if self._depth == 0:
+            return None
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> List[str]:
+        completed: List[str] = []
+        start = 0
+        position = 0
+
+        if self._pending_escape and chunk:
+            self._pending_escape = False
+            position = 1
+
+        while True:
+            match = _STRUCTURAL_CHARS.search(chunk, position)
+            if match is None:
+                break
+
+            index = match.start()
+            char = chunk[index]
+            position = index + 1
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    start = index
+                continue
+
+            if self._in_string:
+                if char == "\\":
+                    if index + 1 < len(chunk):
+                        position = index + 2
+                    else:
+                        self._pending_escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[start : index + 1])
+                    completed.append("".join(self._parts))
+                    self._parts = []
+
+        if self._depth > 0:
+            self._parts.append(chunk[start:])
+
+        return completed
+
+
+def find_json_objects(text: str) -> List[str]:
+    return JsonObjectScanner().feed(text)
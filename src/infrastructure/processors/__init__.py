@@ -1,4 +1,14 @@
+from .field_registry import DEFAULT_FIELD_ALIASES, FieldRegistry
+from .temporal_extractor import PortugueseTemporalExtractor
+from .text_chunker import SentenceWindowChunker
 from .text_preprocessor import TextPreprocessor
 from .text_postprocessor import TextPostprocessor
 
-__all__ = ["TextPreprocessor", "TextPostprocessor"]
+__all__ = [
+    "DEFAULT_FIELD_ALIASES",
+    "FieldRegistry",
+    "PortugueseTemporalExtractor",
+    "SentenceWindowChunker",
+    "TextPreprocessor",
+    "TextPostprocessor",
+]
@@ -0,0 +1,183 @@
+import difflib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_FIELD_ALIASES: Dict[str, List[str]] = {
+    "data_ocorrencia": [
+        "data_ocoorrencia",
+        "data_ocorencia",
+        "data_ocorrência",
+        "data_incidente",
+        "data",
+    ],
+    "local": ["location", "lugar", "localizacao", "localização"],
+    "tipo_incidente": [
+        "tipo_incidentde",
+        "tipo_incidende",
+        "tipo",
+        "categoria",
+        "type",
+    ],
+    "impacto": ["impact", "impactos", "consequencia", "consequência", "efeito"],
+}
+
+# (field, rank): rank 0 is the canonical name, 1..n the aliases in order and
+# fuzzy matches rank after every alias, better ratios first.
+Resolution = Tuple[str, float]
+
+
+class FieldRegistry:
+    def __init__(
+        self,
+        aliases: Optional[Mapping[str, Sequence[str]]] = None,
+        threshold: float = 0.6,
+        max_cached_keys: int = 1024,
+    ) -> None:
+        self._fields = dict(DEFAULT_FIELD_ALIASES if aliases is None else aliases)
+        self._threshold = threshold
+        self._max_cached_keys = max_cached_keys
+        self._index: Dict[str, Resolution] = {}
+        for field, variations in self._fields.items():
+            for rank, name in enumerate([field, *variations]):
+                self._index.setdefault(name, (field, float(rank)))
+        # Aliases each field answers to, in priority order, keeping only the
+        # ones the index actually assigns to that field.
+        self._lookup_order = [
+            (
+                field,
+                tuple(
+                    name
+                    for name in dict.fromkeys(variations)
+                    if name != field and self._index[name][0] == field
+                ),
+            )
+            for field, variations in self._fields.items()
+        ]
+        # ratio() is at most 2 * len(field) / (len(field) + len(key)), so a key
+        # longer than this can never reach the threshold.
+        longest = max((len(field) for field in self._fields), default=0)
+        self._max_key_length = (
+            int(longest * (2 / threshold - 1)) if threshold > 0 else None
+        )
+        self._fuzzy: "OrderedDict[str, Optional[Resolution]]" = OrderedDict()
+        self._counters = {"fuzzy_hits": 0, "fuzzy_misses": 0, "evictions": 0}
+
+    @classmethod
+    def from_file(cls, path: str, threshold: float = 0.6) -> "FieldRegistry":
+        with open(path, encoding="utf-8") as file:
+            configured = json.load(file)
+        if not isinstance(configured, dict) or not all(
+            isinstance(aliases, list) for aliases in configured.values()
+        ):
+            raise ValueError(f"Field aliases must map fields to lists: {path}")
+
+        # IncidentInfo only carries the known fields, so a new canonical name
+        # would be resolved and then silently dropped.
+        unknown = sorted(set(configured) - set(DEFAULT_FIELD_ALIASES))
+        if unknown:
+            raise ValueError(
+                f"Unknown fields in {path}: {', '.join(unknown)}; "
+                f"expected one of: {', '.join(DEFAULT_FIELD_ALIASES)}"
+            )
+
+        aliases: Dict[str, List[str]] = {
+            field: list(variations)
+            for field, variations in DEFAULT_FIELD_ALIASES.items()
+        }
+        for field, variations in configured.items():
+            existing = aliases[field]
+            existing.extend(str(alias) for alias in variations if alias not in existing)
+        return cls(aliases, threshold=threshold)
+
+    @property
+    def fields(self) -> Iterable[str]:
+        return self._fields.keys()
+
+    def resolve(self, key: str) -> Optional[Resolution]:
+        resolution = self._index.get(key)
+        if resolution is not None:
+            return resolution
+
+        if key in self._fuzzy:
+            self._fuzzy.move_to_end(key)
+            self._counters["fuzzy_hits"] += 1
+            return self._fuzzy[key]
+
+        self._counters["fuzzy_misses"] += 1
+        resolution = self._match(key)
+        self._fuzzy[key] = resolution
+        if len(self._fuzzy) > self._max_cached_keys:
+            self._fuzzy.popitem(last=False)
+            self._counters["evictions"] += 1
+        return resolution
+
+    def normalize(self, data: Mapping[str, Any]) -> Dict[str, Any]:
+        # Walking each field's names costs the same however many keys the
+        # response carries, and stops at the best-ranked one present.
+        normalized = {}
+        for field, aliases in self._lookup_order:
+            value = data.get(field)
+            if value is None:
+                for alias in aliases:
+                    value = data.get(alias)
+                    if value is not None:
+                        break
+            if value is not None:
+                normalized[field] = value
+        if len(normalized) == len(self._fields):
+            return normalized
+
+        # Fuzzy matches rank after every alias, so they only fill fields that
+        # no exact name claimed.
+        fuzzy: Dict[str, Tuple[float, Any]] = {}
+        for key, value in data.items():
+            if value is None or key in self._index:
+                continue
+            resolution = self.resolve(key)
+            if resolution is None or resolution[0] in normalized:
+                continue
+            field, rank = resolution
+            current = fuzzy.get(field)
+            if current is None or rank < current[0]:
+                fuzzy[field] = (rank, value)
+        if not fuzzy:
+            return normalized
+
+        return {
+            field: normalized[field] if field in normalized else fuzzy[field][1]
+            for field in self._fields
+            if field in normalized or field in fuzzy
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "fields": len(self._fields),
+            "aliases": len(self._index),
+            "cached_keys": len(self._fuzzy),
+            **self._counters,
+        }
+
+    def _match(self, key: str) -> Optional[Resolution]:
+        if self._max_key_length is not None and len(key) > self._max_key_length:
+            return None
+
+        # The unknown key is the matcher's second sequence so its index is
+        # built once and reused against every canonical field name.
+        matcher = difflib.SequenceMatcher(None, "", key.lower())
+        best: Optional[Resolution] = None
+        best_ratio = 0.0
+
+        for field in self._fields:
+            matcher.set_seq1(field.lower())
+            if (
+                matcher.real_quick_ratio() < self._threshold
+                or matcher.quick_ratio() < self._threshold
+            ):
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio and ratio >= self._threshold:
+                best_ratio = ratio
+                best = (field, len(self._fields[field]) + 2 - ratio)
+
+        return best
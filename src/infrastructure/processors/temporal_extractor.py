@@ -0,0 +1,238 @@
+import re
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Optional, Tuple
+
+from ...application.interfaces import TemporalExtractorInterface
+
+_MONTHS = {
+    "janeiro": 1,
+    "fevereiro": 2,
+    "março": 3,
+    "marco": 3,
+    "abril": 4,
+    "maio": 5,
+    "junho": 6,
+    "julho": 7,
+    "agosto": 8,
+    "setembro": 9,
+    "outubro": 10,
+    "novembro": 11,
+    "dezembro": 12,
+}
+_MONTH_ABBREVIATIONS = {name[:3]: number for name, number in _MONTHS.items()}
+
+# Keyed by the first three letters, which are distinct for every weekday.
+_WEEKDAYS = {
+    "seg": 0,
+    "ter": 1,
+    "qua": 2,
+    "qui": 3,
+    "sex": 4,
+    "sáb": 5,
+    "sab": 5,
+    "dom": 6,
+}
+
+_NUMBER_WORDS = {
+    "um": 1,
+    "uma": 1,
+    "dois": 2,
+    "duas": 2,
+    "três": 3,
+    "tres": 3,
+    "quatro": 4,
+    "cinco": 5,
+    "seis": 6,
+    "sete": 7,
+    "oito": 8,
+    "nove": 9,
+    "dez": 10,
+}
+
+_UNITS = {"minuto": "minutes", "hora": "hours", "dia": "days", "semana": "weeks"}
+
+_AMOUNT = r"\d{1,3}|" + "|".join(_NUMBER_WORDS)
+_UNIT = r"minutos?|horas?|dias?|semanas?"
+_MONTH = "|".join([*_MONTHS, *_MONTH_ABBREVIATIONS])
+
+_DATE_PATTERN = re.compile(
+    r"(?P<iso>\b(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})\b)"
+    r"|(?P<numeric>\b(?P<num_day>\d{1,2})[/.-](?P<num_month>\d{1,2})"
+    r"[/.-](?P<num_year>\d{4}|\d{2})\b)"
+    rf"|(?P<named>\b(?P<name_day>\d{{1,2}})º?\s+de\s+(?P<name_month>{_MONTH})"
+    r"\b\.?(?:\s+de\s+(?P<name_year>\d{4})\b)?)"
+    r"|(?P<relative>\b(?:anteontem|ontem|hoje)\b)"
+    r"|(?P<last_week>\b(?:semana\s+passada|última\s+semana)\b)"
+    rf"|(?P<offset>\bhá\s+(?P<ago_amount>{_AMOUNT})\s+(?P<ago_unit>{_UNIT})\b"
+    rf"|\b(?P<amount>{_AMOUNT})\s+(?P<unit>{_UNIT})\s+atrás\b)"
+    r"|(?P<weekday>(?:\b(?P<weekday_last>últim[oa]|passad[oa])\s+)?"
+    r"\b(?P<weekday_name>(?:segunda|terça|terca|quarta|quinta|sexta)[-\s]feira"
+    r"|sábado|sabado|domingo)\b(?:\s+(?P<weekday_past>passad[oa])\b)?)",
+    re.IGNORECASE,
+)
+
+# Durations ("por 2h", "durante 3:00") look like clock times; the lookbehinds
+# keep them from being read as the time of the incident.
+_TIME_PATTERN = re.compile(
+    r"(?<!\bpor )(?<!\bdurante )(?<!\bapós )(?<!\bapos )(?<!\bhá )(?<!\bha )"
+    r"(?:\bàs\s+)?\b(?P<hour>\d{1,2})(?::(?P<minute>\d{2})|h(?P<h_minute>\d{2})?)\b"
+    r"(?:\s+(?:da|de)\s+(?P<period>manhã|manha|tarde|noite|madrugada)\b)?"
+    r"|(?P<noon>\bmeio[-\s]dia\b)|(?P<midnight>\bmeia[-\s]noite\b)",
+    re.IGNORECASE,
+)
+
+_TIME_WINDOW = 60
+
+
+class PortugueseTemporalExtractor(TemporalExtractorInterface):
+    def __init__(self, timezone: Optional[tzinfo] = None) -> None:
+        self._timezone = timezone
+
+    def extract(
+        self, text: str, reference_time: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        reference = reference_time or datetime.now(self._timezone)
+        reference = reference.replace(tzinfo=None)
+
+        matches = list(_DATE_PATTERN.finditer(text))
+        candidates = []
+        for index, match in enumerate(matches):
+            resolved = self._resolve(match, reference)
+            if resolved is not None:
+                candidates.append((index, resolved))
+
+        # With more than one day mentioned, which one is the incident is a
+        # judgement call; the model sees the whole text and makes it.
+        days = {day for _, (day, _) in candidates}
+        if len(days) != 1:
+            return None
+
+        for index, (day, moment) in candidates:
+            if moment is not None:
+                return moment
+            # A time never belongs to a date past another date expression.
+            start = matches[index - 1].end() if index > 0 else 0
+            end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+            nearest = self._nearest_time(text, matches[index], start, end)
+            if nearest is not None:
+                return datetime.combine(day, nearest)
+
+        return datetime.combine(days.pop(), time())
+
+    def _resolve(
+        self, match: "re.Match[str]", reference: datetime
+    ) -> Optional[Tuple[date, Optional[datetime]]]:
+        kind = match.lastgroup
+        today = reference.date()
+
+        try:
+            if kind == "iso":
+                return (
+                    date(
+                        int(match["iso_year"]),
+                        int(match["iso_month"]),
+                        int(match["iso_day"]),
+                    ),
+                    None,
+                )
+            if kind == "numeric":
+                year = int(match["num_year"])
+                if year < 100:
+                    year += 2000
+                return (
+                    date(year, int(match["num_month"]), int(match["num_day"])),
+                    None,
+                )
+            if kind == "named":
+                return self._named_date(match, today), None
+        except ValueError:
+            return None
+
+        if kind == "relative":
+            offsets = {"hoje": 0, "ontem": 1, "anteontem": 2}
+            return today - timedelta(days=offsets[match.group().lower()]), None
+        if kind == "last_week":
+            return today - timedelta(weeks=1), None
+        if kind == "offset":
+            return self._offset(match, reference)
+        if kind == "weekday":
+            return self._weekday(match, today), None
+        return None
+
+    def _named_date(self, match: "re.Match[str]", today: date) -> date:
+        name = match["name_month"].lower()
+        month = _MONTHS.get(name) or _MONTH_ABBREVIATIONS[name[:3]]
+        day = int(match["name_day"])
+
+        if match["name_year"]:
+            return date(int(match["name_year"]), month, day)
+
+        # Reports describe past events, so a day-month later than today is
+        # from the previous year.
+        candidate = date(today.year, month, day)
+        if candidate > today:
+            candidate = date(today.year - 1, month, day)
+        return candidate
+
+    def _offset(
+        self, match: "re.Match[str]", reference: datetime
+    ) -> Tuple[date, Optional[datetime]]:
+        raw_amount = (match["ago_amount"] or match["amount"]).lower()
+        amount = _NUMBER_WORDS.get(raw_amount) or int(raw_amount)
+        raw_unit = (match["ago_unit"] or match["unit"]).lower().rstrip("s")
+        unit = _UNITS[raw_unit]
+
+        moment = reference - timedelta(**{unit: amount})
+        if unit in ("minutes", "hours"):
+            return moment.date(), moment.replace(second=0, microsecond=0)
+        return moment.date(), None
+
+    def _weekday(self, match: "re.Match[str]", today: date) -> date:
+        weekday = _WEEKDAYS[match["weekday_name"][:3].lower()]
+        days_back = (today.weekday() - weekday) % 7
+        if days_back == 0 and (match["weekday_last"] or match["weekday_past"]):
+            days_back = 7
+        return today - timedelta(days=days_back)
+
+    def _nearest_time(
+        self,
+        text: str,
+        date_match: "re.Match[str]",
+        lower: int,
+        upper: int,
+    ) -> Optional[time]:
+        start = max(lower, date_match.start() - _TIME_WINDOW)
+        end = min(upper, date_match.end() + _TIME_WINDOW)
+        best: Optional[time] = None
+        best_distance = _TIME_WINDOW + 1
+
+        for match in _TIME_PATTERN.finditer(text, start, end):
+            if match.start() >= date_match.start() and match.end() <= date_match.end():
+                continue
+            parsed = self._time(match)
+            if parsed is None:
+                continue
+            distance = (
+                match.start() - date_match.end()
+                if match.start() >= date_match.end()
+                else date_match.start() - match.end()
+            )
+            if distance < best_distance:
+                best, best_distance = parsed, distance
+
+        return best
+
+    def _time(self, match: "re.Match[str]") -> Optional[time]:
+        if match["noon"]:
+            return time(12, 0)
+        if match["midnight"]:
+            return time(0, 0)
+
+        hour = int(match["hour"])
+        minute = int(match["minute"] or match["h_minute"] or 0)
+        period = (match["period"] or "").lower()
+        if period in ("tarde", "noite") and hour < 12:
+            hour += 12
+        if hour > 23 or minute > 59:
+            return None
+        return time(hour, minute)
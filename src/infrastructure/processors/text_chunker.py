@@ -0,0 +1,52 @@
+import re
+from typing import List
+
+from ...application.interfaces import TextChunkerInterface
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;])\s+")
+
+
+class SentenceWindowChunker(TextChunkerInterface):
+    def __init__(self, max_tokens: int = 384, chars_per_token: float = 4.0) -> None:
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self._max_chars = max(1, int(max_tokens * chars_per_token))
+
+    @property
+    def max_chars(self) -> int:
+        return self._max_chars
+
+    def split(self, text: str) -> List[str]:
+        text = text.strip()
+        if len(text) <= self._max_chars:
+            return [text]
+
+        windows: List[str] = []
+        current = ""
+        for piece in self._pieces(text):
+            candidate = f"{current} {piece}" if current else piece
+            if len(candidate) <= self._max_chars:
+                current = candidate
+                continue
+            if current:
+                windows.append(current)
+            current = piece
+
+        if current:
+            windows.append(current)
+        return windows
+
+    def _pieces(self, text: str) -> List[str]:
+        pieces: List[str] = []
+        for sentence in _SENTENCE_BOUNDARY.split(text):
+            if len(sentence) <= self._max_chars:
+                pieces.append(sentence)
+                continue
+            # A sentence longer than the whole window falls back to words, and
+            # a single oversized word is cut at the window size.
+            for word in sentence.split():
+                pieces.extend(
+                    word[start : start + self._max_chars]
+                    for start in range(0, len(word), self._max_chars)
+                )
+        return pieces
@@ -1,72 +1,27 @@
-import difflib
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from ...application.interfaces import TextPostprocessorInterface
 from ...domain.entities import IncidentInfo
+from .field_registry import FieldRegistry
+
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+)
 
 
 class TextPostprocessor(TextPostprocessorInterface):
-    EXPECTED_FIELDS = {
-        "data_ocorrencia": [
-            "data_ocoorrencia",
-            "data_ocorencia",
-            "data_ocorrência",
-            "data_incidente",
-            "data",
-        ],
-        "local": ["location", "lugar", "localizacao", "localização"],
-        "tipo_incidente": [
-            "tipo_incidentde",
-            "tipo_incidende",
-            "tipo",
-            "categoria",
-            "type",
-        ],
-        "impacto": ["impact", "impactos", "consequencia", "consequência", "efeito"],
-    }
+    def __init__(self, field_registry: Optional[FieldRegistry] = None) -> None:
+        self._field_registry = field_registry or FieldRegistry()
 
     def normalize_field_names(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        normalized = {}
-
-        for expected_field, variations in self.EXPECTED_FIELDS.items():
-            value = None
-
-            if expected_field in data:
-                value = data[expected_field]
-            else:
-                for variation in variations:
-                    if variation in data:
-                        value = data[variation]
-                        break
-
-                if value is None:
-                    best_match = self._find_best_field_match(
-                        expected_field, list(data.keys())
-                    )
-                    if best_match:
-                        value = data[best_match]
-
-            if value is not None:
-                normalized[expected_field] = value
-
-        return normalized
-
-    def _find_best_field_match(
-        self, target_field: str, available_fields: list[str], threshold: float = 0.6
-    ) -> Optional[str]:
-        best_match = None
-        best_ratio = 0.0
-
-        for field in available_fields:
-            ratio = difflib.SequenceMatcher(
-                None, target_field.lower(), field.lower()
-            ).ratio()
-            if ratio > best_ratio and ratio >= threshold:
-                best_ratio = ratio
-                best_match = field
-
-        return best_match
+        return self._field_registry.normalize(data)
 
     def build_incident_info(self, data: Dict[str, Any]) -> IncidentInfo:
         data_ocorrencia = self._parse_datetime(data.get("data_ocorrencia"))
@@ -79,13 +34,12 @@ class TextPostprocessor(TextPostprocessorInterface):
         )
 
     def _parse_datetime(self, date_str: Optional[str]) -> Optional[datetime]:
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
             return None
 
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-        except ValueError:
+        for date_format in _DATE_FORMATS:
             try:
-                return datetime.strptime(date_str, "%Y-%m-%d")
+                return datetime.strptime(date_str.strip(), date_format)
             except ValueError:
-                return None
+                continue
+        return None
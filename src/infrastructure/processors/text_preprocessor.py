@@ -1,51 +1,65 @@
 import re
-from datetime import datetime, timedelta
-from typing import Dict
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Callable, Dict, Optional
 
 from ...application.interfaces import TextPreprocessorInterface
 
+_RELATIVE_DAY_OFFSETS = {"hoje": 0, "ontem": 1, "anteontem": 2}
+
+# The leading lookahead is a cheap first-character filter, so the alternation is
+# only tried where a replacement can start. Runs that are already normalized (a
+# single space, ", " or ". " before a word) are not matched, so the callback
+# only runs where the text actually changes.
+_PREPROCESS_PATTERN = re.compile(
+    r"(?=[\s\d,;.aàho])(?:"
+    r"(?P<space>[^\S ]\s*| \s+)"
+    r"|(?P<relative>\b(?:anteontem|ontem|hoje)\b)"
+    r"|(?P<time>(?:\bàs\s+)?\b(?P<hour>\d{1,2})h(?P<minute>\d{2})?\b)"
+    r"|(?P<clock>\bàs\s+(?P<clock_time>\d{1,2}:\d{2})\b)"
+    r"|(?P<comma>;\s*|,(?! \S)\s*)"
+    r"|(?P<period>\.(?! \S)\s*)"
+    r")",
+    re.IGNORECASE,
+)
 
-class TextPreprocessor(TextPreprocessorInterface):
-    def __init__(self) -> None:
-        self._relative_dates: Dict[str, str] = {
-            "hoje": datetime.now().strftime("%Y-%m-%d"),
-            "ontem": (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
-            "anteontem": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d"),
-        }
 
-    def preprocess(self, text: str) -> str:
-        text = self._normalize_whitespace(text)
-        text = self._normalize_relative_dates(text)
-        text = self._normalize_time_formats(text)
-        text = self._clean_punctuation(text)
+@lru_cache(maxsize=64)
+def _replacer_for_day(day: date) -> Callable[["re.Match[str]"], str]:
+    relative_dates: Dict[str, str] = {
+        word: (day - timedelta(days=offset)).strftime("%Y-%m-%d")
+        for word, offset in _RELATIVE_DAY_OFFSETS.items()
+    }
 
-        return text.strip()
+    def replace(match: "re.Match[str]") -> str:
+        kind = match.lastgroup
 
-    def _normalize_whitespace(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text.strip())
+        if kind == "space":
+            return " "
+        if kind == "relative":
+            return relative_dates[match.group().lower()]
+        if kind == "time":
+            return f"{match['hour']}:{match['minute'] or '00'}"
+        if kind == "clock":
+            return match["clock_time"]
+        if kind == "comma":
+            return ", "
+        return ". "
 
-    def _normalize_relative_dates(self, text: str) -> str:
-        for relative_date, actual_date in self._relative_dates.items():
-            pattern = rf"\b{re.escape(relative_date)}\b"
-            text = re.sub(pattern, actual_date, text, flags=re.IGNORECASE)
+    return replace
 
-        return text
 
-    def _normalize_time_formats(self, text: str) -> str:
-        time_patterns = [
-            (r"\b(\d{1,2})h(\d{2})\b", r"\1:\2"),
-            (r"\b(\d{1,2})h\b", r"\1:00"),
-            (r"\bàs\s+(\d{1,2}:\d{2})\b", r"\1"),
-            (r"\bàs\s+(\d{1,2})h\b", r"\1:00"),
-        ]
+class TextPreprocessor(TextPreprocessorInterface):
+    def __init__(self, timezone: Optional[tzinfo] = None) -> None:
+        self._timezone = timezone
 
-        for pattern, replacement in time_patterns:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    def preprocess(self, text: str, reference_time: Optional[datetime] = None) -> str:
+        replace = _replacer_for_day(self._reference_day(reference_time))
 
-        return text
+        return _PREPROCESS_PATTERN.sub(replace, text).strip()
 
-    def _clean_punctuation(self, text: str) -> str:
-        text = re.sub(r"[,;]\s*", ", ", text)
-        text = re.sub(r"\.\s*", ". ", text)
+    def _reference_day(self, reference_time: Optional[datetime]) -> date:
+        if reference_time is None:
+            return datetime.now(self._timezone).date()
 
-        return text
+        return reference_time.date()
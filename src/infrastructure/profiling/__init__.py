@@ -0,0 +1,4 @@
+from .memory_snapshot import capture_memory_snapshot
+from .sampling_profiler import SamplingProfiler
+
+__all__ = ["SamplingProfiler", "capture_memory_snapshot"]
@@ -0,0 +1,47 @@
+import asyncio
+import tracemalloc
+from typing import Any, Dict
+
+
+async def capture_memory_snapshot(
+    seconds: float, top: int = 25, frames: int = 10
+) -> Dict[str, Any]:
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start(frames)
+
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        # Tracing slows every allocation, so it is only left on if it was
+        # already enabled (e.g. PYTHONTRACEMALLOC).
+        if started_here:
+            tracemalloc.stop()
+
+    growth = after.compare_to(before, "lineno")
+    largest = after.statistics("lineno")
+
+    return {
+        "duration_seconds": seconds,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "top_growth": [
+            {
+                "location": str(stat.traceback[0]),
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in growth[:top]
+        ],
+        "top_allocations": [
+            {
+                "location": str(stat.traceback[0]),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in largest[:top]
+        ],
+    }
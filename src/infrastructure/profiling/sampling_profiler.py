@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005, max_depth: int = 64) -> None:
+        self._interval = interval
+        self._max_depth = max_depth
+
+    async def profile(self, seconds: float) -> Dict[str, Any]:
+        # The sampler runs in its own thread and reads the event loop thread's
+        # current frame, so the loop keeps serving requests while it is sampled.
+        target = threading.get_ident()
+        stacks: "Counter[Stack]" = Counter()
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(target, stacks, stop),
+            name="sampling-profiler",
+            daemon=True,
+        )
+
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stop.set()
+            await asyncio.to_thread(sampler.join)
+
+        return _report(stacks, time.perf_counter() - started, self._interval)
+
+    def _sample(
+        self, target: int, stacks: "Counter[Stack]", stop: threading.Event
+    ) -> None:
+        while not stop.wait(self._interval):
+            frame = sys._current_frames().get(target)
+            if frame is not None:
+                stacks[self._stack(frame)] += 1
+
+    def _stack(self, frame: Optional[FrameType]) -> Stack:
+        names: List[str] = []
+        while frame is not None and len(names) < self._max_depth:
+            code = frame.f_code
+            filename = os.path.basename(code.co_filename)
+            names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return tuple(reversed(names))
+
+
+def _report(
+    stacks: "Counter[Stack]", duration: float, interval: float, top: int = 25
+) -> Dict[str, Any]:
+    samples = sum(stacks.values())
+    self_samples: "Counter[str]" = Counter()
+    total_samples: "Counter[str]" = Counter()
+    for stack, count in stacks.items():
+        if stack:
+            self_samples[stack[-1]] += count
+        for name in set(stack):
+            total_samples[name] += count
+
+    def ranked(counter: "Counter[str]") -> List[Dict[str, Any]]:
+        return [
+            {"function": name, "samples": count, "percent": _percent(count, samples)}
+            for name, count in counter.most_common(top)
+        ]
+
+    return {
+        "duration_seconds": round(duration, 3),
+        "interval_ms": interval * 1000,
+        "samples": samples,
+        "top_self": ranked(self_samples),
+        "top_total": ranked(total_samples),
+        # Brendan Gregg's collapsed format, readable by flamegraph.pl and
+        # speedscope.
+        "collapsed": [
+            f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()
+        ],
+    }
+
+
+def _percent(count: int, total: int) -> float:
+    return round(count / total * 100, 1) if total else 0.0
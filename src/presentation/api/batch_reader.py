@@ -0,0 +1,153 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+from pydantic import ValidationError
+
+from ...application.use_cases import BatchItem
+from .schemas import IncidentRequest
+
+_decoder = json.JSONDecoder()
+
+
+async def read_batch_items(
+    chunks: AsyncIterable[bytes], max_item_chars: int = 1_000_000
+) -> AsyncIterator[BatchItem]:
+    text_chunks = _decode_utf8(chunks)
+    buffer = ""
+
+    async for text in text_chunks:
+        buffer += text
+        if buffer.strip():
+            break
+
+    buffer = buffer.lstrip()
+    if not buffer:
+        return
+
+    if buffer[0] == "[":
+        items = _read_json_array(buffer[1:], text_chunks, max_item_chars)
+    else:
+        items = _read_ndjson(buffer, text_chunks, max_item_chars)
+
+    async for item in items:
+        yield item
+
+
+async def _decode_utf8(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def _read_json_array(
+    buffer: str, chunks: AsyncIterator[str], max_item_chars: int
+) -> AsyncIterator[BatchItem]:
+    index = 0
+    expect_value = True
+    exhausted = False
+
+    while True:
+        buffer = buffer.lstrip()
+
+        if buffer and buffer[0] == "]":
+            return
+
+        if buffer and not expect_value:
+            if buffer[0] != ",":
+                yield BatchItem(index=index, error=ValueError("Expected ',' or ']'"))
+                return
+            buffer = buffer[1:]
+            expect_value = True
+            continue
+
+        if buffer:
+            try:
+                value, end = _decoder.raw_decode(buffer)
+            except json.JSONDecodeError as e:
+                if exhausted or len(buffer) > max_item_chars:
+                    yield BatchItem(
+                        index=index, error=ValueError(f"Invalid JSON item: {e.msg}")
+                    )
+                    return
+            else:
+                yield _to_batch_item(index, value)
+                index += 1
+                buffer = buffer[end:]
+                expect_value = False
+                continue
+
+        if exhausted:
+            yield BatchItem(index=index, error=ValueError("Unterminated JSON array"))
+            return
+
+        try:
+            buffer += await anext(chunks)
+        except StopAsyncIteration:
+            exhausted = True
+
+
+async def _read_ndjson(
+    buffer: str, chunks: AsyncIterator[str], max_item_chars: int
+) -> AsyncIterator[BatchItem]:
+    index = 0
+    exhausted = False
+
+    while True:
+        newline = buffer.find("\n")
+
+        if newline == -1 and not exhausted:
+            if len(buffer) > max_item_chars:
+                yield BatchItem(index=index, error=ValueError("Item too large"))
+                return
+            try:
+                buffer += await anext(chunks)
+            except StopAsyncIteration:
+                exhausted = True
+            continue
+
+        if newline == -1:
+            line, buffer = buffer, ""
+        else:
+            line, buffer = buffer[:newline], buffer[newline + 1 :]
+
+        if line.strip():
+            try:
+                yield _to_batch_item(index, json.loads(line))
+            except json.JSONDecodeError as e:
+                yield BatchItem(
+                    index=index, error=ValueError(f"Invalid JSON item: {e.msg}")
+                )
+            index += 1
+
+        if exhausted and not buffer:
+            return
+
+
+def _to_batch_item(index: int, value: Any) -> BatchItem:
+    if isinstance(value, str):
+        return BatchItem(index=index, text=value)
+
+    if not isinstance(value, dict):
+        return BatchItem(
+            index=index,
+            error=ValueError("Item must be a string or an object with a 'text' field"),
+        )
+
+    try:
+        request = IncidentRequest.model_validate(value)
+    except ValidationError as e:
+        return BatchItem(index=index, error=ValueError(str(e)))
+
+    return BatchItem(
+        index=index,
+        text=request.text,
+        reference_time=request.resolved_reference_time(),
+    )
@@ -1,44 +1,163 @@
-import os
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Dict, Optional
+import asyncio
+import json
+import time
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
 
 import structlog
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
 
-from ...application.use_cases import ExtractIncidentInfoUseCase
+from ...application.interfaces import CachePolicy, Job
+from ...application.use_cases import (
+    BatchExtractIncidentInfoUseCase,
+    BatchItem,
+    BatchItemResult,
+    ExtractedField,
+    ExtractIncidentInfoUseCase,
+    ExtractionJobWorkerPool,
+)
 from ...domain.entities import IncidentText
 from ...domain.exceptions import (
     IncidentExtractorError,
     InvalidJsonResponseError,
     LLMServiceError,
+    ServiceOverloadedError,
     TextPreprocessingError,
 )
-from ...infrastructure.parsers import JsonParser
-from ...infrastructure.models import OllamaService
-from ...infrastructure.processors import TextPostprocessor, TextPreprocessor
-from .schemas import ErrorResponse, IncidentRequest, IncidentResponse
+from ...infrastructure.metrics import RequestTimings
+from ...infrastructure.profiling import SamplingProfiler, capture_memory_snapshot
+from .batch_reader import read_batch_items
+from .pipeline import (
+    ExtractionPipeline,
+    PipelineHolder,
+    build_job_worker_pool,
+    build_pipeline,
+)
+from .schemas import ErrorResponse, IncidentRequest, IncidentResponse, JobResponse
+from .settings import Settings, load_settings
 
 logger = structlog.get_logger()
 
-ollama_service: Optional[OllamaService] = None
+pipeline_holder = PipelineHolder()
+profiling_lock = asyncio.Lock()
+default_settings = Settings()
+job_workers: Optional[ExtractionJobWorkerPool] = None
+
+
+class NdjsonStreamingResponse(StreamingResponse):
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        content: AsyncIterator[str],
+        body_consumed: Optional[asyncio.Event] = None,
+    ) -> None:
+        super().__init__(content)
+        self.body_consumed = body_consumed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        streaming = asyncio.create_task(self.stream_response(send))
+        listener = asyncio.create_task(self._cancel_on_disconnect(receive, streaming))
+        try:
+            await streaming
+        except asyncio.CancelledError:
+            if not listener.done() or listener.cancelled():
+                raise
+            logger.info("Client disconnected, abandoning batch")
+        finally:
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
+            # A stream cancelled inside send() leaves the generator suspended,
+            # and with it the extractions it started.
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        if self.background is not None:
+            await self.background()
+
+    async def _cancel_on_disconnect(
+        self, receive: Receive, streaming: "asyncio.Task[None]"
+    ) -> None:
+        # The request body is consumed while the response is streamed, so the
+        # receive channel is only watched once the body has been read.
+        if self.body_consumed is not None:
+            await self.body_consumed.wait()
+
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                streaming.cancel()
+                return
+
+
+async def signal_when_consumed(
+    chunks: AsyncIterator[bytes], consumed: asyncio.Event
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        yield chunk
+    consumed.set()
+
+
+def input_too_long_message(length: int, limit: int) -> str:
+    return f"Texto com {length} caracteres excede o limite de {limit} caracteres"
+
+
+async def reject_long_items(
+    items: AsyncIterator[BatchItem], max_input_chars: int
+) -> AsyncIterator[BatchItem]:
+    async for item in items:
+        if item.text is not None and len(item.text) > max_input_chars:
+            yield BatchItem(
+                index=item.index,
+                error=ValueError(
+                    input_too_long_message(len(item.text), max_input_chars)
+                ),
+            )
+        else:
+            yield item
+
+
+def timing_requested(request: Request) -> bool:
+    flag = request.headers.get("x-debug-timing") or request.query_params.get("timing")
+    return (flag or "").lower() in ("1", "true", "yes")
+
+
+def cache_policy_from_header(cache_control: Optional[str]) -> CachePolicy:
+    directives = {
+        directive.strip().lower() for directive in (cache_control or "").split(",")
+    }
+
+    if "no-store" in directives:
+        return CachePolicy.BYPASS
+    if "no-cache" in directives:
+        return CachePolicy.REFRESH
+    return CachePolicy.USE
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    global ollama_service
-
-    ollama_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    ollama_model = os.getenv("OLLAMA_MODEL", "tinyllama")
+    global job_workers
 
-    logger.info("Initializing Ollama service", url=ollama_url, model=ollama_model)
-    ollama_service = OllamaService(base_url=ollama_url, model=ollama_model)
+    settings = load_settings()
+    pipeline_holder.install(await build_pipeline(settings))
+    job_workers = build_job_worker_pool(settings, pipeline_holder)
+    if job_workers is not None:
+        job_workers.start()
 
     yield
 
+    if job_workers is not None:
+        logger.info("Stopping extraction job workers")
+        await job_workers.close()
+        job_workers = None
     logger.info("Shutting down Ollama service")
-    if ollama_service:
-        await ollama_service.close()
+    await pipeline_holder.close()
 
 
 app = FastAPI(
@@ -57,20 +176,32 @@ app.add_middleware(
 )
 
 
-def get_use_case() -> ExtractIncidentInfoUseCase:
-    if ollama_service is None:
-        raise RuntimeError("Ollama service not initialized")
+def get_settings() -> Settings:
+    pipeline = pipeline_holder.current
+    return pipeline.settings if pipeline is not None else default_settings
 
-    text_preprocessor = TextPreprocessor()
-    json_parser = JsonParser()
-    text_postprocessor = TextPostprocessor()
 
-    return ExtractIncidentInfoUseCase(
-        llm_service=ollama_service,
-        text_preprocessor=text_preprocessor,
-        json_parser=json_parser,
-        text_postprocessor=text_postprocessor,
-    )
+async def get_pipeline() -> AsyncIterator[ExtractionPipeline]:
+    # Holding the lease until the response is done keeps a reload from
+    # closing the pipeline under a request that is still using it.
+    async with pipeline_holder.lease() as pipeline:
+        yield pipeline
+
+
+def get_job_workers() -> ExtractionJobWorkerPool:
+    if job_workers is None:
+        raise HTTPException(status_code=404, detail="Jobs desativados")
+    return job_workers
+
+
+def get_use_case(
+    request: Request, pipeline: ExtractionPipeline = Depends(get_pipeline)
+) -> ExtractIncidentInfoUseCase:
+    if timing_requested(request):
+        request.state.timings = RequestTimings(delegate=pipeline.metrics)
+        return pipeline.use_case.with_metrics(request.state.timings)
+
+    return pipeline.use_case
 
 
 @app.post(
@@ -78,34 +209,67 @@ def get_use_case() -> ExtractIncidentInfoUseCase:
     response_model=IncidentResponse,
     responses={
         400: {"model": ErrorResponse, "description": "Bad Request"},
+        413: {"model": ErrorResponse, "description": "Payload Too Large"},
         500: {"model": ErrorResponse, "description": "Internal Server Error"},
+        503: {"model": ErrorResponse, "description": "Service Unavailable"},
     },
     summary="Extrai informações de um incidente",
     description="Processa um texto descrevendo um incidente e extrai informações estruturadas usando um modelo de linguagem local.",
 )
 async def extract_incident_info(
     request: IncidentRequest,
+    http_request: Request,
+    response: Response,
     use_case: ExtractIncidentInfoUseCase = Depends(get_use_case),
+    settings: Settings = Depends(get_settings),
+    cache_control: Optional[str] = Header(None),
 ) -> IncidentResponse:
+    started = time.perf_counter()
+
+    if len(request.text) > settings.max_input_chars:
+        logger.warning("Input text too long", text_length=len(request.text))
+        raise HTTPException(
+            status_code=413,
+            detail=input_too_long_message(len(request.text), settings.max_input_chars),
+        )
+
     try:
         logger.info(
             "Processing incident extraction request", text_length=len(request.text)
         )
 
-        incident_text = IncidentText(content=request.text)
-        incident_info = await use_case.execute(incident_text)
+        incident_text = IncidentText(
+            content=request.text, reference_time=request.resolved_reference_time()
+        )
+        incident_info = await use_case.execute(
+            incident_text, cache_policy=cache_policy_from_header(cache_control)
+        )
 
         response_data = incident_info.to_dict()
         logger.info(
             "Successfully extracted incident information", response=response_data
         )
 
+        timings: Optional[RequestTimings] = getattr(http_request.state, "timings", None)
+        if timings is not None:
+            response.headers["Server-Timing"] = timings.server_timing(
+                time.perf_counter() - started
+            )
+
         return IncidentResponse(**response_data)
 
     except ValueError as e:
         logger.warning("Invalid input", error=str(e))
         raise HTTPException(status_code=400, detail=str(e))
 
+    except ServiceOverloadedError as e:
+        logger.warning("LLM service overloaded", error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail=f"Serviço sobrecarregado: {e}",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
     except LLMServiceError as e:
         logger.error("LLM service error", error=str(e))
         raise HTTPException(status_code=500, detail=f"Erro no serviço LLM: {e}")
@@ -127,8 +291,309 @@ async def extract_incident_info(
         raise HTTPException(status_code=500, detail="Erro interno do servidor")
 
 
+def error_to_dict(error: Optional[BaseException]) -> Dict[str, Any]:
+    if isinstance(error, (ValueError, IncidentExtractorError)):
+        detail = str(error)
+    else:
+        logger.error("Unexpected error during extraction", error=str(error))
+        detail = "Erro interno do servidor"
+
+    return {"detail": detail, "error_type": type(error).__name__}
+
+
+def batch_result_to_dict(result: BatchItemResult) -> Dict[str, Any]:
+    if result.incident_info is not None:
+        return {"index": result.index, "result": result.incident_info.to_dict()}
+
+    return {"index": result.index, "error": error_to_dict(result.error)}
+
+
+@app.post(
+    "/extract/batch",
+    response_class=NdjsonStreamingResponse,
+    summary="Extrai informações de vários incidentes",
+    description="Recebe um array JSON ou NDJSON de textos (ou objetos com o campo `text`) e retorna um NDJSON com um resultado por item, na ordem em que forem concluídos, identificado pelo índice de entrada.",
+)
+async def extract_incident_info_batch(
+    request: Request,
+    use_case: ExtractIncidentInfoUseCase = Depends(get_use_case),
+    settings: Settings = Depends(get_settings),
+    cache_control: Optional[str] = Header(None),
+) -> NdjsonStreamingResponse:
+    batch_use_case = BatchExtractIncidentInfoUseCase(
+        use_case, max_concurrency=settings.batch_max_concurrency
+    )
+    cache_policy = cache_policy_from_header(cache_control)
+    body_consumed = asyncio.Event()
+
+    async def stream_results() -> AsyncGenerator[str, None]:
+        items = reject_long_items(
+            read_batch_items(signal_when_consumed(request.stream(), body_consumed)),
+            settings.max_input_chars,
+        )
+        async with aclosing(
+            batch_use_case.execute(items, cache_policy=cache_policy)
+        ) as results:
+            async for result in results:
+                line = json.dumps(batch_result_to_dict(result), ensure_ascii=False)
+                yield line + "\n"
+
+    logger.info("Processing batch extraction request")
+    return NdjsonStreamingResponse(stream_results(), body_consumed=body_consumed)
+
+
+def server_sent_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post(
+    "/extract/stream",
+    response_class=StreamingResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        413: {"model": ErrorResponse, "description": "Payload Too Large"},
+    },
+    summary="Extrai informações de um incidente em tempo real",
+    description="Retorna Server-Sent Events: um evento `field` para cada campo (`data_ocorrencia`, `local`, `tipo_incidente`, `impacto`) assim que o modelo termina de gerá-lo, e um evento `result` com a resposta final pós-processada. Falhas durante a geração chegam como um evento `error`.",
+)
+async def extract_incident_info_stream(
+    request: IncidentRequest,
+    use_case: ExtractIncidentInfoUseCase = Depends(get_use_case),
+    settings: Settings = Depends(get_settings),
+    cache_control: Optional[str] = Header(None),
+) -> StreamingResponse:
+    if len(request.text) > settings.max_input_chars:
+        logger.warning("Input text too long", text_length=len(request.text))
+        raise HTTPException(
+            status_code=413,
+            detail=input_too_long_message(len(request.text), settings.max_input_chars),
+        )
+
+    try:
+        incident_text = IncidentText(
+            content=request.text, reference_time=request.resolved_reference_time()
+        )
+    except ValueError as e:
+        logger.warning("Invalid input", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+    cache_policy = cache_policy_from_header(cache_control)
+
+    async def stream_events() -> AsyncIterator[str]:
+        # Once the first event is out the status code is fixed, so failures
+        # are reported in the stream itself.
+        try:
+            async with aclosing(
+                use_case.execute_stream(incident_text, cache_policy=cache_policy)
+            ) as events:
+                async for event in events:
+                    if isinstance(event, ExtractedField):
+                        yield server_sent_event(
+                            "field", {"field": event.name, "value": event.value}
+                        )
+                    else:
+                        response = IncidentResponse(**event.to_dict())
+                        yield server_sent_event("result", response.model_dump())
+        except Exception as e:
+            logger.warning("Streamed extraction failed", error=str(e))
+            yield server_sent_event("error", error_to_dict(e))
+
+    logger.info("Processing streamed extraction request", text_length=len(request.text))
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def job_to_response(job: Job) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        status=job.status.value,
+        attempts=job.attempts,
+        created_at=datetime.fromtimestamp(job.created_at, timezone.utc),
+        updated_at=datetime.fromtimestamp(job.updated_at, timezone.utc),
+        result=(
+            IncidentResponse(**job.result.to_dict()) if job.result is not None else None
+        ),
+        error=(
+            ErrorResponse(detail=job.error, error_type=job.error_type or "Exception")
+            if job.error is not None
+            else None
+        ),
+    )
+
+
+@app.post(
+    "/jobs",
+    status_code=202,
+    response_model=JobResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        404: {"model": ErrorResponse, "description": "Not Found"},
+        413: {"model": ErrorResponse, "description": "Payload Too Large"},
+    },
+    summary="Agenda a extração de um incidente",
+    description="Enfileira o texto para extração em segundo plano e retorna imediatamente o identificador do job, a ser consultado em `GET /jobs/{id}`.",
+)
+async def submit_job(
+    request: IncidentRequest,
+    response: Response,
+    workers: ExtractionJobWorkerPool = Depends(get_job_workers),
+    settings: Settings = Depends(get_settings),
+) -> JobResponse:
+    if len(request.text) > settings.max_input_chars:
+        logger.warning("Input text too long", text_length=len(request.text))
+        raise HTTPException(
+            status_code=413,
+            detail=input_too_long_message(len(request.text), settings.max_input_chars),
+        )
+
+    # Relative dates must be resolved against the submission time, not the
+    # moment a worker picks the job up.
+    try:
+        incident_text = IncidentText(
+            content=request.text,
+            reference_time=request.resolved_reference_time() or datetime.now(),
+        )
+    except ValueError as e:
+        logger.warning("Invalid input", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+    job = workers.submit(incident_text.content, incident_text.reference_time)
+    logger.info("Extraction job queued", job_id=job.id, text_length=len(request.text))
+
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job_to_response(job)
+
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse, "description": "Not Found"}},
+    summary="Consulta um job de extração",
+    description="Retorna a situação do job e, quando concluído, o resultado da extração ou o erro da última tentativa.",
+)
+async def get_job(
+    job_id: str, workers: ExtractionJobWorkerPool = Depends(get_job_workers)
+) -> JobResponse:
+    job = workers.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job não encontrado")
+    return job_to_response(job)
+
+
 @app.get(
     "/health", summary="Health check", description="Verifica se a API está funcionando"
 )
-async def health_check() -> Dict[str, str]:
+async def health_check(response: Response) -> Dict[str, str]:
+    pipeline = pipeline_holder.current
+    admission_service = pipeline.admission_service if pipeline else None
+    if admission_service is not None and admission_service.saturated:
+        response.status_code = 503
+        response.headers["Retry-After"] = str(admission_service.retry_after())
+        return {"status": "saturated", "message": "Incident Extractor API is saturated"}
+
     return {"status": "healthy", "message": "Incident Extractor API is running"}
+
+
+@app.get(
+    "/stats",
+    summary="Estatísticas",
+    description="Retorna contadores internos da API, como acertos e falhas do cache",
+)
+async def stats() -> Dict[str, Any]:
+    pipeline = pipeline_holder.current
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline não inicializado")
+
+    return {
+        "cache": pipeline.extraction_cache.stats()
+        if pipeline.extraction_cache
+        else None,
+        "coalescing": (
+            pipeline.coalescing_service.stats() if pipeline.coalescing_service else None
+        ),
+        "admission": (
+            pipeline.admission_service.stats() if pipeline.admission_service else None
+        ),
+        "host_limit": (
+            pipeline.host_limiter.stats() if pipeline.host_limiter else None
+        ),
+        "micro_batching": (
+            pipeline.micro_batcher.stats() if pipeline.micro_batcher else None
+        ),
+        "fast_path": (
+            pipeline.fast_path_extractor.stats()
+            if pipeline.fast_path_extractor
+            else None
+        ),
+        "backends": pipeline.backend_pool.stats() if pipeline.backend_pool else None,
+        "model_residency": (
+            pipeline.model_residency.stats() if pipeline.model_residency else None
+        ),
+        "field_aliases": (
+            pipeline.field_registry.stats() if pipeline.field_registry else None
+        ),
+        "jobs": job_workers.stats() if job_workers else None,
+    }
+
+
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Métricas Prometheus",
+    description="Histogramas de latência por etapa, erros por classe e contadores de tokens do Ollama no formato de texto do Prometheus",
+)
+async def metrics() -> PlainTextResponse:
+    pipeline = pipeline_holder.current
+    if pipeline is None or pipeline.metrics is None:
+        raise HTTPException(status_code=404, detail="Métricas desativadas")
+
+    return PlainTextResponse(
+        pipeline.metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.post(
+    "/admin/profile",
+    summary="Perfil do processo",
+    description="Captura por N segundos um perfil de CPU por amostragem (`mode=cpu`) ou a variação de memória com tracemalloc (`mode=memory`) do processo em execução",
+)
+async def profile(
+    mode: str = Query("cpu", pattern="^(cpu|memory)$"),
+    seconds: float = Query(10.0, gt=0, le=60),
+    settings: Settings = Depends(get_settings),
+) -> Dict[str, Any]:
+    if not settings.admin_profiling_enabled:
+        raise HTTPException(status_code=404, detail="Perfilamento desativado")
+    if profiling_lock.locked():
+        raise HTTPException(status_code=409, detail="Já existe um perfil em andamento")
+
+    async with profiling_lock:
+        logger.info("Capturing profile", mode=mode, seconds=seconds)
+        if mode == "cpu":
+            return await SamplingProfiler().profile(seconds)
+        return await capture_memory_snapshot(seconds)
+
+
+@app.post(
+    "/admin/reload",
+    summary="Recarrega a configuração",
+    description="Relê as variáveis de ambiente e o arquivo de `SETTINGS_FILE`, monta um novo pipeline de extração e o coloca em uso; requisições em andamento terminam no pipeline anterior",
+)
+async def reload_pipeline(
+    settings: Settings = Depends(get_settings),
+) -> Dict[str, Any]:
+    if not settings.admin_reload_enabled:
+        raise HTTPException(status_code=404, detail="Recarga desativada")
+
+    try:
+        new_settings = load_settings()
+        await pipeline_holder.reload(new_settings)
+    except (OSError, ValueError) as e:
+        logger.warning("Invalid settings on reload", error=str(e))
+        raise HTTPException(status_code=400, detail=f"Configuração inválida: {e}")
+
+    return {"status": "reloaded", "settings": asdict(new_settings)}
@@ -0,0 +1,445 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+import structlog
+
+from ...application.interfaces import LLMServiceInterface
+from ...application.use_cases import (
+    ExtractIncidentInfoUseCase,
+    ExtractionJobWorkerPool,
+    MicroBatchExtractor,
+)
+from ...domain.value_objects import ExtractionPrompt
+from ...infrastructure.cache import ExtractionResultCache, SqliteCacheStore
+from ...infrastructure.extractors import RuleBasedExtractor
+from ...infrastructure.jobs import SqliteJobQueue
+from ...infrastructure.metrics import PipelineMetrics
+from ...infrastructure.models import (
+    AdmissionControlledLLMService,
+    CoalescingLLMService,
+    HostConcurrencyLimitedLLMService,
+    OllamaBackend,
+    OllamaBackendPool,
+    OllamaModelResidency,
+    OllamaService,
+    parse_backend_configs,
+    parse_keep_alive,
+)
+from ...infrastructure.parsers import JsonParser
+from ...infrastructure.processors import (
+    FieldRegistry,
+    PortugueseTemporalExtractor,
+    SentenceWindowChunker,
+    TextPostprocessor,
+    TextPreprocessor,
+)
+from .schemas import incident_response_json_schema
+from .settings import Settings
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class ExtractionPipeline:
+    settings: Settings
+    use_case: ExtractIncidentInfoUseCase
+    llm_service: LLMServiceInterface
+    ollama_service: Optional[OllamaService] = None
+    backend_pool: Optional[OllamaBackendPool] = None
+    model_residency: Optional[OllamaModelResidency] = None
+    host_limiter: Optional[HostConcurrencyLimitedLLMService] = None
+    admission_service: Optional[AdmissionControlledLLMService] = None
+    coalescing_service: Optional[CoalescingLLMService] = None
+    extraction_cache: Optional[ExtractionResultCache] = None
+    fast_path_extractor: Optional[RuleBasedExtractor] = None
+    micro_batcher: Optional[MicroBatchExtractor] = None
+    field_registry: Optional[FieldRegistry] = None
+    metrics: Optional[PipelineMetrics] = None
+
+    async def close(self) -> None:
+        if self.ollama_service is not None:
+            await self.ollama_service.close()
+        if self.host_limiter is not None:
+            self.host_limiter.close()
+        if self.extraction_cache is not None:
+            self.extraction_cache.close()
+
+
+async def build_pipeline(
+    settings: Settings, metrics: Optional[PipelineMetrics] = None
+) -> ExtractionPipeline:
+    if settings.metrics_enabled and metrics is None:
+        metrics = PipelineMetrics()
+    elif not settings.metrics_enabled:
+        metrics = None
+
+    # Loaded before any connection is opened so a bad aliases file fails cleanly.
+    field_registry = build_field_registry(settings)
+    prompt = ExtractionPrompt.default_chat() if settings.ollama_api == "chat" else None
+
+    logger.info(
+        "Initializing Ollama service",
+        url=settings.ollama_base_url,
+        model=settings.ollama_model,
+        api=settings.ollama_api,
+    )
+    backend_pool = build_ollama_backend_pool(settings)
+    model_residency = OllamaModelResidency(
+        settings.ollama_model,
+        keep_alive=parse_keep_alive(settings.ollama_keep_alive),
+        keep_warm_interval=settings.ollama_keep_warm_interval,
+    )
+    ollama_service = OllamaService(
+        model=settings.ollama_model,
+        readiness_ttl=settings.ollama_readiness_ttl,
+        stream=settings.ollama_streaming,
+        response_schema=(
+            incident_response_json_schema()
+            if settings.ollama_structured_output
+            else None
+        ),
+        pool=backend_pool,
+        residency=model_residency,
+        chat_prefix=prompt.prefix_messages if prompt else None,
+        metrics=metrics,
+    )
+    await ollama_service.warmup()
+    if settings.ollama_preload:
+        await ollama_service.preload()
+
+    llm_service: LLMServiceInterface = ollama_service
+    try:
+        host_limiter = build_host_limiter(settings, llm_service)
+    except OSError:
+        await ollama_service.close()
+        raise
+    if host_limiter is not None:
+        llm_service = host_limiter
+    admission_service = build_admission_service(settings, llm_service)
+    if admission_service is not None:
+        llm_service = admission_service
+    coalescing_service = None
+    if settings.coalescing_enabled:
+        coalescing_service = CoalescingLLMService(llm_service)
+        llm_service = coalescing_service
+
+    json_parser = JsonParser(repair=settings.json_repair_enabled)
+    extraction_cache = build_extraction_cache(settings)
+    fast_path_extractor = build_fast_path_extractor(settings)
+    micro_batcher = build_micro_batcher(settings, llm_service, json_parser)
+
+    use_case = ExtractIncidentInfoUseCase(
+        llm_service=llm_service,
+        text_preprocessor=TextPreprocessor(),
+        json_parser=json_parser,
+        text_postprocessor=TextPostprocessor(field_registry),
+        result_cache=extraction_cache,
+        prompt=prompt,
+        fast_path_extractor=fast_path_extractor,
+        structured_output=settings.ollama_structured_output,
+        micro_batcher=micro_batcher,
+        text_chunker=build_text_chunker(settings),
+        max_chunk_concurrency=settings.long_text_chunk_concurrency,
+        metrics=metrics,
+        temporal_extractor=(
+            PortugueseTemporalExtractor()
+            if settings.temporal_extraction_enabled
+            else None
+        ),
+        # The chat prefix is sent as fixed messages, so only the generate
+        # prompt can drop the date instructions per request.
+        dateless_prompt=(
+            ExtractionPrompt.default_without_date()
+            if settings.temporal_extraction_enabled and prompt is None
+            else None
+        ),
+    )
+
+    return ExtractionPipeline(
+        settings=settings,
+        use_case=use_case,
+        llm_service=llm_service,
+        ollama_service=ollama_service,
+        backend_pool=backend_pool,
+        model_residency=model_residency,
+        host_limiter=host_limiter,
+        admission_service=admission_service,
+        coalescing_service=coalescing_service,
+        extraction_cache=extraction_cache,
+        fast_path_extractor=fast_path_extractor,
+        micro_batcher=micro_batcher,
+        field_registry=field_registry,
+        metrics=metrics,
+    )
+
+
+def changed_settings(previous: Settings, current: Settings) -> List[str]:
+    return [
+        field.name
+        for field in fields(Settings)
+        if getattr(previous, field.name) != getattr(current, field.name)
+    ]
+
+
+def build_extraction_cache(settings: Settings) -> Optional[ExtractionResultCache]:
+    if not settings.cache_enabled:
+        return None
+
+    store = (
+        SqliteCacheStore(settings.cache_path, settings.cache_ttl_seconds)
+        if settings.cache_path
+        else None
+    )
+
+    logger.info(
+        "Initializing extraction cache",
+        max_entries=settings.cache_max_entries,
+        ttl_seconds=settings.cache_ttl_seconds,
+        path=settings.cache_path,
+    )
+    return ExtractionResultCache(
+        model=settings.ollama_model,
+        max_entries=settings.cache_max_entries,
+        ttl_seconds=settings.cache_ttl_seconds,
+        store=store,
+    )
+
+
+def build_fast_path_extractor(settings: Settings) -> Optional[RuleBasedExtractor]:
+    if not settings.fast_path_enabled:
+        return None
+
+    logger.info(
+        "Initializing rule-based fast path",
+        min_confidence=settings.fast_path_min_confidence,
+        sample_rate=settings.fast_path_sample_rate,
+    )
+    return RuleBasedExtractor(
+        min_confidence=settings.fast_path_min_confidence,
+        sample_rate=settings.fast_path_sample_rate,
+    )
+
+
+def build_ollama_backend_pool(settings: Settings) -> OllamaBackendPool:
+    configs = parse_backend_configs(
+        settings.ollama_base_url,
+        max_in_flight=settings.backend_max_in_flight,
+        max_connections=settings.backend_max_connections,
+    )
+
+    logger.info(
+        "Initializing Ollama backends",
+        backends=[config.base_url for config in configs],
+    )
+    return OllamaBackendPool(
+        [
+            OllamaBackend.from_config(config, timeout=settings.ollama_timeout)
+            for config in configs
+        ],
+        health_check_interval=settings.health_check_interval,
+        failure_threshold=settings.backend_failure_threshold,
+        model=settings.ollama_model,
+    )
+
+
+def build_host_limiter(
+    settings: Settings, llm_service: LLMServiceInterface
+) -> Optional[HostConcurrencyLimitedLLMService]:
+    if not settings.host_limit_enabled:
+        return None
+
+    logger.info(
+        "Initializing host-wide LLM concurrency limit",
+        max_concurrency=settings.host_max_concurrency,
+        lock_dir=settings.host_lock_dir,
+        queue_timeout=settings.host_queue_timeout,
+    )
+    return HostConcurrencyLimitedLLMService(
+        llm_service,
+        lock_dir=settings.host_lock_dir,
+        max_concurrency=settings.host_max_concurrency,
+        acquire_timeout=settings.host_queue_timeout,
+    )
+
+
+def build_admission_service(
+    settings: Settings, llm_service: LLMServiceInterface
+) -> Optional[AdmissionControlledLLMService]:
+    if not settings.admission_enabled:
+        return None
+
+    logger.info(
+        "Initializing LLM admission control",
+        max_concurrency=settings.llm_max_concurrency,
+        max_queue_depth=settings.llm_max_queue_depth,
+        queue_timeout=settings.llm_queue_timeout,
+    )
+    return AdmissionControlledLLMService(
+        llm_service,
+        max_concurrency=settings.llm_max_concurrency,
+        max_queue_depth=settings.llm_max_queue_depth,
+        queue_timeout=settings.llm_queue_timeout,
+    )
+
+
+def build_micro_batcher(
+    settings: Settings, llm_service: LLMServiceInterface, json_parser: JsonParser
+) -> Optional[MicroBatchExtractor]:
+    if not settings.micro_batch_enabled:
+        return None
+
+    if settings.ollama_structured_output or settings.ollama_api == "chat":
+        logger.warning(
+            "Micro-batching is disabled with structured output or the chat API"
+        )
+        return None
+
+    logger.info(
+        "Initializing micro-batching",
+        max_batch_size=settings.micro_batch_max_size,
+        max_wait_ms=settings.micro_batch_max_wait_ms,
+    )
+    return MicroBatchExtractor(
+        llm_service,
+        json_parser,
+        max_batch_size=settings.micro_batch_max_size,
+        max_wait=settings.micro_batch_max_wait_ms / 1000,
+    )
+
+
+def build_field_registry(settings: Settings) -> FieldRegistry:
+    if not settings.field_aliases_path:
+        return FieldRegistry(threshold=settings.field_match_threshold)
+
+    logger.info("Loading field aliases", path=settings.field_aliases_path)
+    return FieldRegistry.from_file(
+        settings.field_aliases_path, threshold=settings.field_match_threshold
+    )
+
+
+def build_text_chunker(settings: Settings) -> Optional[SentenceWindowChunker]:
+    if not settings.long_text_enabled:
+        return None
+
+    logger.info(
+        "Initializing long text chunking", max_tokens=settings.long_text_max_tokens
+    )
+    return SentenceWindowChunker(max_tokens=settings.long_text_max_tokens)
+
+
+def build_job_worker_pool(
+    settings: Settings, holder: "PipelineHolder"
+) -> Optional[ExtractionJobWorkerPool]:
+    if not settings.jobs_enabled:
+        return None
+
+    @asynccontextmanager
+    async def leased_use_case() -> AsyncIterator[ExtractIncidentInfoUseCase]:
+        # Jobs exist for extractions that outlive a request, so the generation
+        # is streamed and OLLAMA_TIMEOUT_SECONDS only bounds the gap between
+        # tokens.
+        async with holder.lease() as pipeline:
+            yield pipeline.use_case.with_streamed_generation()
+
+    def log_loop_error(loop: str, error: Exception, delay: float) -> None:
+        logger.error(
+            "Extraction job loop failed, backing off",
+            loop=loop,
+            error=str(error),
+            error_type=type(error).__name__,
+            delay=delay,
+        )
+
+    logger.info(
+        "Initializing extraction job workers",
+        path=settings.jobs_path,
+        concurrency=settings.jobs_concurrency,
+        max_attempts=settings.jobs_max_attempts,
+    )
+    return ExtractionJobWorkerPool(
+        SqliteJobQueue(settings.jobs_path, ttl_seconds=settings.jobs_ttl_seconds),
+        leased_use_case,
+        concurrency=settings.jobs_concurrency,
+        max_attempts=settings.jobs_max_attempts,
+        retry_backoff=settings.jobs_retry_backoff,
+        on_loop_error=log_loop_error,
+    )
+
+
+class PipelineHolder:
+    def __init__(self, drain_timeout: float = 60.0) -> None:
+        self._current: Optional[ExtractionPipeline] = None
+        self._drain_timeout = drain_timeout
+        self._in_flight: Dict[int, int] = {}
+        self._drained: Dict[int, asyncio.Event] = {}
+        self._retiring: Set["asyncio.Task[None]"] = set()
+        self._reload_lock = asyncio.Lock()
+
+    @property
+    def current(self) -> Optional[ExtractionPipeline]:
+        return self._current
+
+    def install(self, pipeline: Optional[ExtractionPipeline]) -> None:
+        self._current = pipeline
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[ExtractionPipeline]:
+        pipeline = self._current
+        if pipeline is None:
+            raise RuntimeError("Extraction pipeline not initialized")
+
+        key = id(pipeline)
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        try:
+            yield pipeline
+        finally:
+            self._in_flight[key] -= 1
+            if self._in_flight[key] == 0:
+                del self._in_flight[key]
+                drained = self._drained.pop(key, None)
+                if drained is not None:
+                    drained.set()
+
+    async def reload(self, settings: Settings) -> ExtractionPipeline:
+        async with self._reload_lock:
+            previous = self._current
+            # The new pipeline is fully built and warmed up before it becomes
+            # visible; requests already holding the old one finish on it.
+            pipeline = await build_pipeline(
+                settings, metrics=previous.metrics if previous else None
+            )
+            self._current = pipeline
+
+            if previous is not None:
+                task = asyncio.create_task(self._retire(previous))
+                self._retiring.add(task)
+                task.add_done_callback(self._retiring.discard)
+
+            logger.info(
+                "Extraction pipeline reloaded",
+                changed=changed_settings(previous.settings, settings)
+                if previous
+                else [],
+            )
+            return pipeline
+
+    async def close(self) -> None:
+        await asyncio.gather(*self._retiring, return_exceptions=True)
+        if self._current is not None:
+            await self._current.close()
+            self._current = None
+
+    async def _retire(self, pipeline: ExtractionPipeline) -> None:
+        key = id(pipeline)
+        if self._in_flight.get(key):
+            drained = self._drained.setdefault(key, asyncio.Event())
+            try:
+                await asyncio.wait_for(drained.wait(), self._drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Closing previous pipeline with requests still in flight",
+                    in_flight=self._in_flight.get(key, 0),
+                )
+        await pipeline.close()
@@ -1,6 +1,8 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class IncidentRequest(BaseModel):
@@ -13,6 +15,34 @@ class IncidentRequest(BaseModel):
     )
 
     text: str = Field(..., min_length=1, description="Texto descrevendo o incidente")
+    reference_time: Optional[datetime] = Field(
+        None,
+        description="Data e hora de referência para resolver datas relativas como 'ontem' (padrão: agora)",
+    )
+    timezone: Optional[str] = Field(
+        None, description="Fuso horário IANA da data de referência, ex.: America/Recife"
+    )
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            try:
+                ZoneInfo(value)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise ValueError(f"Unknown timezone: {value}")
+        return value
+
+    def resolved_reference_time(self) -> Optional[datetime]:
+        if self.timezone is None:
+            return self.reference_time
+
+        zone = ZoneInfo(self.timezone)
+        if self.reference_time is None:
+            return datetime.now(zone)
+        if self.reference_time.tzinfo is None:
+            return self.reference_time.replace(tzinfo=zone)
+        return self.reference_time.astimezone(zone)
 
 
 class IncidentResponse(BaseModel):
@@ -35,6 +65,49 @@ class IncidentResponse(BaseModel):
     impacto: str = Field(..., description="Descrição do impacto gerado")
 
 
+def incident_response_json_schema() -> Dict[str, Any]:
+    schema = IncidentResponse.model_json_schema()
+    schema.pop("example", None)
+    schema["required"] = list(IncidentResponse.model_fields)
+    return schema
+
+
 class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Descrição do erro")
     error_type: str = Field(..., description="Tipo do erro")
+
+
+class JobResponse(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "3f0c2a9e8b7d4c1e9a6b5d4c3b2a1f0e",
+                "status": "succeeded",
+                "attempts": 1,
+                "created_at": "2025-08-15T12:00:00Z",
+                "updated_at": "2025-08-15T12:00:42Z",
+                "result": {
+                    "data_ocorrencia": "2025-08-13 05:00",
+                    "local": "Pernambuco",
+                    "tipo_incidente": "Falha no servidor",
+                    "impacto": "Sistema de notas indisponível por 5 horas",
+                },
+                "error": None,
+            }
+        }
+    )
+
+    id: str = Field(..., description="Identificador do job")
+    status: str = Field(
+        ...,
+        description="Situação do job: queued, running, succeeded, failed ou expired",
+    )
+    attempts: int = Field(..., description="Tentativas de extração já iniciadas")
+    created_at: datetime = Field(..., description="Momento em que o job foi criado")
+    updated_at: datetime = Field(..., description="Última mudança de situação")
+    result: Optional[IncidentResponse] = Field(
+        None, description="Informações extraídas, quando o job termina com sucesso"
+    )
+    error: Optional[ErrorResponse] = Field(
+        None, description="Erro da última tentativa, quando houver"
+    )
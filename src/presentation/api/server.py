@@ -0,0 +1,46 @@
+import argparse
+import os
+from typing import Optional, Sequence
+
+import structlog
+import uvicorn
+
+logger = structlog.get_logger()
+
+APP = "src.presentation.api.main:app"
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Executa a Incident Extractor API")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        help="Número de processos (padrão: WEB_CONCURRENCY ou 1)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+
+    if args.workers > 1:
+        # Every worker builds its own pipeline and admission control; only the
+        # host-wide limit keeps their combined load on Ollama bounded. Workers
+        # inherit the environment, so the default reaches all of them.
+        os.environ.setdefault("LLM_HOST_LIMIT_ENABLED", "true")
+
+    logger.info(
+        "Starting API server",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        host_limit_enabled=os.environ.get("LLM_HOST_LIMIT_ENABLED", "false"),
+    )
+    uvicorn.run(APP, host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class Settings:
+    ollama_base_url: str = "http://localhost:11434"
+    ollama_model: str = "tinyllama"
+    ollama_api: str = "generate"
+    ollama_timeout: float = 30.0
+    ollama_readiness_ttl: float = 300.0
+    ollama_streaming: bool = False
+    ollama_structured_output: bool = False
+    ollama_preload: bool = True
+    ollama_keep_alive: Optional[str] = None
+    ollama_keep_warm_interval: float = 0.0
+    backend_max_in_flight: int = 4
+    backend_max_connections: int = 10
+    health_check_interval: float = 10.0
+    backend_failure_threshold: int = 3
+    admission_enabled: bool = True
+    llm_max_concurrency: int = 4
+    llm_max_queue_depth: int = 32
+    llm_queue_timeout: float = 20.0
+    host_limit_enabled: bool = False
+    host_max_concurrency: int = 4
+    host_lock_dir: str = os.path.join(
+        tempfile.gettempdir(), "incident-extractor-llm-slots"
+    )
+    host_queue_timeout: float = 20.0
+    coalescing_enabled: bool = True
+    micro_batch_enabled: bool = False
+    micro_batch_max_size: int = 8
+    micro_batch_max_wait_ms: float = 10.0
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_ttl_seconds: float = 3600.0
+    cache_path: Optional[str] = None
+    fast_path_enabled: bool = False
+    fast_path_min_confidence: float = 0.8
+    fast_path_sample_rate: float = 0.0
+    json_repair_enabled: bool = True
+    temporal_extraction_enabled: bool = True
+    field_aliases_path: Optional[str] = None
+    field_match_threshold: float = 0.6
+    batch_max_concurrency: int = 4
+    long_text_enabled: bool = True
+    long_text_max_tokens: int = 384
+    long_text_chunk_concurrency: int = 4
+    max_input_chars: int = 20000
+    jobs_enabled: bool = False
+    jobs_path: str = "jobs.db"
+    jobs_concurrency: int = 2
+    jobs_max_attempts: int = 3
+    jobs_retry_backoff: float = 2.0
+    jobs_ttl_seconds: float = 86400.0
+    metrics_enabled: bool = True
+    admin_profiling_enabled: bool = False
+    admin_reload_enabled: bool = False
+
+    def __post_init__(self) -> None:
+        if self.ollama_api not in ("generate", "chat"):
+            raise ValueError(f"Unsupported OLLAMA_API: {self.ollama_api}")
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        env = _Env(os.environ if environ is None else environ)
+
+        return cls(
+            ollama_base_url=env.text("OLLAMA_BASE_URL", cls.ollama_base_url),
+            ollama_model=env.text("OLLAMA_MODEL", cls.ollama_model),
+            ollama_api=env.text("OLLAMA_API", cls.ollama_api).lower(),
+            ollama_timeout=env.number("OLLAMA_TIMEOUT_SECONDS", cls.ollama_timeout),
+            ollama_readiness_ttl=env.number(
+                "OLLAMA_READINESS_TTL_SECONDS", cls.ollama_readiness_ttl
+            ),
+            ollama_streaming=env.flag("OLLAMA_STREAMING", cls.ollama_streaming),
+            ollama_structured_output=env.flag(
+                "OLLAMA_STRUCTURED_OUTPUT", cls.ollama_structured_output
+            ),
+            ollama_preload=env.flag("OLLAMA_PRELOAD", cls.ollama_preload),
+            ollama_keep_alive=env.optional("OLLAMA_KEEP_ALIVE"),
+            ollama_keep_warm_interval=env.number(
+                "OLLAMA_KEEP_WARM_INTERVAL_SECONDS", cls.ollama_keep_warm_interval
+            ),
+            backend_max_in_flight=env.integer(
+                "OLLAMA_BACKEND_MAX_IN_FLIGHT", cls.backend_max_in_flight
+            ),
+            backend_max_connections=env.integer(
+                "OLLAMA_BACKEND_MAX_CONNECTIONS", cls.backend_max_connections
+            ),
+            health_check_interval=env.number(
+                "OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS", cls.health_check_interval
+            ),
+            backend_failure_threshold=env.integer(
+                "OLLAMA_BACKEND_FAILURE_THRESHOLD", cls.backend_failure_threshold
+            ),
+            admission_enabled=env.flag("LLM_ADMISSION_ENABLED", cls.admission_enabled),
+            llm_max_concurrency=env.integer(
+                "LLM_MAX_CONCURRENCY", cls.llm_max_concurrency
+            ),
+            llm_max_queue_depth=env.integer(
+                "LLM_MAX_QUEUE_DEPTH", cls.llm_max_queue_depth
+            ),
+            llm_queue_timeout=env.number(
+                "LLM_QUEUE_TIMEOUT_SECONDS", cls.llm_queue_timeout
+            ),
+            host_limit_enabled=env.flag(
+                "LLM_HOST_LIMIT_ENABLED", cls.host_limit_enabled
+            ),
+            host_max_concurrency=env.integer(
+                "LLM_HOST_MAX_CONCURRENCY", cls.host_max_concurrency
+            ),
+            host_lock_dir=env.text("LLM_HOST_LOCK_DIR", cls.host_lock_dir),
+            host_queue_timeout=env.number(
+                "LLM_HOST_QUEUE_TIMEOUT_SECONDS", cls.host_queue_timeout
+            ),
+            coalescing_enabled=env.flag(
+                "LLM_COALESCING_ENABLED", cls.coalescing_enabled
+            ),
+            micro_batch_enabled=env.flag(
+                "MICRO_BATCH_ENABLED", cls.micro_batch_enabled
+            ),
+            micro_batch_max_size=env.integer(
+                "MICRO_BATCH_MAX_SIZE", cls.micro_batch_max_size
+            ),
+            micro_batch_max_wait_ms=env.number(
+                "MICRO_BATCH_MAX_WAIT_MS", cls.micro_batch_max_wait_ms
+            ),
+            cache_enabled=env.flag("EXTRACTION_CACHE_ENABLED", cls.cache_enabled),
+            cache_max_entries=env.integer(
+                "EXTRACTION_CACHE_MAX_ENTRIES", cls.cache_max_entries
+            ),
+            cache_ttl_seconds=env.number(
+                "EXTRACTION_CACHE_TTL_SECONDS", cls.cache_ttl_seconds
+            ),
+            cache_path=env.optional("EXTRACTION_CACHE_PATH"),
+            fast_path_enabled=env.flag("FAST_PATH_ENABLED", cls.fast_path_enabled),
+            fast_path_min_confidence=env.number(
+                "FAST_PATH_MIN_CONFIDENCE", cls.fast_path_min_confidence
+            ),
+            fast_path_sample_rate=env.number(
+                "FAST_PATH_SAMPLE_RATE", cls.fast_path_sample_rate
+            ),
+            json_repair_enabled=env.flag(
+                "JSON_REPAIR_ENABLED", cls.json_repair_enabled
+            ),
+            temporal_extraction_enabled=env.flag(
+                "TEMPORAL_EXTRACTION_ENABLED", cls.temporal_extraction_enabled
+            ),
+            field_aliases_path=env.optional("FIELD_ALIASES_PATH"),
+            field_match_threshold=env.number(
+                "FIELD_MATCH_THRESHOLD", cls.field_match_threshold
+            ),
+            batch_max_concurrency=env.integer(
+                "EXTRACT_BATCH_CONCURRENCY", cls.batch_max_concurrency
+            ),
+            long_text_enabled=env.flag("LONG_TEXT_ENABLED", cls.long_text_enabled),
+            long_text_max_tokens=env.integer(
+                "LONG_TEXT_MAX_TOKENS", cls.long_text_max_tokens
+            ),
+            long_text_chunk_concurrency=env.integer(
+                "LONG_TEXT_CHUNK_CONCURRENCY", cls.long_text_chunk_concurrency
+            ),
+            max_input_chars=env.integer("MAX_INPUT_CHARS", cls.max_input_chars),
+            jobs_enabled=env.flag("JOBS_ENABLED", cls.jobs_enabled),
+            jobs_path=env.text("JOBS_DB_PATH", cls.jobs_path),
+            jobs_concurrency=env.integer("JOBS_CONCURRENCY", cls.jobs_concurrency),
+            jobs_max_attempts=env.integer("JOBS_MAX_ATTEMPTS", cls.jobs_max_attempts),
+            jobs_retry_backoff=env.number(
+                "JOBS_RETRY_BACKOFF_SECONDS", cls.jobs_retry_backoff
+            ),
+            jobs_ttl_seconds=env.number("JOBS_TTL_SECONDS", cls.jobs_ttl_seconds),
+            metrics_enabled=env.flag("METRICS_ENABLED", cls.metrics_enabled),
+            admin_profiling_enabled=env.flag(
+                "ADMIN_PROFILING_ENABLED", cls.admin_profiling_enabled
+            ),
+            admin_reload_enabled=env.flag(
+                "ADMIN_RELOAD_ENABLED", cls.admin_reload_enabled
+            ),
+        )
+
+
+def load_settings(environ: Optional[Mapping[str, str]] = None) -> Settings:
+    # SETTINGS_FILE holds KEY=VALUE lines layered over the environment, so a
+    # reload can pick up new values without restarting the process.
+    env: Dict[str, str] = dict(os.environ if environ is None else environ)
+    path = env.get("SETTINGS_FILE")
+    if path:
+        env.update(read_settings_file(path))
+    return Settings.from_env(env)
+
+
+def read_settings_file(path: str) -> Dict[str, str]:
+    values: Dict[str, str] = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            values[key.strip()] = value.strip()
+    return values
+
+
+class _Env:
+    def __init__(self, environ: Mapping[str, str]) -> None:
+        self._environ = environ
+
+    def text(self, name: str, default: str) -> str:
+        return self._environ.get(name) or default
+
+    def optional(self, name: str) -> Optional[str]:
+        return self._environ.get(name) or None
+
+    def flag(self, name: str, default: bool) -> bool:
+        value = self._environ.get(name)
+        return default if not value else value.lower() == "true"
+
+    def integer(self, name: str, default: int) -> int:
+        value = self._environ.get(name)
+        return default if not value else int(value)
+
+    def number(self, name: str, default: float) -> float:
+        value = self._environ.get(name)
+        return default if not value else float(value)
@@ -1,10 +1,28 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
+
+from src.application.use_cases import ExtractIncidentInfoUseCase
+from src.infrastructure.parsers import JsonParser
+from src.infrastructure.processors import TextPostprocessor, TextPreprocessor
+from src.presentation.api.main import pipeline_holder
+from src.presentation.api.pipeline import ExtractionPipeline
+from src.presentation.api.settings import Settings
 
 @pytest.fixture(autouse=True, scope="session")
 def mock_ollama_service():
     mock_service = AsyncMock()
     mock_service.close = AsyncMock()
-    
-    with patch("src.presentation.api.main.ollama_service", mock_service):
-        yield mock_service
\ No newline at end of file
+    use_case = ExtractIncidentInfoUseCase(
+        llm_service=mock_service,
+        text_preprocessor=TextPreprocessor(),
+        json_parser=JsonParser(),
+        text_postprocessor=TextPostprocessor(),
+    )
+
+    pipeline_holder.install(
+        ExtractionPipeline(settings=Settings(), use_case=use_case, llm_service=mock_service)
+    )
+    try:
+        yield mock_service
+    finally:
+        pipeline_holder.install(None)
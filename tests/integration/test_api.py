@@ -1,8 +1,23 @@
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Iterator
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
 from src.presentation.api import app
-from src.presentation.api.main import get_use_case
+from src.presentation.api.main import get_settings, get_use_case, pipeline_holder
+from src.presentation.api.settings import Settings
+
+
+@contextmanager
+def installed_pipeline(**overrides: Any) -> Iterator[None]:
+    previous = pipeline_holder.current
+    assert previous is not None
+    pipeline_holder.install(replace(previous, **overrides))
+    try:
+        yield
+    finally:
+        pipeline_holder.install(previous)
 
 
 class TestIncidentExtractorAPI:
@@ -81,4 +96,379 @@ class TestIncidentExtractorAPI:
             assert response.status_code == 500
             assert "Erro no serviço LLM" in response.json()["detail"]
         finally:
-            app.dependency_overrides.clear()
\ No newline at end of file
+            app.dependency_overrides.clear()
+
+    def test_extract_overloaded_returns_503_with_retry_after(self) -> None:
+        from src.domain.exceptions import ServiceOverloadedError
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute.side_effect = ServiceOverloadedError(
+            "LLM request queue is full", retry_after=7
+        )
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        try:
+            client = TestClient(app)
+            response = client.post("/extract", json={"text": "Falha no servidor"})
+
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "7"
+            assert "Serviço sobrecarregado" in response.json()["detail"]
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_extract_rejects_text_over_max_input_chars(self) -> None:
+        mock_use_case = AsyncMock()
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        app.dependency_overrides[get_settings] = lambda: Settings(max_input_chars=10)
+        try:
+            client = TestClient(app)
+            response = client.post("/extract", json={"text": "Falha no servidor"})
+
+            assert response.status_code == 413
+            assert "excede o limite de 10" in response.json()["detail"]
+            mock_use_case.execute.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_metrics_endpoint_exposes_prometheus_text(self) -> None:
+        from src.infrastructure.metrics import PipelineMetrics
+
+        metrics = PipelineMetrics()
+        metrics.observe_stage("llm", 0.2)
+
+        with installed_pipeline(metrics=metrics):
+            client = TestClient(app)
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'incident_extractor_stage_duration_seconds_count{stage="llm"} 1' in response.text
+
+    def test_debug_timing_returns_server_timing_header(self) -> None:
+        llm = AsyncMock()
+        llm.generate_response.return_value = (
+            '{"data_ocorrencia": null, "local": "Recife", '
+            '"tipo_incidente": "Falha", "impacto": "Lentidão"}'
+        )
+
+        from src.application.use_cases import ExtractIncidentInfoUseCase
+        from src.infrastructure.parsers import JsonParser
+        from src.infrastructure.processors import TextPostprocessor, TextPreprocessor
+
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=llm,
+            text_preprocessor=TextPreprocessor(),
+            json_parser=JsonParser(),
+            text_postprocessor=TextPostprocessor(),
+        )
+
+        with installed_pipeline(use_case=use_case, llm_service=llm):
+            client = TestClient(app)
+            plain = client.post("/extract", json={"text": "Falha em Recife"})
+            timed = client.post(
+                "/extract",
+                json={"text": "Falha em Recife"},
+                headers={"X-Debug-Timing": "1"},
+            )
+
+        assert "Server-Timing" not in plain.headers
+        stages = [entry.split(";")[0] for entry in timed.headers["Server-Timing"].split(", ")]
+        assert stages == ["preprocess", "prompt", "llm", "parse", "postprocess", "total"]
+
+    def test_admin_profile_requires_opt_in(self) -> None:
+        client = TestClient(app)
+        assert client.post("/admin/profile?seconds=0.01").status_code == 404
+
+        app.dependency_overrides[get_settings] = lambda: Settings(
+            admin_profiling_enabled=True
+        )
+        try:
+            response = client.post("/admin/profile?mode=memory&seconds=0.01")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert "top_growth" in response.json()
+
+    def test_admin_reload_requires_opt_in(self) -> None:
+        client = TestClient(app)
+
+        assert client.post("/admin/reload").status_code == 404
+
+    def test_jobs_are_queued_and_reported(self) -> None:
+        from src.application.use_cases import ExtractionJobWorkerPool
+        from src.infrastructure.jobs import SqliteJobQueue
+        from src.presentation.api.main import get_job_workers
+
+        workers = ExtractionJobWorkerPool(SqliteJobQueue(":memory:"), AsyncMock())
+        app.dependency_overrides[get_job_workers] = lambda: workers
+        try:
+            client = TestClient(app)
+            created = client.post("/jobs", json={"text": "Falha em Recife"})
+            job_id = created.json()["id"]
+            fetched = client.get(f"/jobs/{job_id}")
+            missing = client.get("/jobs/desconhecido")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert created.status_code == 202
+        assert created.headers["Location"] == f"/jobs/{job_id}"
+        assert fetched.json()["status"] == "queued"
+        assert fetched.json()["result"] is None
+        assert missing.status_code == 404
+
+    def test_blank_job_text_is_rejected(self) -> None:
+        from src.application.use_cases import ExtractionJobWorkerPool
+        from src.infrastructure.jobs import SqliteJobQueue
+        from src.presentation.api.main import get_job_workers
+
+        workers = ExtractionJobWorkerPool(SqliteJobQueue(":memory:"), AsyncMock())
+        app.dependency_overrides[get_job_workers] = lambda: workers
+        try:
+            response = TestClient(app).post("/jobs", json={"text": "   "})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 400
+        assert workers.stats()["queued"] == 0
+
+    def test_jobs_disabled_without_workers(self) -> None:
+        client = TestClient(app)
+
+        assert client.post("/jobs", json={"text": "Falha"}).status_code == 404
+
+    def test_health_reports_saturation(self) -> None:
+        saturated = AsyncMock()
+        saturated.saturated = True
+        saturated.retry_after = lambda: 3
+
+        with installed_pipeline(admission_service=saturated):
+            client = TestClient(app)
+            response = client.get("/health")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["status"] == "saturated"
+
+    def test_cache_control_header_selects_cache_policy(self) -> None:
+        from src.application.interfaces import CachePolicy
+        from src.domain.entities import IncidentInfo
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute.return_value = IncidentInfo(
+            data_ocorrencia=None,
+            local="São Paulo",
+            tipo_incidente="Falha no servidor",
+            impacto="Sistema indisponível"
+        )
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        try:
+            client = TestClient(app)
+            request_data = {"text": "Falha no servidor"}
+
+            client.post("/extract", json=request_data)
+            client.post("/extract", json=request_data, headers={"Cache-Control": "no-cache"})
+            client.post("/extract", json=request_data, headers={"Cache-Control": "no-store"})
+
+            policies = [
+                call.kwargs["cache_policy"] for call in mock_use_case.execute.call_args_list
+            ]
+            assert policies == [CachePolicy.USE, CachePolicy.REFRESH, CachePolicy.BYPASS]
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_stats_endpoint(self) -> None:
+        client = TestClient(app)
+        response = client.get("/stats")
+
+        assert response.status_code == 200
+        assert "cache" in response.json()
+
+
+    def test_extract_batch_streams_ndjson_results(self) -> None:
+        import json
+        from src.domain.entities import IncidentInfo
+        from src.domain.exceptions import LLMServiceError
+
+        async def execute(incident_text, cache_policy):
+            if incident_text.content == "erro":
+                raise LLMServiceError("Connection failed")
+            return IncidentInfo(None, incident_text.content, "Falha", "Nenhum")
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute.side_effect = execute
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        try:
+            client = TestClient(app)
+            body = '"São Paulo"\n"erro"\n{"text": "Recife"}\n'
+
+            response = client.post(
+                "/extract/batch",
+                content=body.encode("utf-8"),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            by_index = {line["index"]: line for line in lines}
+            assert by_index[0]["result"]["local"] == "São Paulo"
+            assert by_index[1]["error"]["error_type"] == "LLMServiceError"
+            assert by_index[2]["result"]["local"] == "Recife"
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_extract_batch_stops_when_client_disconnects(self) -> None:
+        import asyncio
+        from src.domain.entities import IncidentInfo
+
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        disconnected = asyncio.Event()
+
+        async def execute(incident_text, cache_policy):
+            if incident_text.content == "lento":
+                started.set()
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return IncidentInfo(None, incident_text.content, "Falha", "Nenhum")
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute.side_effect = execute
+
+        body = '"Recife"\n"lento"\n'.encode("utf-8")
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body" and message.get("body"):
+                await started.wait()
+                disconnected.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/extract/batch",
+            "raw_path": b"/extract/batch",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/x-ndjson")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        try:
+            await asyncio.wait_for(app(scope, receive, send), timeout=5)
+        finally:
+            app.dependency_overrides.clear()
+
+        assert cancelled.is_set()
+        bodies = [m["body"] for m in sent if m["type"] == "http.response.body"]
+        assert b"".join(bodies).count(b"\n") == 1
+
+    def test_extract_stream_sends_fields_then_result(self) -> None:
+        import json
+        from unittest.mock import Mock
+        from src.application.use_cases import ExtractedField
+        from src.domain.entities import IncidentInfo
+        from src.domain.exceptions import LLMServiceError
+
+        async def execute_stream(incident_text, cache_policy):
+            yield ExtractedField("local", "Recife")
+            if incident_text.content == "erro":
+                raise LLMServiceError("Connection failed")
+            yield IncidentInfo(None, "Recife", "Falha", "Nenhum")
+
+        mock_use_case = Mock()
+        mock_use_case.execute_stream = execute_stream
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        try:
+            client = TestClient(app)
+
+            response = client.post("/extract/stream", json={"text": "Falha em Recife"})
+            failed = client.post("/extract/stream", json={"text": "erro"})
+
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                (block.split("\n")[0], json.loads(block.split("\n")[1][len("data: "):]))
+                for block in response.text.strip().split("\n\n")
+            ]
+            assert events == [
+                ("event: field", {"field": "local", "value": "Recife"}),
+                (
+                    "event: result",
+                    {
+                        "data_ocorrencia": None,
+                        "local": "Recife",
+                        "tipo_incidente": "Falha",
+                        "impacto": "Nenhum",
+                    },
+                ),
+            ]
+            assert failed.status_code == 200
+            assert "event: error" in failed.text
+            assert "LLMServiceError" in failed.text
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_extract_stream_rejects_text_over_max_input_chars(self) -> None:
+        app.dependency_overrides[get_settings] = lambda: Settings(max_input_chars=5)
+        try:
+            client = TestClient(app)
+            response = client.post("/extract/stream", json={"text": "texto longo"})
+
+            assert response.status_code == 413
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_extract_passes_reference_time_to_use_case(self) -> None:
+        from src.domain.entities import IncidentInfo
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute.return_value = IncidentInfo(None, "Recife", "Falha", "Nenhum")
+
+        app.dependency_overrides[get_use_case] = lambda: mock_use_case
+        try:
+            client = TestClient(app)
+            response = client.post(
+                "/extract",
+                json={
+                    "text": "Ontem houve falha",
+                    "reference_time": "2025-08-15T10:00:00",
+                    "timezone": "America/Recife",
+                },
+            )
+
+            assert response.status_code == 200
+            incident_text = mock_use_case.execute.call_args.args[0]
+            assert incident_text.reference_time.isoformat() == "2025-08-15T10:00:00-03:00"
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_extract_rejects_unknown_timezone(self) -> None:
+        client = TestClient(app)
+        response = client.post(
+            "/extract", json={"text": "Falha", "timezone": "Mars/Olympus"}
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from typing import AsyncIterator, Tuple
+
+import httpx
+import pytest
+
+from src.application.interfaces import JobStatus
+from src.application.use_cases import ExtractIncidentInfoUseCase
+from src.domain.entities import IncidentText
+from src.domain.exceptions import LLMServiceError
+from src.infrastructure.models import OllamaService
+from src.infrastructure.parsers import JsonParser
+from src.infrastructure.processors import TextPostprocessor, TextPreprocessor
+from src.presentation.api.pipeline import (
+    ExtractionPipeline,
+    PipelineHolder,
+    build_job_worker_pool,
+)
+from src.presentation.api.settings import Settings
+
+TOKENS = ['{"local": "Recife"', ', "tipo_incidente": "Falha"', ', "impacto": "Lentidão"}']
+TOKEN_DELAY = 0.1
+CLIENT_TIMEOUT = 0.2
+
+
+async def slow_ollama(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Generates slower than the client timeout overall, but every token
+    # arrives well within it.
+    head = (await reader.readuntil(b"\r\n\r\n")).decode()
+    request_line, *header_lines = head.strip().split("\r\n")
+    path = request_line.split(" ")[1]
+    headers = {
+        name.lower(): value.strip()
+        for name, value in (line.split(":", 1) for line in header_lines)
+    }
+    body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+    def respond(content: bytes) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Connection: close\r\nContent-Length: %d\r\n\r\n" % len(content)
+        )
+        writer.write(content)
+
+    if path == "/api/tags":
+        respond(json.dumps({"models": [{"name": "tinyllama:latest"}]}).encode())
+    elif not json.loads(body)["stream"]:
+        await asyncio.sleep(TOKEN_DELAY * len(TOKENS))
+        respond(json.dumps({"response": "".join(TOKENS), "done": True}).encode())
+    else:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+            b"Connection: close\r\nTransfer-Encoding: chunked\r\n\r\n"
+        )
+        for token in TOKENS:
+            await asyncio.sleep(TOKEN_DELAY)
+            line = (json.dumps({"response": token, "done": False}) + "\n").encode()
+            writer.write(b"%x\r\n%s\r\n" % (len(line), line))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+
+    try:
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+    except ConnectionError:
+        pass
+
+
+@pytest.fixture
+async def ollama_url() -> AsyncIterator[str]:
+    server = await asyncio.start_server(slow_ollama, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    async with server:
+        yield f"http://{host}:{port}"
+
+
+class TestExtractionJobsWithSlowGeneration:
+    @pytest.mark.asyncio
+    async def test_generation_longer_than_client_timeout_succeeds_as_job(
+        self, ollama_url: str
+    ) -> None:
+        settings = Settings(jobs_enabled=True, jobs_path=":memory:")
+        ollama_service = OllamaService(
+            base_url=ollama_url, client=httpx.AsyncClient(timeout=CLIENT_TIMEOUT)
+        )
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=ollama_service,
+            text_preprocessor=TextPreprocessor(),
+            json_parser=JsonParser(),
+            text_postprocessor=TextPostprocessor(),
+        )
+        holder = PipelineHolder()
+        holder.install(
+            ExtractionPipeline(
+                settings=settings,
+                use_case=use_case,
+                llm_service=ollama_service,
+                ollama_service=ollama_service,
+            )
+        )
+
+        # The same generation over a single request hits the read timeout.
+        with pytest.raises(LLMServiceError):
+            await use_case.execute(IncidentText("Falha em Recife"))
+
+        workers = build_job_worker_pool(settings, holder)
+        assert workers is not None
+        job = workers.submit("Falha em Recife", None)
+
+        assert await workers.run_once() is True
+
+        stored = workers.get(job.id)
+        assert stored is not None and stored.status is JobStatus.SUCCEEDED
+        assert stored.attempts == 1
+        assert stored.result is not None and stored.result.local == "Recife"
+        await workers.close()
+        await holder.close()
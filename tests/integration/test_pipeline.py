@@ -0,0 +1,85 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pytest
+
+from src.domain.entities import IncidentText
+from src.presentation.api.pipeline import build_pipeline
+from src.presentation.api.schemas import incident_response_json_schema
+from src.presentation.api.settings import Settings
+
+RESPONSE = {
+    "data_ocorrencia": "2025-08-13 14:00",
+    "local": "Recife",
+    "tipo_incidente": "Falha no servidor",
+    "impacto": "Sistema fora do ar",
+}
+
+
+class StubOllama:
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        head = (await reader.readuntil(b"\r\n\r\n")).decode()
+        request_line, *header_lines = head.strip().split("\r\n")
+        path = request_line.split(" ")[1]
+        headers = {
+            name.lower(): value.strip()
+            for name, value in (line.split(":", 1) for line in header_lines)
+        }
+        body = await reader.readexactly(int(headers.get("content-length", "0")))
+        self.requests.append((path, json.loads(body) if body else {}))
+
+        if path == "/api/tags":
+            content = {"models": [{"name": "tinyllama:latest"}]}
+        else:
+            content = {"response": json.dumps(RESPONSE), "done": True}
+        encoded = json.dumps(content).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Connection: close\r\nContent-Length: %d\r\n\r\n" % len(encoded)
+        )
+        writer.write(encoded)
+        await writer.drain()
+        writer.close()
+
+
+@pytest.fixture
+async def ollama() -> AsyncIterator[Tuple[StubOllama, str]]:
+    stub = StubOllama()
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    async with server:
+        yield stub, f"http://{host}:{port}"
+
+
+class TestBuildPipeline:
+    @pytest.mark.asyncio
+    async def test_structured_output_sends_incident_schema(
+        self, ollama: Tuple[StubOllama, str]
+    ) -> None:
+        stub, url = ollama
+        settings = Settings.from_env(
+            {
+                "OLLAMA_BASE_URL": url,
+                "OLLAMA_STRUCTURED_OUTPUT": "true",
+                "OLLAMA_PRELOAD": "false",
+                "EXTRACTION_CACHE_ENABLED": "false",
+            }
+        )
+        pipeline = await build_pipeline(settings)
+        try:
+            info = await pipeline.use_case.execute(
+                IncidentText("Falha no servidor em Recife")
+            )
+        finally:
+            await pipeline.close()
+
+        generations = [body for path, body in stub.requests if path == "/api/generate"]
+        assert len(generations) == 1
+        assert generations[0]["format"] == incident_response_json_schema()
+        assert info.local == "Recife"
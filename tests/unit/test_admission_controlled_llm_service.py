@@ -0,0 +1,118 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from src.application.interfaces import LLMServiceInterface
+from src.domain.exceptions import ServiceOverloadedError
+from src.infrastructure.models import AdmissionControlledLLMService
+
+
+class GatedLLMService(LLMServiceInterface):
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self.release = asyncio.Event()
+
+    async def generate_response(self, prompt: str) -> str:
+        self.started.append(prompt)
+        await self.release.wait()
+        return f"response to {prompt}"
+
+
+class TestAdmissionControlledLLMService:
+    def setup_method(self) -> None:
+        self.llm_service = GatedLLMService()
+
+    def service(self, **kwargs) -> AdmissionControlledLLMService:
+        options = {"max_concurrency": 2, "max_queue_depth": 2, "queue_timeout": 5.0}
+        options.update(kwargs)
+        return AdmissionControlledLLMService(self.llm_service, **options)
+
+    @pytest.mark.asyncio
+    async def test_stream_holds_its_slot_until_the_last_token(self) -> None:
+        service = self.service(max_concurrency=1)
+        self.llm_service.release.set()
+
+        stream = service.stream_response("A")
+        assert await stream.__anext__() == "response to A"
+        waiting = asyncio.create_task(service.generate_response("B"))
+        await asyncio.sleep(0)
+
+        assert self.llm_service.started == ["A"]
+        assert service.stats()["queue_depth"] == 1
+
+        await stream.aclose()
+
+        assert await waiting == "response to B"
+        assert service.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_and_admits_in_order(self) -> None:
+        service = self.service()
+        tasks = [
+            asyncio.create_task(service.generate_response(p)) for p in "ABCD"
+        ]
+        await asyncio.sleep(0)
+
+        assert self.llm_service.started == ["A", "B"]
+        assert service.stats()["queue_depth"] == 2
+
+        self.llm_service.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert self.llm_service.started == ["A", "B", "C", "D"]
+        assert results == [f"response to {p}" for p in "ABCD"]
+        assert service.stats()["in_flight"] == 0
+        assert service.stats()["admitted"] == 4
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self) -> None:
+        service = self.service()
+        tasks = [
+            asyncio.create_task(service.generate_response(p)) for p in "ABCD"
+        ]
+        await asyncio.sleep(0)
+
+        assert service.saturated
+        with pytest.raises(ServiceOverloadedError) as error:
+            await service.generate_response("E")
+
+        assert error.value.retry_after >= 1
+        assert service.stats()["rejected"] == 1
+
+        self.llm_service.release.set()
+        await asyncio.gather(*tasks)
+        assert not service.saturated
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_raises_overloaded(self) -> None:
+        service = self.service(max_concurrency=1, queue_timeout=0.01)
+        first = asyncio.create_task(service.generate_response("A"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloadedError):
+            await service.generate_response("B")
+
+        assert service.stats()["timed_out"] == 1
+        assert service.stats()["queue_depth"] == 0
+
+        self.llm_service.release.set()
+        await first
+        assert service.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        service = self.service(max_concurrency=1)
+        first = asyncio.create_task(service.generate_response("A"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(service.generate_response("B"))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert service.stats()["queue_depth"] == 0
+
+        self.llm_service.release.set()
+        await first
+        assert await service.generate_response("C") == "response to C"
+        assert service.stats()["in_flight"] == 0
@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import AsyncIterator, List
+
+import pytest
+
+from src.application.use_cases import BatchItem
+from src.presentation.api.batch_reader import read_batch_items
+
+
+async def chunked(body: bytes, size: int = 3) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def collect(body: bytes, size: int = 3) -> List[BatchItem]:
+    return [item async for item in read_batch_items(chunked(body, size))]
+
+
+class TestReadBatchItems:
+    @pytest.mark.asyncio
+    async def test_json_array_split_across_chunks(self) -> None:
+        body = '[ "Falha no servidor", {"text": "Queda de energia em São Paulo"} ]'
+
+        items = await collect(body.encode("utf-8"))
+
+        assert [(item.index, item.text) for item in items] == [
+            (0, "Falha no servidor"),
+            (1, "Queda de energia em São Paulo"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_lines(self) -> None:
+        body = '"Falha no servidor"\n\n{"text": "Queda de energia"}\n{"text": "Sem rede"}'
+
+        items = await collect(body.encode("utf-8"))
+
+        assert [item.text for item in items] == [
+            "Falha no servidor",
+            "Queda de energia",
+            "Sem rede",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_ndjson_line_is_reported_inline(self) -> None:
+        body = b'"Falha no servidor"\n{invalid\n{"text": "Sem rede"}\n'
+
+        items = await collect(body)
+
+        assert items[0].text == "Falha no servidor"
+        assert isinstance(items[1].error, ValueError)
+        assert items[2].text == "Sem rede"
+
+    @pytest.mark.asyncio
+    async def test_item_without_text_is_reported_inline(self) -> None:
+        items = await collect(b'[{"texto": "Falha"}, 42]')
+
+        assert all(isinstance(item.error, ValueError) for item in items)
+
+    @pytest.mark.asyncio
+    async def test_truncated_array_reports_error(self) -> None:
+        items = await collect(b'["Falha no servidor", "Sem')
+
+        assert items[0].text == "Falha no servidor"
+        assert isinstance(items[1].error, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_empty_body_yields_nothing(self) -> None:
+        assert await collect(b"  \n") == []
+
+
+    @pytest.mark.asyncio
+    async def test_object_items_carry_reference_time(self) -> None:
+        body = b'{"text": "ontem", "reference_time": "2025-08-15T10:00:00", "timezone": "America/Recife"}'
+
+        items = await collect(body)
+
+        assert items[0].reference_time is not None
+        assert items[0].reference_time.replace(tzinfo=None) == datetime(2025, 8, 15, 10, 0)
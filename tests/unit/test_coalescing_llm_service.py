@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from src.application.interfaces import LLMServiceInterface
+from src.domain.exceptions import LLMServiceError
+from src.infrastructure.models import CoalescingLLMService
+
+
+class SlowLLMService(LLMServiceInterface):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def generate_response(self, prompt: str) -> str:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return f"response to {prompt}"
+
+
+class TestCoalescingLLMService:
+    def setup_method(self) -> None:
+        self.llm_service = SlowLLMService()
+        self.service = CoalescingLLMService(self.llm_service)
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_share_one_call(self) -> None:
+        waiters = [
+            asyncio.create_task(self.service.generate_response("A")) for _ in range(5)
+        ]
+        other = asyncio.create_task(self.service.generate_response("B"))
+        await asyncio.sleep(0)
+
+        self.llm_service.release.set()
+        results = await asyncio.gather(*waiters, other)
+
+        assert results == ["response to A"] * 5 + ["response to B"]
+        assert self.llm_service.calls == 2
+        assert self.service.stats() == {
+            "calls": 6,
+            "leaders": 2,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_every_waiter(self) -> None:
+        self.llm_service.error = LLMServiceError("Connection failed")
+        waiters = [
+            asyncio.create_task(self.service.generate_response("A")) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        self.llm_service.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(result, LLMServiceError) for result in results)
+        assert self.llm_service.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        first = asyncio.create_task(self.service.generate_response("A"))
+        second = asyncio.create_task(self.service.generate_response("A"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        self.llm_service.release.set()
+
+        assert await second == "response to A"
+        assert first.cancelled()
+        assert self.llm_service.cancelled == 0
+
+    @pytest.mark.asyncio
+    async def test_call_is_cancelled_when_all_waiters_leave(self) -> None:
+        waiters = [
+            asyncio.create_task(self.service.generate_response("A")) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert self.llm_service.cancelled == 1
+        assert self.service.stats()["in_flight"] == 0
@@ -34,6 +34,30 @@ class TestIncidentInfo:
         
         assert result["data_ocorrencia"] is None
 
+    def test_merge_combines_window_results(self) -> None:
+        merged = IncidentInfo.merge([
+            IncidentInfo(datetime(2025, 8, 14, 9, 0), "Recife", "Falha no servidor", "Sistema fora do ar"),
+            IncidentInfo(datetime(2025, 8, 13, 22, 0), "São Paulo", "", "Atraso nas notas"),
+            IncidentInfo(None, "recife", "Falha no servidor", "Sistema fora do ar"),
+        ])
+
+        assert merged == IncidentInfo(
+            data_ocorrencia=datetime(2025, 8, 13, 22, 0),
+            local="Recife",
+            tipo_incidente="Falha no servidor",
+            impacto="Sistema fora do ar; Atraso nas notas",
+        )
+
+    def test_merge_ties_keep_the_first_mention(self) -> None:
+        merged = IncidentInfo.merge([
+            IncidentInfo(None, "Recife", "", ""),
+            IncidentInfo(None, "Olinda", "", ""),
+        ])
+
+        assert merged.local == "Recife"
+        assert merged.data_ocorrencia is None
+        assert merged.impacto == ""
+
 
 class TestIncidentText:
     def test_valid_text(self) -> None:
@@ -0,0 +1,100 @@
+from datetime import datetime
+from pathlib import Path
+
+from src.domain.entities import IncidentInfo
+from src.infrastructure.cache import ExtractionResultCache, SqliteCacheStore
+
+
+def make_incident(local: str = "São Paulo") -> IncidentInfo:
+    return IncidentInfo(
+        data_ocorrencia=datetime(2025, 8, 14, 14, 0),
+        local=local,
+        tipo_incidente="Falha no servidor",
+        impacto="Sistema indisponível por 2 horas",
+    )
+
+
+class TestExtractionResultCache:
+    def test_key_depends_on_text_model_and_prompt_version(self) -> None:
+        cache = ExtractionResultCache(model="tinyllama")
+        other_model = ExtractionResultCache(model="llama3")
+
+        key = cache.build_key("Falha no servidor", "1")
+
+        assert key == cache.build_key("Falha no servidor", "1")
+        assert key != cache.build_key("Falha no servidor", "2")
+        assert key != cache.build_key("Falha na rede", "1")
+        assert key != other_model.build_key("Falha no servidor", "1")
+
+    def test_hit_and_miss_counters(self) -> None:
+        cache = ExtractionResultCache(model="tinyllama")
+        key = cache.build_key("Falha no servidor", "1")
+
+        assert cache.get(key) is None
+        cache.set(key, make_incident())
+
+        assert cache.get(key) == make_incident()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ExtractionResultCache(model="tinyllama", max_entries=2)
+
+        cache.set("a", make_incident("A"))
+        cache.set("b", make_incident("B"))
+        cache.get("a")
+        cache.set("c", make_incident("C"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entries_are_not_returned(self) -> None:
+        cache = ExtractionResultCache(model="tinyllama", ttl_seconds=0.0)
+
+        cache.set("a", make_incident())
+
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalidate_removes_entry(self) -> None:
+        cache = ExtractionResultCache(model="tinyllama")
+        cache.set("a", make_incident())
+
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+
+    def test_sqlite_tier_survives_restart(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "cache.db")
+        cache = ExtractionResultCache(
+            model="tinyllama", store=SqliteCacheStore(path, ttl_seconds=60)
+        )
+        cache.set("a", make_incident())
+        cache.close()
+
+        restarted = ExtractionResultCache(
+            model="tinyllama", store=SqliteCacheStore(path, ttl_seconds=60)
+        )
+
+        assert restarted.get("a") == make_incident()
+        assert restarted.stats()["disk_hits"] == 1
+        restarted.close()
+
+    def test_sqlite_tier_purges_expired_rows(self, tmp_path: Path) -> None:
+        import sqlite3
+        import time
+
+        path = str(tmp_path / "cache.db")
+        store = SqliteCacheStore(path, ttl_seconds=0.01, purge_every_sets=3)
+        store.set("a", make_incident())
+        store.set("b", make_incident())
+        time.sleep(0.02)
+
+        store.set("c", make_incident())
+
+        rows = sqlite3.connect(path).execute("SELECT key FROM extraction_cache")
+        assert [key for (key,) in rows] == ["c"]
+        assert store.purged == 2
+        store.close()
@@ -0,0 +1,274 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.interfaces import JobStatus
+from src.application.use_cases import ExtractionJobWorkerPool
+from src.domain.entities import IncidentInfo
+from src.domain.exceptions import InvalidJsonResponseError, ServiceOverloadedError
+from src.infrastructure.jobs import SqliteJobQueue
+
+INFO = IncidentInfo(datetime(2025, 8, 13, 14, 0), "Recife", "Falha", "Lentidão")
+
+
+class TestSqliteJobQueue:
+    def test_jobs_survive_reopening_the_database(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "jobs.db")
+        queue = SqliteJobQueue(path)
+        job = queue.enqueue("Falha em Recife", datetime(2025, 8, 14, 9, 0))
+        queue.complete(queue.claim().id, INFO)  # type: ignore[union-attr]
+        queue.close()
+
+        stored = SqliteJobQueue(path).get(job.id)
+
+        assert stored is not None
+        assert stored.status is JobStatus.SUCCEEDED
+        assert stored.result == INFO
+        assert stored.reference_time == datetime(2025, 8, 14, 9, 0)
+        assert stored.attempts == 1
+
+    def test_running_jobs_are_recovered_after_restart(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "jobs.db")
+        queue = SqliteJobQueue(path)
+        job = queue.enqueue("Falha em Recife", None)
+        queue.claim()
+        queue.close()
+
+        reopened = SqliteJobQueue(path)
+
+        assert reopened.recover() == 1
+        claimed = reopened.claim()
+        assert claimed is not None and claimed.id == job.id
+        assert claimed.attempts == 2
+
+    def test_retry_delays_the_next_claim(self) -> None:
+        queue = SqliteJobQueue(":memory:")
+        job = queue.enqueue("Falha", None)
+        queue.claim()
+
+        queue.retry(job.id, "LLMServiceError", "down", delay=60)
+
+        assert queue.claim() is None
+        assert queue.get(job.id).status is JobStatus.QUEUED  # type: ignore[union-attr]
+        assert queue.get(job.id).error == "down"  # type: ignore[union-attr]
+
+    def test_retry_without_counting_gives_the_attempt_back(self) -> None:
+        queue = SqliteJobQueue(":memory:")
+        job = queue.enqueue("Falha", None)
+        queue.claim()
+
+        queue.retry(job.id, "ServiceOverloadedError", "cheio", 0, count_attempt=False)
+
+        assert queue.get(job.id).attempts == 0  # type: ignore[union-attr]
+        assert queue.claim().attempts == 1  # type: ignore[union-attr]
+
+    def test_expired_jobs_are_marked_then_purged(self) -> None:
+        queue = SqliteJobQueue(":memory:", ttl_seconds=0.05)
+        queued = queue.enqueue("Falha", None)
+        time.sleep(0.06)
+
+        assert queue.claim() is None
+        assert queue.purge_expired() == 0
+        assert queue.get(queued.id).status is JobStatus.EXPIRED  # type: ignore[union-attr]
+
+        time.sleep(0.06)
+        assert queue.purge_expired() == 1
+        assert queue.get(queued.id) is None
+
+
+class TestExtractionJobWorkerPool:
+    def make_pool(
+        self,
+        use_case: AsyncMock,
+        max_attempts: int = 3,
+        queue: Optional[SqliteJobQueue] = None,
+    ) -> ExtractionJobWorkerPool:
+        @asynccontextmanager
+        async def provider() -> AsyncIterator[AsyncMock]:
+            yield use_case
+
+        return ExtractionJobWorkerPool(
+            queue or SqliteJobQueue(":memory:"),
+            provider,  # type: ignore[arg-type]
+            max_attempts=max_attempts,
+            retry_backoff=0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_job_result_is_stored(self) -> None:
+        use_case = AsyncMock()
+        use_case.execute.return_value = INFO
+        pool = self.make_pool(use_case)
+        job = pool.submit("Falha em Recife", datetime(2025, 8, 14, 9, 0))
+
+        assert await pool.run_once() is True
+
+        stored = pool.get(job.id)
+        assert stored is not None and stored.status is JobStatus.SUCCEEDED
+        assert stored.result == INFO
+        incident_text = use_case.execute.await_args.args[0]
+        assert incident_text.reference_time == datetime(2025, 8, 14, 9, 0)
+
+    @pytest.mark.asyncio
+    async def test_extraction_errors_are_retried_until_max_attempts(self) -> None:
+        use_case = AsyncMock()
+        use_case.execute.side_effect = InvalidJsonResponseError("sem JSON")
+        pool = self.make_pool(use_case, max_attempts=2)
+        job = pool.submit("Falha", None)
+
+        while await pool.run_once():
+            pass
+
+        stored = pool.get(job.id)
+        assert stored is not None and stored.status is JobStatus.FAILED
+        assert stored.attempts == 2
+        assert stored.error_type == "InvalidJsonResponseError"
+        assert pool.stats()["processed"]["retried"] == 1
+
+    @pytest.mark.asyncio
+    async def test_overload_defers_the_job_without_using_attempts(self) -> None:
+        use_case = AsyncMock()
+        use_case.execute.side_effect = [
+            ServiceOverloadedError("cheio", retry_after=0),
+            ServiceOverloadedError("cheio", retry_after=0),
+            INFO,
+        ]
+        pool = self.make_pool(use_case, max_attempts=1)
+        job = pool.submit("Falha", None)
+
+        while await pool.run_once():
+            pass
+
+        stored = pool.get(job.id)
+        assert stored is not None and stored.status is JobStatus.SUCCEEDED
+        assert stored.attempts == 1
+        assert pool.stats()["processed"]["deferred"] == 2
+        assert pool.stats()["processed"]["retried"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_fail_without_retry(self) -> None:
+        use_case = AsyncMock()
+        use_case.execute.side_effect = RuntimeError("bug")
+        pool = self.make_pool(use_case)
+        job = pool.submit("Falha", None)
+
+        await pool.run_once()
+
+        assert pool.get(job.id).status is JobStatus.FAILED  # type: ignore[union-attr]
+        assert await pool.run_once() is False
+
+    @pytest.mark.asyncio
+    async def test_workers_drain_submitted_jobs(self) -> None:
+        use_case = AsyncMock()
+        use_case.execute.return_value = INFO
+        pool = self.make_pool(use_case)
+        pool.start()
+        jobs = [pool.submit(f"Falha {n}", None) for n in range(3)]
+
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if all(pool.get(job.id).status is JobStatus.SUCCEEDED for job in jobs):  # type: ignore[union-attr]
+                break
+
+        assert pool.stats()["processed"]["succeeded"] == 3
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_errors_do_not_stop_the_workers(self) -> None:
+        import sqlite3
+
+        use_case = AsyncMock()
+        use_case.execute.return_value = INFO
+        queue = SqliteJobQueue(":memory:")
+        claim = queue.claim
+        failures = [sqlite3.OperationalError("database is locked")]
+
+        def flaky_claim() -> object:
+            if failures:
+                raise failures.pop()
+            return claim()
+
+        queue.claim = flaky_claim  # type: ignore[method-assign]
+        errors = []
+        pool = ExtractionJobWorkerPool(
+            queue,
+            self.make_pool(use_case)._use_case_provider,
+            concurrency=1,
+            poll_interval=0.01,
+            on_loop_error=lambda loop, error, delay: errors.append((loop, error)),
+        )
+        job = pool.submit("Falha", None)
+        pool.start()
+
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if pool.get(job.id).status is JobStatus.SUCCEEDED:  # type: ignore[union-attr]
+                break
+
+        assert pool.get(job.id).status is JobStatus.SUCCEEDED  # type: ignore[union-attr]
+        assert [loop for loop, _ in errors] == ["work"]
+        assert pool.stats()["processed"]["loop_errors"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_requeues_running_job(self, tmp_path: Path) -> None:
+        started = asyncio.Event()
+
+        async def slow_execute(*args: object, **kwargs: object) -> IncidentInfo:
+            started.set()
+            await asyncio.sleep(10)
+            return INFO
+
+        use_case = AsyncMock()
+        use_case.execute.side_effect = slow_execute
+        queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+        pool = self.make_pool(use_case, queue=queue)
+        pool.start()
+        job = pool.submit("Falha", None)
+        await asyncio.wait_for(started.wait(), 1)
+
+        await pool.close()
+
+        reopened = SqliteJobQueue(str(tmp_path / "jobs.db"))
+        stored = reopened.get(job.id)
+        assert stored is not None and stored.status is JobStatus.QUEUED
+        assert stored.attempts == 0
+
+    @pytest.mark.asyncio
+    async def test_only_one_process_runs_a_shared_queue(self, tmp_path: Path) -> None:
+        use_case = AsyncMock()
+        use_case.execute.return_value = INFO
+        path = str(tmp_path / "jobs.db")
+        leader = self.make_pool(use_case, queue=SqliteJobQueue(path))
+        standby_queue = SqliteJobQueue(path)
+        standby = ExtractionJobWorkerPool(
+            standby_queue, leader._use_case_provider, poll_interval=0.01
+        )
+        leader.start()
+        standby.start()
+
+        assert leader.stats()["active"] is True
+        assert standby.stats()["active"] is False
+
+        # A running job is only recovered once the process running jobs is gone.
+        claimed = standby_queue.enqueue("Falha", None)
+        assert standby_queue.claim() is not None
+        await asyncio.sleep(0.05)
+        running = standby_queue.get(claimed.id)
+        assert running is not None and running.status is JobStatus.RUNNING
+
+        await leader.close()
+        await asyncio.sleep(0.05)
+
+        assert standby.stats()["active"] is True
+        assert standby.stats()["processed"]["recovered"] == 1
+        await asyncio.sleep(0.05)
+        stored = standby_queue.get(claimed.id)
+        assert stored is not None and stored.status is JobStatus.SUCCEEDED
+        await standby.close()
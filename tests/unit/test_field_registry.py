@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.processors import FieldRegistry
+
+
+class TestFieldRegistry:
+    def test_canonical_name_wins_over_aliases(self) -> None:
+        registry = FieldRegistry()
+
+        result = registry.normalize(
+            {"location": "Recife", "local": "São Paulo", "lugar": "Natal"}
+        )
+
+        assert result == {"local": "São Paulo"}
+
+    def test_earlier_alias_wins_over_later_alias(self) -> None:
+        registry = FieldRegistry()
+
+        result = registry.normalize({"type": "Queda de energia", "tipo": "Falha"})
+
+        assert result == {"tipo_incidente": "Falha"}
+
+    def test_none_values_fall_back_to_aliases(self) -> None:
+        registry = FieldRegistry()
+
+        result = registry.normalize({"local": None, "lugar": "Natal"})
+
+        assert result == {"local": "Natal"}
+
+    def test_unknown_keys_are_fuzzy_matched_once(self) -> None:
+        registry = FieldRegistry()
+
+        for _ in range(3):
+            result = registry.normalize({"Impacto_": "Lentidão", "xyz": "ignorado"})
+
+        assert result == {"impacto": "Lentidão"}
+        stats = registry.stats()
+        assert stats["fuzzy_misses"] == 2
+        assert stats["fuzzy_hits"] == 4
+
+    def test_alias_beats_fuzzy_match(self) -> None:
+        registry = FieldRegistry()
+
+        result = registry.normalize({"impactoo": "Lentidão", "efeito": "Queda"})
+
+        assert result == {"impacto": "Queda"}
+
+    def test_fully_resolved_response_skips_fuzzy_matching(self) -> None:
+        registry = FieldRegistry()
+
+        result = registry.normalize(
+            {
+                "data": "2025-08-13",
+                "lugar": "Recife",
+                "tipo": "Falha",
+                "efeito": "Lento",
+                "locall": "ignorado",
+            }
+        )
+
+        assert result["local"] == "Recife"
+        assert registry.stats()["fuzzy_misses"] == 0
+
+    def test_keys_too_long_to_match_are_not_scored(self, monkeypatch) -> None:
+        import difflib
+
+        registry = FieldRegistry()
+        scored = []
+        original = difflib.SequenceMatcher
+
+        def matcher(*args: object) -> difflib.SequenceMatcher:
+            scored.append(args[2])
+            return original(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(difflib, "SequenceMatcher", matcher)
+
+        result = registry.normalize({"x" * 400: "ruído", "locall": "Recife"})
+
+        assert result == {"local": "Recife"}
+        assert scored == ["locall"]
+
+    def test_fuzzy_cache_is_bounded(self) -> None:
+        registry = FieldRegistry(max_cached_keys=2)
+
+        registry.normalize({f"chave_{n}": n for n in range(5)})
+
+        stats = registry.stats()
+        assert stats["cached_keys"] == 2
+        assert stats["evictions"] == 3
+
+    def test_from_file_adds_aliases(self, tmp_path: Path) -> None:
+        path = tmp_path / "aliases.json"
+        path.write_text(
+            json.dumps({"local": ["cidade"], "impacto": ["consequencia"]}),
+            encoding="utf-8",
+        )
+        registry = FieldRegistry.from_file(str(path))
+
+        result = registry.normalize(
+            {"cidade": "Recife", "consequencia": "Lentidão", "tipo": "Falha"}
+        )
+
+        assert result == {
+            "local": "Recife",
+            "tipo_incidente": "Falha",
+            "impacto": "Lentidão",
+        }
+
+    def test_from_file_rejects_unknown_fields(self, tmp_path: Path) -> None:
+        path = tmp_path / "aliases.json"
+        path.write_text(json.dumps({"severidade": ["gravidade"]}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="severidade"):
+            FieldRegistry.from_file(str(path))
+
+    def test_from_file_rejects_invalid_layout(self, tmp_path: Path) -> None:
+        path = tmp_path / "aliases.json"
+        path.write_text(json.dumps({"local": "cidade"}), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            FieldRegistry.from_file(str(path))
@@ -0,0 +1,141 @@
+import asyncio
+import os
+import subprocess
+import sys
+from typing import AsyncGenerator, List
+
+import pytest
+
+from src.application.interfaces import LLMServiceInterface
+from src.domain.exceptions import ServiceOverloadedError
+from src.infrastructure.models import HostConcurrencyLimitedLLMService
+
+
+class GatedLLMService(LLMServiceInterface):
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self.release = asyncio.Event()
+
+    async def generate_response(self, prompt: str) -> str:
+        self.started.append(prompt)
+        await self.release.wait()
+        return f"response to {prompt}"
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        self.started.append(prompt)
+        yield "{"
+        await self.release.wait()
+        yield "}"
+
+
+class TestHostConcurrencyLimitedLLMService:
+    def setup_method(self) -> None:
+        self.llm_service = GatedLLMService()
+
+    def service(self, lock_dir, **kwargs) -> HostConcurrencyLimitedLLMService:
+        options = {"max_concurrency": 1, "acquire_timeout": 5.0, "poll_interval": 0.001}
+        options.update(kwargs)
+        return HostConcurrencyLimitedLLMService(self.llm_service, str(lock_dir), **options)
+
+    @pytest.mark.asyncio
+    async def test_slots_are_shared_between_instances(self, tmp_path) -> None:
+        # Each instance opens its own lock files, just like a separate worker.
+        first = self.service(tmp_path)
+        second = self.service(tmp_path)
+
+        running = asyncio.create_task(first.generate_response("A"))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.create_task(second.generate_response("B"))
+        await asyncio.sleep(0.02)
+
+        assert self.llm_service.started == ["A"]
+        assert second.stats()["in_flight"] == 1
+        assert second.stats()["holders"][0]["pid"] == os.getpid()
+
+        self.llm_service.release.set()
+
+        assert await asyncio.gather(running, waiting) == ["response to A", "response to B"]
+        assert second.stats()["waited"] == 1
+        assert second.holders() == []
+        first.close()
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_one_process_uses_every_slot(self, tmp_path) -> None:
+        service = self.service(tmp_path, max_concurrency=2)
+
+        tasks = [asyncio.create_task(service.generate_response(p)) for p in "ABC"]
+        await asyncio.sleep(0.02)
+
+        assert self.llm_service.started == ["A", "B"]
+        assert service.stats()["in_flight_local"] == 2
+
+        self.llm_service.release.set()
+        await asyncio.gather(*tasks)
+
+        assert self.llm_service.started == ["A", "B", "C"]
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_times_out_with_retry_after(self, tmp_path) -> None:
+        holder = self.service(tmp_path)
+        waiter = self.service(tmp_path, acquire_timeout=0.05)
+
+        running = asyncio.create_task(holder.generate_response("A"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServiceOverloadedError) as error:
+            await waiter.generate_response("B")
+
+        assert error.value.retry_after >= 1
+        assert waiter.stats()["timed_out"] == 1
+
+        self.llm_service.release.set()
+        await running
+        holder.close()
+        waiter.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_holds_its_slot_until_closed(self, tmp_path) -> None:
+        service = self.service(tmp_path)
+
+        stream = service.stream_response("A")
+        assert await stream.__anext__() == "{"
+        assert service.stats()["in_flight"] == 1
+
+        await stream.aclose()
+
+        assert service.holders() == []
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_slot_of_a_dead_process_is_freed(self, tmp_path) -> None:
+        service = self.service(tmp_path)
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import fcntl, os, sys, time\n"
+                "fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT)\n"
+                "fcntl.flock(fd, fcntl.LOCK_EX)\n"
+                "os.write(fd, b'{\"pid\": %d, \"acquired_at\": 0}' % os.getpid())\n"
+                "print('locked', flush=True)\n"
+                "time.sleep(60)\n",
+                str(tmp_path / "slot-0.lock"),
+            ],
+            stdout=subprocess.PIPE,
+        )
+        try:
+            assert holder.stdout is not None
+            assert holder.stdout.readline() == b"locked\n"
+
+            assert [h["pid"] for h in service.holders()] == [holder.pid]
+            with pytest.raises(ServiceOverloadedError):
+                await self.service(tmp_path, acquire_timeout=0.02).generate_response("A")
+        finally:
+            holder.kill()
+            holder.wait()
+
+        self.llm_service.release.set()
+        assert await service.generate_response("B") == "response to B"
+        service.close()
@@ -0,0 +1,52 @@
+from src.infrastructure.parsers import JsonFieldReader, JsonParser
+
+
+def read_all(reader: JsonFieldReader, tokens: list[str]) -> list[list[tuple]]:
+    return [reader.feed(token) for token in tokens]
+
+
+class TestJsonFieldReader:
+    def test_emits_each_field_once_it_completes(self) -> None:
+        reader = JsonFieldReader()
+        tokens = ['{"data_oc', 'orrencia": "2025-08-13', ' 14:00", "lo', 'cal": "Recife"', "}"]
+
+        assert read_all(reader, tokens) == [
+            [],
+            [],
+            [("data_ocorrencia", "2025-08-13 14:00")],
+            [],
+            [("local", "Recife")],
+        ]
+        assert reader.closed
+
+    def test_nested_values_and_escapes_across_tokens(self) -> None:
+        reader = JsonFieldReader()
+        tokens = ['{"impacto": "parada {total} \\', '"x\\"", "tipo": {"a": [1, ', "2]}, ", '"n": null}']
+
+        fields = [field for batch in read_all(reader, tokens) for field in batch]
+
+        assert fields == [
+            ("impacto", 'parada {total} "x"'),
+            ("tipo", {"a": [1, 2]}),
+            ("n", None),
+        ]
+
+    def test_skips_prose_braces_and_stops_after_the_answer(self) -> None:
+        reader = JsonFieldReader()
+
+        assert reader.feed('Formato {x}: {"local": "SP"} {"local": "RJ"}') == [
+            ("local", "SP")
+        ]
+        assert reader.feed('{"impacto": "alto"}') == []
+
+    def test_undecodable_member_is_skipped(self) -> None:
+        reader = JsonFieldReader()
+
+        assert reader.feed("{'local': 'SP', \"impacto\": \"alto\"}") == [
+            ("impacto", "alto")
+        ]
+
+    def test_parser_hands_out_fresh_readers(self) -> None:
+        parser = JsonParser()
+
+        assert parser.field_reader() is not parser.field_reader()
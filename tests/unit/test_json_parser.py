@@ -44,4 +44,47 @@ class TestJsonParser:
         text = '{"data_ocorrencia": "2025-08-14 14:00", "local": }'
         
         with pytest.raises(InvalidJsonResponseError):
-            self.parser.parse(text)
\ No newline at end of file
+            self.parser.parse(text)
+
+    def test_parse_nested_json(self) -> None:
+        text = 'Resultado: {"local": {"cidade": "Recife", "uf": "PE"}, "impacto": "alto"} fim'
+
+        result = self.parser.parse(text)
+
+        assert result == {"local": {"cidade": "Recife", "uf": "PE"}, "impacto": "alto"}
+
+    def test_parse_skips_candidates_that_are_not_valid(self) -> None:
+        text = 'Formato: {campo: valor inválido} Resposta: {"local": "Recife"}'
+
+        assert JsonParser(repair=False).parse(text) == {"local": "Recife"}
+
+    def test_repair_python_style_json(self) -> None:
+        text = "{'data_ocorrencia': None, 'local': 'São Paulo', 'resolvido': True,}"
+
+        result = self.parser.parse(text)
+
+        assert result == {"data_ocorrencia": None, "local": "São Paulo", "resolvido": True}
+
+    def test_repair_unquoted_keys_and_trailing_commas(self) -> None:
+        text = '{local: "Recife", impactos: ["rede", "telefonia",],}'
+
+        assert self.parser.parse(text) == {"local": "Recife", "impactos": ["rede", "telefonia"]}
+
+    def test_repair_truncated_response(self) -> None:
+        text = '{"local": "Recife", "impacto": {"sistema": "notas", "duracao": "5 ho'
+
+        result = self.parser.parse(text)
+
+        assert result == {"local": "Recife", "impacto": {"sistema": "notas", "duracao": "5 ho"}}
+
+    def test_repair_disabled_raises_error(self) -> None:
+        with pytest.raises(InvalidJsonResponseError):
+            JsonParser(repair=False).parse("{'local': 'Recife'}")
+
+
+    def test_parse_structured_response(self) -> None:
+        assert self.parser.parse_structured('{"local": "Recife"}') == {"local": "Recife"}
+
+    def test_parse_structured_does_not_scrape(self) -> None:
+        with pytest.raises(InvalidJsonResponseError):
+            self.parser.parse_structured('Resposta: {"local": "Recife"}')
@@ -0,0 +1,38 @@
+from src.infrastructure.parsers import JsonObjectScanner, find_json_objects
+
+
+class TestJsonObjectScanner:
+    def test_finds_nested_object(self) -> None:
+        text = 'Resposta: {"local": {"cidade": "Recife"}, "impacto": "alto"} fim'
+
+        assert find_json_objects(text) == [
+            '{"local": {"cidade": "Recife"}, "impacto": "alto"}'
+        ]
+
+    def test_braces_and_escaped_quotes_inside_strings(self) -> None:
+        text = '{"tipo": "falha {crítica} \\"}\\" no servidor", "ok": "\\\\"} {"b": 1}'
+
+        assert find_json_objects(text) == [
+            '{"tipo": "falha {crítica} \\"}\\" no servidor", "ok": "\\\\"}',
+            '{"b": 1}',
+        ]
+
+    def test_quotes_outside_objects_are_ignored(self) -> None:
+        assert find_json_objects('He said "hi {"a": 1}') == ['{"a": 1}']
+
+    def test_incremental_feed_across_token_boundaries(self) -> None:
+        scanner = JsonObjectScanner()
+        tokens = ['Aqui: {"tip', 'o": "a\\', '"}', '"}', " e mais texto {"]
+
+        completed = []
+        for token in tokens:
+            completed.extend(scanner.feed(token))
+
+        assert completed == ['{"tipo": "a\\"}"}']
+        assert scanner.depth == 1
+
+    def test_unclosed_object_is_not_returned(self) -> None:
+        scanner = JsonObjectScanner()
+
+        assert scanner.feed('{"local": "Recife"') == []
+        assert scanner.depth == 1
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+
+from src.application.interfaces import LLMServiceInterface
+from src.application.use_cases import MicroBatchExtractor
+from src.domain.exceptions import LLMServiceError
+from src.infrastructure.parsers import JsonParser
+
+
+class BatchLLMService(LLMServiceInterface):
+    def __init__(self) -> None:
+        self.prompts: List[str] = []
+        self.response = ""
+        self.error: Exception | None = None
+
+    async def generate_response(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        if self.error:
+            raise self.error
+        if self.response:
+            return self.response
+        count = prompt.count("Incident ") - 2
+        results = [{"local": f"Local {n}"} for n in range(1, count + 1)]
+        return json.dumps({"resultados": results})
+
+
+class TestMicroBatchExtractor:
+    def setup_method(self) -> None:
+        self.llm_service = BatchLLMService()
+
+    def batcher(self, **kwargs) -> MicroBatchExtractor:
+        options = {"max_batch_size": 4, "max_wait": 0.01}
+        options.update(kwargs)
+        return MicroBatchExtractor(self.llm_service, JsonParser(), **options)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_share_one_prompt(self) -> None:
+        batcher = self.batcher()
+
+        results = await asyncio.gather(
+            batcher.extract("texto A"), batcher.extract("texto B")
+        )
+
+        assert results == [{"local": "Local 1"}, {"local": "Local 2"}]
+        assert len(self.llm_service.prompts) == 1
+        assert "Incident 1: texto A\n" in self.llm_service.prompts[0]
+        assert "Incident 2: texto B" in self.llm_service.prompts[0]
+        assert batcher.stats()["batched_items"] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self) -> None:
+        batcher = self.batcher(max_batch_size=2, max_wait=60.0)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.extract("A"), batcher.extract("B")), timeout=1.0
+        )
+
+        assert len(results) == 2
+        assert len(self.llm_service.prompts) == 1
+
+    @pytest.mark.asyncio
+    async def test_lone_item_falls_back_to_single_extraction(self) -> None:
+        batcher = self.batcher()
+
+        assert await batcher.extract("texto A") is None
+        assert self.llm_service.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_array_falls_back_for_every_item(self) -> None:
+        batcher = self.batcher()
+        self.llm_service.response = json.dumps({"resultados": [{"local": "X"}]})
+
+        results = await asyncio.gather(batcher.extract("A"), batcher.extract("B"))
+
+        assert results == [None, None]
+        assert batcher.stats()["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_error_is_propagated_to_every_item(self) -> None:
+        batcher = self.batcher()
+        self.llm_service.error = LLMServiceError("down")
+
+        results = await asyncio.gather(
+            batcher.extract("A"), batcher.extract("B"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, LLMServiceError) for result in results)
+
+    def test_rejects_batch_size_below_two(self) -> None:
+        with pytest.raises(ValueError):
+            self.batcher(max_batch_size=1)
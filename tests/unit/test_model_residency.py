@@ -0,0 +1,129 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from src.infrastructure.models import (
+    OllamaModelResidency,
+    OllamaService,
+    parse_keep_alive,
+)
+
+
+class FakeOllama:
+    def __init__(self) -> None:
+        self.generate_payloads: List[Dict[str, Any]] = []
+        self.load_duration = 2_000_000_000
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+
+        payload = json.loads(request.content)
+        self.generate_payloads.append(payload)
+        load_duration, self.load_duration = self.load_duration, 1_000_000
+        return httpx.Response(
+            200,
+            json={
+                "response": '{"local": "Recife"}',
+                "done": True,
+                "load_duration": load_duration,
+                "eval_count": 8,
+            },
+        )
+
+    def service(self, residency: OllamaModelResidency) -> OllamaService:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return OllamaService(client=client, residency=residency)
+
+
+class TestParseKeepAlive:
+    def test_parses_durations_and_seconds(self) -> None:
+        assert parse_keep_alive("30m") == "30m"
+        assert parse_keep_alive("-1") == -1
+        assert parse_keep_alive("  ") is None
+        assert parse_keep_alive(None) is None
+
+
+class TestOllamaModelResidency:
+    @pytest.mark.asyncio
+    async def test_keep_alive_is_sent_with_every_generate_call(self) -> None:
+        fake = FakeOllama()
+        service = fake.service(OllamaModelResidency("tinyllama", keep_alive="30m"))
+
+        await service.generate_response("prompt")
+
+        assert fake.generate_payloads[0]["keep_alive"] == "30m"
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_is_omitted_by_default(self) -> None:
+        fake = FakeOllama()
+        service = fake.service(OllamaModelResidency("tinyllama"))
+
+        await service.generate_response("prompt")
+
+        assert "keep_alive" not in fake.generate_payloads[0]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_load_duration_separates_cold_and_warm_requests(self) -> None:
+        fake = FakeOllama()
+        residency = OllamaModelResidency("tinyllama")
+        service = fake.service(residency)
+
+        await service.generate_response("prompt")
+        await service.generate_response("prompt")
+
+        stats = residency.stats()
+        assert stats["cold_starts"] == 1
+        assert stats["warm_requests"] == 1
+        assert stats["avg_cold_latency_ms"] is not None
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_preload_loads_model_without_prompt(self) -> None:
+        fake = FakeOllama()
+        residency = OllamaModelResidency("tinyllama", keep_alive=-1)
+        service = fake.service(residency)
+        await service.warmup()
+
+        await service.preload()
+
+        assert fake.generate_payloads == [
+            {"model": "tinyllama", "stream": False, "keep_alive": -1}
+        ]
+        assert residency.stats()["preloads"] == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_preload_skips_non_json_response(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            return httpx.Response(200, text="<html>proxy</html>")
+
+        residency = OllamaModelResidency("tinyllama")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, residency=residency)
+        await service.warmup()
+
+        await service.preload()
+
+        assert residency.stats()["preloads"] == 0
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_backends_receive_keep_warm_pings(self) -> None:
+        fake = FakeOllama()
+        residency = OllamaModelResidency("tinyllama", keep_warm_interval=0.01)
+        service = fake.service(residency)
+        await service.warmup()
+
+        await asyncio.sleep(0.05)
+
+        assert residency.stats()["keep_warm_pings"] >= 1
+        assert all("prompt" not in payload for payload in fake.generate_payloads)
+        await service.close()
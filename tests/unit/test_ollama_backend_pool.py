@@ -0,0 +1,220 @@
+import asyncio
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from src.domain.exceptions import LLMServiceError
+from src.infrastructure.models import (
+    OllamaBackend,
+    OllamaBackendPool,
+    OllamaService,
+    parse_backend_configs,
+)
+
+
+def make_backend(url: str, handler, max_in_flight: int = 4) -> OllamaBackend:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return OllamaBackend(url, max_in_flight=max_in_flight, client=client)
+
+
+async def ok_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"models": []})
+
+
+class TestParseBackendConfigs:
+    def test_parses_list_with_options(self) -> None:
+        configs = parse_backend_configs(
+            "http://a:11434/, http://b:11434;max_in_flight=2;max_connections=5",
+            max_in_flight=8,
+        )
+
+        assert [c.base_url for c in configs] == ["http://a:11434", "http://b:11434"]
+        assert configs[0].max_in_flight == 8
+        assert configs[1].max_in_flight == 2
+        assert configs[1].max_connections == 5
+
+    def test_rejects_unknown_option(self) -> None:
+        with pytest.raises(ValueError):
+            parse_backend_configs("http://a:11434;weight=2")
+
+    def test_rejects_empty_list(self) -> None:
+        with pytest.raises(ValueError):
+            parse_backend_configs(" , ")
+
+
+class TestOllamaBackendPool:
+    @pytest.mark.asyncio
+    async def test_routes_to_least_outstanding_backend(self) -> None:
+        backends = [make_backend(f"http://b{i}", ok_handler) for i in range(3)]
+        pool = OllamaBackendPool(backends)
+        leased: List[str] = []
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with pool.lease() as backend:
+                leased.append(backend.base_url)
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert sorted(leased) == ["http://b0", "http://b1", "http://b2"]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_waits_when_every_backend_is_full(self) -> None:
+        pool = OllamaBackendPool([make_backend("http://b0", ok_handler, 1)])
+        release = asyncio.Event()
+        order: List[str] = []
+
+        async def hold(name: str) -> None:
+            async with pool.lease():
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(hold("first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hold("second"))
+        await asyncio.sleep(0)
+
+        assert order == ["first"]
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert order == ["first", "second"]
+        assert pool.stats()[0]["outstanding"] == 0
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_capacity(self) -> None:
+        pool = OllamaBackendPool([make_backend("http://b0", ok_handler, 1)])
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with pool.lease():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await asyncio.gather(holder, waiter, return_exceptions=True)
+
+        async with pool.lease() as backend:
+            assert backend.outstanding == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_consecutive_failures_eject_backend(self) -> None:
+        backends = [make_backend(f"http://b{i}", ok_handler) for i in range(2)]
+        pool = OllamaBackendPool(backends, failure_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(LLMServiceError):
+                async with pool.lease() as backend:
+                    if backend.base_url == "http://b0":
+                        error = httpx.ConnectError("connection refused")
+                        raise LLMServiceError("HTTP error") from error
+            async with pool.lease():
+                pass
+
+        stats = {s["url"]: s for s in pool.stats()}
+        assert stats["http://b0"]["healthy"] is False
+        assert stats["http://b0"]["errors"] == 2
+        assert stats["http://b0"]["ejections"] == 1
+
+        for _ in range(3):
+            async with pool.lease() as backend:
+                assert backend.base_url == "http://b1"
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_count_as_backend_failures(self) -> None:
+        pool = OllamaBackendPool([make_backend("http://b0", ok_handler)])
+
+        with pytest.raises(ValueError):
+            async with pool.lease():
+                raise ValueError("bad prompt")
+
+        assert pool.stats()[0]["errors"] == 0
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_routes_to_ejected_backends_when_none_is_healthy(self) -> None:
+        backend = make_backend("http://b0", ok_handler)
+        pool = OllamaBackendPool([backend])
+        backend.eject("test")
+
+        async with pool.lease() as leased:
+            assert leased is backend
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_ejects_and_readmits(self) -> None:
+        up = {"http://b0": True}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if not up[f"{request.url.scheme}://{request.url.host}"]:
+                raise httpx.ConnectError("connection refused")
+            return httpx.Response(200, json={"models": []})
+
+        backend = make_backend("http://b0", handler)
+        pool = OllamaBackendPool([backend])
+
+        up["http://b0"] = False
+        await pool.check_health()
+        assert backend.healthy is False
+
+        up["http://b0"] = True
+        await pool.check_health()
+        assert backend.healthy is True
+        await pool.close()
+
+
+    @pytest.mark.asyncio
+    async def test_backend_without_model_stays_out_until_listed(self) -> None:
+        models: List[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"models": [{"name": name} for name in models]}
+            )
+
+        backend = make_backend("http://b0", handler)
+        pool = OllamaBackendPool([backend], model="tinyllama")
+        backend.eject("model not ready")
+
+        await pool.check_health()
+        assert backend.healthy is False
+
+        models.append("tinyllama:latest")
+        await pool.check_health()
+        assert backend.healthy is True
+        await pool.close()
+
+class TestOllamaServiceWithBackends:
+    @pytest.mark.asyncio
+    async def test_spreads_requests_and_checks_readiness_per_backend(self) -> None:
+        calls: Dict[str, int] = {"http://b0": 0, "http://b1": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            calls[f"{request.url.scheme}://{request.url.host}"] += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"response": '{"local": "Recife"}'})
+
+        pool = OllamaBackendPool([make_backend(url, handler) for url in calls])
+        service = OllamaService(pool=pool)
+
+        await asyncio.gather(*[service.generate_response("prompt") for _ in range(4)])
+
+        assert calls == {"http://b0": 2, "http://b1": 2}
+        assert all(s["requests"] == 2 for s in service.backend_stats())
+        await service.close()
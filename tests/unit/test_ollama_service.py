@@ -0,0 +1,335 @@
+import asyncio
+import json
+from typing import AsyncIterator, Dict
+
+import httpx
+import pytest
+
+from src.domain.exceptions import LLMServiceError
+from src.domain.value_objects import ChatMessage
+from src.infrastructure.models import OllamaBackend, OllamaBackendPool, OllamaService
+
+
+class FakeOllama:
+    def __init__(self, models: list[str]) -> None:
+        self.models = models
+        self.calls: Dict[str, int] = {"tags": 0, "pull": 0, "generate": 0}
+        self.generate_status = 200
+        self.pull_released = asyncio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tags":
+            self.calls["tags"] += 1
+            return httpx.Response(
+                200, json={"models": [{"name": name} for name in self.models]}
+            )
+        if request.url.path == "/api/pull":
+            self.calls["pull"] += 1
+            await self.pull_released.wait()
+            self.models.append("tinyllama:latest")
+            return httpx.Response(200, json={"status": "success"})
+
+        self.calls["generate"] += 1
+        if self.generate_status != 200:
+            return httpx.Response(self.generate_status, json={"error": "not found"})
+        return httpx.Response(200, json={"response": '{"local": "São Paulo"}'})
+
+    def service(self, readiness_ttl: float = 300.0) -> OllamaService:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return OllamaService(readiness_ttl=readiness_ttl, client=client)
+
+
+class TestOllamaServiceReadiness:
+    @pytest.mark.asyncio
+    async def test_readiness_is_cached_between_requests(self) -> None:
+        fake = FakeOllama(["tinyllama:latest"])
+        service = fake.service()
+
+        await service.generate_response("prompt")
+        await service.generate_response("prompt")
+
+        assert fake.calls == {"tags": 1, "pull": 0, "generate": 2}
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_readiness_is_checked_again(self) -> None:
+        fake = FakeOllama(["tinyllama:latest"])
+        service = fake.service(readiness_ttl=0.0)
+
+        await service.generate_response("prompt")
+        await service.generate_response("prompt")
+
+        assert fake.calls["tags"] == 2
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_model_is_pulled_once_in_background(self) -> None:
+        fake = FakeOllama([])
+        service = fake.service()
+
+        results = await asyncio.gather(
+            *[service.generate_response("prompt") for _ in range(5)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, LLMServiceError) for result in results)
+        assert fake.calls["tags"] == 1
+        assert fake.calls["generate"] == 0
+
+        await asyncio.sleep(0)
+        assert fake.calls["pull"] == 1
+
+        fake.pull_released.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert await service.generate_response("prompt") == '{"local": "São Paulo"}'
+        assert fake.calls["pull"] == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_model_not_found_triggers_recheck(self) -> None:
+        fake = FakeOllama(["tinyllama:latest"])
+        service = fake.service()
+        await service.warmup()
+        assert fake.calls["tags"] == 1
+
+        fake.generate_status = 404
+        with pytest.raises(LLMServiceError):
+            await service.generate_response("prompt")
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert fake.calls["tags"] == 2
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_backend_without_model_is_skipped(self) -> None:
+        missing = FakeOllama([])
+        ready = FakeOllama(["tinyllama:latest"])
+        backends = [
+            OllamaBackend(
+                f"http://ollama-{index}:11434",
+                client=httpx.AsyncClient(transport=httpx.MockTransport(fake.handler)),
+            )
+            for index, fake in enumerate([missing, ready])
+        ]
+        service = OllamaService(pool=OllamaBackendPool(backends))
+
+        assert await service.generate_response("prompt") == '{"local": "São Paulo"}'
+        assert await service.generate_response("prompt") == '{"local": "São Paulo"}'
+
+        assert backends[0].healthy is False
+        assert missing.calls["generate"] == 0
+        assert ready.calls["generate"] == 2
+        missing.pull_released.set()
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_every_backend_without_model_is_ejected(self) -> None:
+        fakes = [FakeOllama([]), FakeOllama([]), FakeOllama(["tinyllama:latest"])]
+        backends = [
+            OllamaBackend(
+                f"http://ollama-{index}:11434",
+                client=httpx.AsyncClient(transport=httpx.MockTransport(fake.handler)),
+            )
+            for index, fake in enumerate(fakes)
+        ]
+        service = OllamaService(pool=OllamaBackendPool(backends))
+
+        assert await service.generate_response("prompt") == '{"local": "São Paulo"}'
+
+        assert [backend.healthy for backend in backends] == [False, False, True]
+        assert fakes[2].calls["generate"] == 1
+        for fake in fakes:
+            fake.pull_released.set()
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_raises_once_every_backend_lacks_the_model(self) -> None:
+        fakes = [FakeOllama([]), FakeOllama([])]
+        backends = [
+            OllamaBackend(
+                f"http://ollama-{index}:11434",
+                client=httpx.AsyncClient(transport=httpx.MockTransport(fake.handler)),
+            )
+            for index, fake in enumerate(fakes)
+        ]
+        service = OllamaService(pool=OllamaBackendPool(backends))
+
+        with pytest.raises(LLMServiceError, match="not available"):
+            await service.generate_response("prompt")
+
+        assert [backend.healthy for backend in backends] == [False, False]
+        assert all(fake.calls["generate"] == 0 for fake in fakes)
+        for fake in fakes:
+            fake.pull_released.set()
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_ollama_raises_llm_service_error(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client)
+
+        with pytest.raises(LLMServiceError, match="Model preparation failed"):
+            await service.generate_response("prompt")
+        await service.close()
+
+
+class TestOllamaServiceStructuredOutput:
+    @pytest.mark.asyncio
+    async def test_schema_is_sent_as_format(self) -> None:
+        schema = {"type": "object", "properties": {"local": {"type": "string"}}}
+        payloads = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            payloads.append(json.loads(request.content))
+            return httpx.Response(200, json={"response": '{"local": "Recife"}'})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, response_schema=schema)
+
+        await service.generate_response("prompt")
+
+        assert payloads[0]["format"] == schema
+        await service.close()
+
+
+class TestOllamaServiceChat:
+    prefix = [
+        ChatMessage(role="system", content="Extract incidents"),
+        ChatMessage(role="user", content="Incident text: exemplo"),
+        ChatMessage(role="assistant", content='{"local": "São Paulo"}'),
+    ]
+
+    @pytest.mark.asyncio
+    async def test_sends_fixed_prefix_and_user_turn_to_chat_api(self) -> None:
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            requests.append(request)
+            message = {"role": "assistant", "content": '{"local": "Recife"}'}
+            return httpx.Response(200, json={"message": message, "done": True})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, chat_prefix=self.prefix)
+
+        result = await service.generate_response("Incident text: falha")
+
+        assert result == '{"local": "Recife"}'
+        assert requests[0].url.path == "/api/chat"
+        messages = json.loads(requests[0].content)["messages"]
+        assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+        assert messages[-1]["content"] == "Incident text: falha"
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_streams_message_content(self) -> None:
+        lines = [
+            {"message": {"role": "assistant", "content": '{"local": '}, "done": False},
+            {"message": {"role": "assistant", "content": '"Recife"}'}, "done": False},
+            {"message": {"role": "assistant", "content": " extra"}, "done": False},
+        ]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            content = "".join(json.dumps(line) + "\n" for line in lines)
+            return httpx.Response(200, content=content.encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, chat_prefix=self.prefix, stream=True)
+
+        assert await service.generate_response("prompt") == '{"local": "Recife"}'
+        await service.close()
+
+
+class TestOllamaServiceStreaming:
+    @pytest.mark.asyncio
+    async def test_stops_reading_once_json_object_closes(self) -> None:
+        tokens = ['Resposta: {"local"', ': "Recife", "tipo": "{x}"', "}", " Explicação", " extra"]
+        sent = []
+
+        async def body() -> AsyncIterator[bytes]:
+            for token in tokens:
+                sent.append(token)
+                yield (json.dumps({"response": token, "done": False}) + "\n").encode()
+            yield (json.dumps({"response": "", "done": True}) + "\n").encode()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, content=body())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, stream=True)
+
+        result = await service.generate_response("prompt")
+
+        assert result == '{"local": "Recife", "tipo": "{x}"}'
+        assert len(sent) < len(tokens)
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_response_yields_tokens_until_object_closes(self) -> None:
+        tokens = ['{"local"', ': "Recife"', "}", " Explicação", " extra"]
+        sent = []
+
+        async def body() -> AsyncIterator[bytes]:
+            for token in tokens:
+                sent.append(token)
+                yield (json.dumps({"response": token, "done": False}) + "\n").encode()
+            yield (json.dumps({"response": "", "done": True}) + "\n").encode()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, content=body())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client)
+
+        received = [token async for token in service.stream_response("prompt")]
+
+        assert received == tokens[:3]
+        assert len(sent) < len(tokens)
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_response_wraps_ollama_errors(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            return httpx.Response(200, content=b'{"error": "model crashed"}\n')
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client)
+
+        with pytest.raises(LLMServiceError, match="model crashed"):
+            [token async for token in service.stream_response("prompt")]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_returns_full_text_when_no_object_closes(self) -> None:
+        lines = [{"response": "sem json", "done": False}, {"response": "", "done": True}]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            content = "".join(json.dumps(line) + "\n" for line in lines)
+            return httpx.Response(200, content=content.encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, stream=True)
+
+        assert await service.generate_response("prompt") == "sem json"
+        await service.close()
@@ -0,0 +1,113 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.presentation.api import pipeline as pipeline_module
+from src.presentation.api.pipeline import ExtractionPipeline, PipelineHolder
+from src.presentation.api.settings import Settings, load_settings
+
+
+def make_pipeline(settings: Settings) -> ExtractionPipeline:
+    pipeline = ExtractionPipeline(
+        settings=settings, use_case=AsyncMock(), llm_service=AsyncMock()
+    )
+    object.__setattr__(pipeline, "close", AsyncMock())
+    return pipeline
+
+
+class TestSettings:
+    def test_reads_typed_values_from_environment(self) -> None:
+        settings = Settings.from_env(
+            {
+                "OLLAMA_MODEL": "phi3",
+                "OLLAMA_API": "CHAT",
+                "LLM_MAX_CONCURRENCY": "2",
+                "LLM_QUEUE_TIMEOUT_SECONDS": "1.5",
+                "EXTRACTION_CACHE_ENABLED": "false",
+            }
+        )
+
+        assert settings.ollama_model == "phi3"
+        assert settings.ollama_api == "chat"
+        assert settings.llm_max_concurrency == 2
+        assert settings.llm_queue_timeout == 1.5
+        assert settings.cache_enabled is False
+        assert settings.max_input_chars == Settings.max_input_chars
+
+    def test_rejects_unknown_api(self) -> None:
+        with pytest.raises(ValueError):
+            Settings.from_env({"OLLAMA_API": "completions"})
+
+    def test_settings_file_overrides_environment(self, tmp_path: Path) -> None:
+        path = tmp_path / "settings.env"
+        path.write_text("# ajustes\nLLM_MAX_CONCURRENCY = 8\n\nOLLAMA_MODEL=phi3\n")
+
+        settings = load_settings(
+            {"SETTINGS_FILE": str(path), "LLM_MAX_CONCURRENCY": "2"}
+        )
+
+        assert settings.llm_max_concurrency == 8
+        assert settings.ollama_model == "phi3"
+
+
+    def test_job_queue_is_opt_in(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        assert pipeline_module.build_job_worker_pool(Settings(), PipelineHolder()) is None
+        assert list(tmp_path.iterdir()) == []
+
+class TestPipelineHolder:
+    @pytest.mark.asyncio
+    async def test_lease_requires_installed_pipeline(self) -> None:
+        holder = PipelineHolder()
+
+        with pytest.raises(RuntimeError):
+            async with holder.lease():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_reload_closes_previous_pipeline_after_drain(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fake_build(settings: Settings, metrics: object = None) -> ExtractionPipeline:
+            return make_pipeline(settings)
+
+        monkeypatch.setattr(pipeline_module, "build_pipeline", fake_build)
+        holder = PipelineHolder()
+        previous = make_pipeline(Settings())
+        holder.install(previous)
+
+        async with holder.lease() as leased:
+            reloaded = await holder.reload(Settings(llm_max_concurrency=8))
+            await asyncio.sleep(0)
+
+            assert leased is previous
+            assert holder.current is reloaded
+            previous.close.assert_not_awaited()  # type: ignore[attr-defined]
+
+        await asyncio.sleep(0.01)
+        previous.close.assert_awaited_once()  # type: ignore[attr-defined]
+
+        await holder.close()
+        reloaded.close.assert_awaited_once()  # type: ignore[attr-defined]
+        assert holder.current is None
+
+    @pytest.mark.asyncio
+    async def test_undrained_pipeline_is_closed_after_timeout(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fake_build(settings: Settings, metrics: object = None) -> ExtractionPipeline:
+            return make_pipeline(settings)
+
+        monkeypatch.setattr(pipeline_module, "build_pipeline", fake_build)
+        holder = PipelineHolder(drain_timeout=0.01)
+        previous = make_pipeline(Settings())
+        holder.install(previous)
+
+        async with holder.lease():
+            await holder.reload(Settings())
+            await asyncio.sleep(0.05)
+
+            previous.close.assert_awaited_once()  # type: ignore[attr-defined]
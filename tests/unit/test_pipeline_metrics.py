@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from src.application.use_cases import ExtractIncidentInfoUseCase
+from src.domain.entities import IncidentInfo, IncidentText
+from src.domain.exceptions import LLMServiceError
+from src.infrastructure.metrics import MetricsRegistry, PipelineMetrics
+from src.infrastructure.models import OllamaService
+
+
+class TestMetricsRegistry:
+    def test_renders_counters_and_cumulative_histograms(self) -> None:
+        registry = MetricsRegistry()
+        errors = registry.counter("errors_total", "Errors", ("error_type",))
+        latency = registry.histogram(
+            "latency_seconds", "Latency", ("stage",), buckets=(0.1, 1.0)
+        )
+
+        errors.inc("LLMServiceError")
+        errors.inc("LLMServiceError")
+        latency.observe(0.05, "llm")
+        latency.observe(0.5, "llm")
+        latency.observe(3.0, "llm")
+
+        assert registry.render().splitlines() == [
+            "# HELP errors_total Errors",
+            "# TYPE errors_total counter",
+            'errors_total{error_type="LLMServiceError"} 2',
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{stage="llm",le="0.1"} 1',
+            'latency_seconds_bucket{stage="llm",le="1"} 2',
+            'latency_seconds_bucket{stage="llm",le="+Inf"} 3',
+            'latency_seconds_sum{stage="llm"} 3.55',
+            'latency_seconds_count{stage="llm"} 3',
+        ]
+
+    def test_escapes_label_values(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("c_total", "C", ("name",)).inc('a"b\\c')
+
+        assert 'c_total{name="a\\"b\\\\c"} 1' in registry.render()
+
+
+class TestPipelineMetrics:
+    @pytest.mark.asyncio
+    async def test_use_case_records_stages_and_errors(self) -> None:
+        metrics = PipelineMetrics()
+        llm_service = AsyncMock()
+        llm_service.generate_response.return_value = '{"local": "Recife"}'
+        text_preprocessor = Mock()
+        text_preprocessor.preprocess.return_value = "Falha em Recife"
+        json_parser = Mock()
+        json_parser.parse.return_value = {"local": "Recife"}
+        text_postprocessor = Mock()
+        text_postprocessor.build_incident_info.return_value = IncidentInfo(
+            None, "Recife", "", ""
+        )
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=llm_service,
+            text_preprocessor=text_preprocessor,
+            json_parser=json_parser,
+            text_postprocessor=text_postprocessor,
+            metrics=metrics,
+        )
+
+        await use_case.execute(IncidentText("Falha em Recife"))
+        llm_service.generate_response.side_effect = LLMServiceError("down")
+        with pytest.raises(LLMServiceError):
+            await use_case.execute(IncidentText("Falha em Recife"))
+
+        for stage, count in [
+            ("preprocess", 2),
+            ("llm", 2),
+            ("parse", 1),
+            ("postprocess", 1),
+        ]:
+            assert metrics.stage_duration.count(stage) == count
+        assert metrics.errors.value("LLMServiceError") == 1
+
+    @pytest.mark.asyncio
+    async def test_ollama_service_records_reported_timings(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "tinyllama"}]})
+            return httpx.Response(
+                200,
+                json={
+                    "response": "{}",
+                    "done": True,
+                    "load_duration": 2_000_000_000,
+                    "prompt_eval_count": 120,
+                    "prompt_eval_duration": 300_000_000,
+                    "eval_count": 40,
+                    "eval_duration": 800_000_000,
+                },
+            )
+
+        metrics = PipelineMetrics()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = OllamaService(client=client, metrics=metrics)
+
+        await service.generate_response("prompt")
+        await service.generate_response("prompt")
+
+        assert metrics.prompt_eval_tokens.value() == 240
+        assert metrics.eval_tokens.value() == 80
+        assert metrics.eval_duration.count() == 2
+        assert "ollama_load_duration_seconds_sum 4" in metrics.render()
+        await service.close()
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.metrics import PipelineMetrics, RequestTimings
+from src.infrastructure.profiling import SamplingProfiler, capture_memory_snapshot
+
+
+def busy_loop(seconds: float) -> None:
+    import time
+
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+class TestRequestTimings:
+    def test_renders_server_timing_and_forwards_to_delegate(self) -> None:
+        metrics = PipelineMetrics()
+        timings = RequestTimings(delegate=metrics)
+
+        timings.observe_stage("preprocess", 0.0012)
+        timings.observe_stage("llm", 0.2)
+        timings.observe_stage("llm", 0.1)
+        timings.count_error("LLMServiceError")
+
+        assert timings.server_timing(0.5) == (
+            'preprocess;dur=1.20, llm;dur=300.00;desc="2x", total;dur=500.00'
+        )
+        assert metrics.stage_duration.count("llm") == 2
+        assert metrics.errors.value("LLMServiceError") == 1
+
+
+class TestSamplingProfiler:
+    @pytest.mark.asyncio
+    async def test_samples_the_event_loop_thread(self) -> None:
+        async def work() -> None:
+            await asyncio.sleep(0.01)
+            busy_loop(0.1)
+
+        task = asyncio.create_task(work())
+        report = await SamplingProfiler(interval=0.002).profile(0.15)
+        await task
+
+        assert report["samples"] > 0
+        assert any("busy_loop" in entry["function"] for entry in report["top_self"])
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in report["collapsed"])
+
+
+class TestMemorySnapshot:
+    @pytest.mark.asyncio
+    async def test_reports_allocation_growth(self) -> None:
+        retained = []
+
+        async def allocate() -> None:
+            await asyncio.sleep(0.01)
+            retained.extend(bytearray(1024) for _ in range(1000))
+
+        task = asyncio.create_task(allocate())
+        report = await capture_memory_snapshot(0.05)
+        await task
+
+        assert report["top_growth"][0]["size_diff_bytes"] > 500_000
+        assert "test_profiling.py" in report["top_growth"][0]["location"]
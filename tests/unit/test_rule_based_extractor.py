@@ -0,0 +1,87 @@
+import re
+from datetime import datetime
+
+from src.domain.entities import IncidentInfo
+from src.infrastructure.extractors import ExtractionRule, RuleBasedExtractor, default_rules
+
+
+class TestRuleBasedExtractor:
+    def setup_method(self) -> None:
+        self.extractor = RuleBasedExtractor()
+
+    def test_extracts_templated_incident(self) -> None:
+        text = (
+            "2025-08-14 14:00, no escritório de São Paulo, houve uma falha no "
+            "servidor principal que afetou o sistema de faturamento por 2 horas."
+        )
+
+        result = self.extractor.extract(text)
+
+        assert result == IncidentInfo(
+            data_ocorrencia=datetime(2025, 8, 14, 14, 0),
+            local="São Paulo",
+            tipo_incidente="Falha no servidor principal",
+            impacto="Afetou o sistema de faturamento por 2 horas",
+        )
+        assert self.extractor.stats()["rule_hits"]["site_location"] == 1
+
+    def test_extracts_brazilian_date_and_gazetteer_location(self) -> None:
+        text = (
+            "13/08/2025 às 9:30, em Recife, houve queda de energia que deixou "
+            "a agência fechada por 3 horas."
+        )
+
+        result = self.extractor.extract(text)
+
+        assert result is not None
+        assert result.data_ocorrencia == datetime(2025, 8, 13, 9, 30)
+        assert result.local == "Recife"
+        assert result.tipo_incidente == "Queda de energia"
+
+    def test_incomplete_text_falls_back(self) -> None:
+        assert self.extractor.extract("Falha no servidor principal") is None
+        assert self.extractor.stats()["fallbacks"] == 1
+
+    def test_date_without_time_is_not_confident_enough(self) -> None:
+        text = (
+            "2025-08-14, no escritório de São Paulo, houve uma falha no servidor "
+            "que afetou o sistema por 2 horas."
+        )
+
+        assert self.extractor.extract(text) is None
+
+    def test_custom_rules_are_pluggable(self) -> None:
+        rules = default_rules() + [
+            ExtractionRule(
+                name="impact_minutes",
+                field="impacto",
+                pattern=re.compile(r"(?P<value>\d+ minutos fora do ar)"),
+                confidence=0.9,
+                convert=lambda match: match["value"],
+            )
+        ]
+        extractor = RuleBasedExtractor(rules=rules)
+        text = (
+            "2025-08-14 14:00, no escritório de Recife, houve uma falha no "
+            "servidor, 30 minutos fora do ar."
+        )
+
+        result = extractor.extract(text)
+
+        assert result is not None
+        assert result.impacto == "30 minutos fora do ar"
+
+    def test_record_comparison_counts_mismatched_fields(self) -> None:
+        fast_path = IncidentInfo(datetime(2025, 8, 14, 14, 0), "Recife", "Falha", "A")
+        llm = IncidentInfo(datetime(2025, 8, 14, 14, 0), "recife", "Queda", "A")
+
+        self.extractor.record_comparison(fast_path, llm)
+
+        stats = self.extractor.stats()
+        assert stats["comparisons"] == 1
+        assert stats["mismatches"] == 1
+        assert stats["field_mismatches"] == {"tipo_incidente": 1}
+
+    def test_sampling_disabled_by_default(self) -> None:
+        assert not self.extractor.should_compare()
+        assert RuleBasedExtractor(sample_rate=1.0).should_compare()
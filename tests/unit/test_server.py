@@ -0,0 +1,25 @@
+import os
+from unittest.mock import patch
+
+from src.presentation.api import server
+
+
+class TestServer:
+    def test_multiple_workers_enable_the_host_limit(self) -> None:
+        with patch.dict(os.environ, {}, clear=True), patch.object(server.uvicorn, "run") as run:
+            server.main(["--workers", "3", "--port", "9000"])
+
+            assert os.environ["LLM_HOST_LIMIT_ENABLED"] == "true"
+
+        run.assert_called_once_with(server.APP, host="0.0.0.0", port=9000, workers=3)
+
+    def test_explicit_setting_and_single_worker_are_respected(self) -> None:
+        with patch.dict(os.environ, {"LLM_HOST_LIMIT_ENABLED": "false"}, clear=True), patch.object(server.uvicorn, "run"):
+            server.main(["--workers", "2"])
+            assert os.environ["LLM_HOST_LIMIT_ENABLED"] == "false"
+
+        with patch.dict(os.environ, {"WEB_CONCURRENCY": "1"}, clear=True), patch.object(server.uvicorn, "run") as run:
+            server.main([])
+            assert "LLM_HOST_LIMIT_ENABLED" not in os.environ
+
+        assert run.call_args.kwargs["workers"] == 1
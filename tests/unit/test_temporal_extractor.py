@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.processors import PortugueseTemporalExtractor, TextPreprocessor
+
+# A Thursday.
+REFERENCE = datetime(2025, 8, 14, 10, 30)
+
+
+class TestPortugueseTemporalExtractor:
+    def setup_method(self) -> None:
+        self.extractor = PortugueseTemporalExtractor()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("No dia 13 de agosto às 5h houve falha", datetime(2025, 8, 13, 5, 0)),
+            ("Em 2 de março de 2024, queda de energia", datetime(2024, 3, 2)),
+            ("15 de dezembro o link caiu", datetime(2024, 12, 15)),
+            ("Falha em 13/08/2025 às 3h da tarde", datetime(2025, 8, 13, 15, 0)),
+            ("Ocorreu 2025-08-10 14:30 no CD", datetime(2025, 8, 10, 14, 30)),
+            ("A rede caiu semana passada", datetime(2025, 8, 7)),
+            ("Na segunda-feira ao meio-dia", datetime(2025, 8, 11, 12, 0)),
+            ("Na quinta-feira passada", datetime(2025, 8, 7)),
+            ("Há 2 horas o sistema parou", datetime(2025, 8, 14, 8, 30)),
+            ("O backup falhou três dias atrás", datetime(2025, 8, 11)),
+            ("Ontem às 14h o servidor caiu", datetime(2025, 8, 13, 14, 0)),
+        ],
+    )
+    def test_resolves_expressions_against_reference(
+        self, text: str, expected: datetime
+    ) -> None:
+        assert self.extractor.extract(text, REFERENCE) == expected
+
+    def test_works_on_preprocessed_text(self) -> None:
+        text = TextPreprocessor().preprocess("Ontem às 14h30 o servidor caiu", REFERENCE)
+
+        assert self.extractor.extract(text, REFERENCE) == datetime(2025, 8, 13, 14, 30)
+
+    def test_durations_are_not_read_as_times(self) -> None:
+        text = "Em 13/08/2025 o sistema ficou fora do ar por 2h"
+
+        assert self.extractor.extract(text, REFERENCE) == datetime(2025, 8, 13)
+
+    def test_invalid_dates_are_skipped(self) -> None:
+        text = "Registrado 31/02/2025, falha real em 01/03/2025"
+
+        assert self.extractor.extract(text, REFERENCE) == datetime(2025, 3, 1)
+
+    def test_distinct_dates_return_none(self) -> None:
+        text = "O contrato renovado em 01/08/2025 cobre o servidor que caiu ontem às 14h"
+
+        assert self.extractor.extract(text, datetime(2025, 8, 20, 10, 0)) is None
+
+    def test_time_is_not_taken_across_another_date(self) -> None:
+        text = "Às 9h foi registrado 31/02/2025, falha real em 01/03/2025"
+
+        assert self.extractor.extract(text, REFERENCE) == datetime(2025, 3, 1)
+
+    def test_text_without_date_returns_none(self) -> None:
+        assert self.extractor.extract("Falha às 14h no servidor", REFERENCE) is None
+        assert self.extractor.extract("Segunda tentativa falhou", REFERENCE) is None
@@ -0,0 +1,48 @@
+import pytest
+
+from src.infrastructure.processors import SentenceWindowChunker
+
+
+class TestSentenceWindowChunker:
+    def test_short_text_is_a_single_window(self) -> None:
+        chunker = SentenceWindowChunker(max_tokens=100)
+
+        assert chunker.split("Falha no servidor em Recife.") == [
+            "Falha no servidor em Recife."
+        ]
+
+    def test_windows_break_on_sentence_boundaries(self) -> None:
+        chunker = SentenceWindowChunker(max_tokens=10, chars_per_token=4)
+        text = (
+            "Falha no servidor em Recife. O sistema de notas parou. "
+            "A equipe reiniciou o banco; tudo voltou ao normal."
+        )
+
+        windows = chunker.split(text)
+
+        assert windows == [
+            "Falha no servidor em Recife.",
+            "O sistema de notas parou.",
+            "A equipe reiniciou o banco;",
+            "tudo voltou ao normal.",
+        ]
+        assert all(len(window) <= chunker.max_chars for window in windows)
+
+    def test_short_sentences_share_a_window(self) -> None:
+        chunker = SentenceWindowChunker(max_tokens=10, chars_per_token=4)
+
+        assert chunker.split("Falha. Queda. Rede lenta. Disco cheio em Recife.") == [
+            "Falha. Queda. Rede lenta.",
+            "Disco cheio em Recife.",
+        ]
+
+    def test_oversized_sentence_falls_back_to_words_and_hard_cuts(self) -> None:
+        chunker = SentenceWindowChunker(max_tokens=2, chars_per_token=4)
+
+        windows = chunker.split("servidor parou abcdefghijkl")
+
+        assert windows == ["servidor", "parou", "abcdefgh", "ijkl"]
+
+    def test_rejects_empty_budget(self) -> None:
+        with pytest.raises(ValueError):
+            SentenceWindowChunker(max_tokens=0)
@@ -16,6 +16,17 @@ class TestTextPostprocessor:
             result = self.postprocessor._parse_datetime(date_str)
             assert result == expected
 
+    def test_parse_datetime_accepts_other_llm_formats(self) -> None:
+        valid_formats = [
+            ("2025-08-13T14:00:00", datetime(2025, 8, 13, 14, 0)),
+            ("2025-08-13 14:00:30", datetime(2025, 8, 13, 14, 0, 30)),
+            ("13/08/2025 14:00", datetime(2025, 8, 13, 14, 0)),
+            ("13/08/2025", datetime(2025, 8, 13, 0, 0)),
+        ]
+
+        for date_str, expected in valid_formats:
+            assert self.postprocessor._parse_datetime(date_str) == expected
+
     def test_parse_invalid_datetime_returns_none(self) -> None:
         invalid_formats = ["invalid-date", "2025/08/13", ""]
         
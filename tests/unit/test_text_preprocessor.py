@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from src.infrastructure.processors import TextPreprocessor
 
@@ -45,4 +45,31 @@ class TestTextPreprocessor:
         assert yesterday in result
         assert "14:30" in result
         assert "ontem" not in result.lower()
-        assert "  " not in result
\ No newline at end of file
+        assert "  " not in result
+
+    def test_reference_time_resolves_relative_dates(self) -> None:
+        text = "Anteontem às 5h e ontem às 14h30, hoje normalizado."
+        result = self.preprocessor.preprocess(
+            text, reference_time=datetime(2025, 8, 15, 10, 0)
+        )
+
+        assert result == "2025-08-13 5:00 e 2025-08-14 14:30, 2025-08-15 normalizado."
+
+    def test_reference_time_uses_its_own_timezone(self) -> None:
+        reference_time = datetime(2025, 8, 15, 1, 0, tzinfo=timezone(timedelta(hours=-3)))
+
+        result = self.preprocessor.preprocess("ontem", reference_time=reference_time)
+
+        assert result == "2025-08-14"
+
+    def test_relative_words_inside_other_words_are_kept(self) -> None:
+        result = self.preprocessor.preprocess(
+            "hojex ontemx", reference_time=datetime(2025, 8, 15)
+        )
+
+        assert result == "hojex ontemx"
+
+    def test_punctuation_is_normalized(self) -> None:
+        result = self.preprocessor.preprocess("falha ,servidor;rede.fim")
+
+        assert result == "falha , servidor, rede. fim"
@@ -1,10 +1,19 @@
+import asyncio
+
 import pytest
+from typing import AsyncGenerator, AsyncIterator, List
 from unittest.mock import AsyncMock, Mock
 from datetime import datetime
 
-from src.application.use_cases import ExtractIncidentInfoUseCase
+from src.application.interfaces import CachePolicy, LLMServiceInterface
+from src.application.use_cases import (
+    BatchExtractIncidentInfoUseCase,
+    BatchItem,
+    ExtractIncidentInfoUseCase,
+)
 from src.domain.entities import IncidentText
-from src.domain.exceptions import InvalidJsonResponseError
+from src.domain.exceptions import InvalidJsonResponseError, LLMServiceError
+from src.infrastructure.cache import ExtractionResultCache
 
 
 class TestExtractIncidentInfoUseCase:
@@ -97,3 +106,448 @@ class TestExtractIncidentInfoUseCase:
         
         assert result.data_ocorrencia is None
 
+
+
+    @pytest.mark.asyncio
+    async def test_structured_output_skips_scraping(self) -> None:
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            structured_output=True,
+        )
+        self.text_preprocessor.preprocess.return_value = "Falha no servidor"
+        self.llm_service.generate_response.return_value = '{"local": "São Paulo"}'
+        self.json_parser.parse_structured.return_value = {"local": "São Paulo"}
+
+        await use_case.execute(IncidentText("Falha no servidor"))
+
+        self.json_parser.parse_structured.assert_called_once_with('{"local": "São Paulo"}')
+        self.json_parser.parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_micro_batch_result_skips_single_prompt(self) -> None:
+        micro_batcher = Mock()
+        micro_batcher.extract = AsyncMock(return_value={"local": "Recife"})
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            micro_batcher=micro_batcher,
+        )
+        self.text_preprocessor.preprocess.return_value = "Falha em Recife"
+        self.text_postprocessor.normalize_field_names.return_value = {"local": "Recife"}
+
+        await use_case.execute(IncidentText("Falha em Recife"))
+
+        micro_batcher.extract.assert_awaited_once_with("Falha em Recife")
+        self.llm_service.generate_response.assert_not_called()
+        self.text_postprocessor.normalize_field_names.assert_called_once_with(
+            {"local": "Recife"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_micro_batch_fallback_uses_single_prompt(self) -> None:
+        micro_batcher = Mock()
+        micro_batcher.extract = AsyncMock(return_value=None)
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            micro_batcher=micro_batcher,
+        )
+        self.text_preprocessor.preprocess.return_value = "Falha em Recife"
+        self.llm_service.generate_response.return_value = '{"local": "Recife"}'
+        self.json_parser.parse.return_value = {"local": "Recife"}
+
+        await use_case.execute(IncidentText("Falha em Recife"))
+
+        self.llm_service.generate_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_long_text_windows_are_extracted_and_merged(self) -> None:
+        from src.domain.entities import IncidentInfo
+        from src.infrastructure.processors import SentenceWindowChunker
+
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            text_chunker=SentenceWindowChunker(max_tokens=8, chars_per_token=4),
+        )
+        self.text_preprocessor.preprocess.return_value = (
+            "Falha no servidor em Recife. Sistema de notas fora do ar."
+        )
+        self.llm_service.generate_response.side_effect = lambda prompt: prompt
+        self.json_parser.parse.side_effect = lambda response: {"window": response}
+        self.text_postprocessor.normalize_field_names.side_effect = lambda data: data
+        self.text_postprocessor.build_incident_info.side_effect = lambda data: (
+            IncidentInfo(datetime(2025, 8, 14, 9, 0), "Recife", "Falha no servidor", "")
+            if "Recife" in data["window"]
+            else IncidentInfo(datetime(2025, 8, 13, 9, 0), "", "", "Notas fora do ar")
+        )
+
+        result = await use_case.execute(IncidentText("Texto longo"))
+
+        assert self.llm_service.generate_response.await_count == 2
+        assert result == IncidentInfo(
+            data_ocorrencia=datetime(2025, 8, 13, 9, 0),
+            local="Recife",
+            tipo_incidente="Falha no servidor",
+            impacto="Notas fora do ar",
+        )
+
+    @pytest.mark.asyncio
+    async def test_long_text_fails_when_llm_fails_on_a_window(self) -> None:
+        from src.infrastructure.processors import SentenceWindowChunker
+
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            text_chunker=SentenceWindowChunker(max_tokens=8, chars_per_token=4),
+        )
+        self.text_preprocessor.preprocess.return_value = (
+            "Falha no servidor em Recife. Sistema de notas fora do ar."
+        )
+        self.llm_service.generate_response.side_effect = LLMServiceError("down")
+
+        with pytest.raises(LLMServiceError):
+            await use_case.execute(IncidentText("Texto longo"))
+
+    @pytest.mark.asyncio
+    async def test_resolved_date_overrides_llm_and_shortens_prompt(self) -> None:
+        from src.domain.entities import IncidentInfo
+        from src.domain.value_objects import ExtractionPrompt
+        from src.infrastructure.processors import PortugueseTemporalExtractor
+
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            temporal_extractor=PortugueseTemporalExtractor(),
+            dateless_prompt=ExtractionPrompt.default_without_date(),
+        )
+        self.text_preprocessor.preprocess.return_value = (
+            "Na segunda-feira 5:00 houve falha em Recife"
+        )
+        self.llm_service.generate_response.return_value = "{}"
+        self.json_parser.parse.return_value = {}
+        self.text_postprocessor.normalize_field_names.return_value = {}
+        self.text_postprocessor.build_incident_info.return_value = IncidentInfo(
+            datetime(2020, 1, 1), "Recife", "Falha", ""
+        )
+
+        result = await use_case.execute(
+            IncidentText("texto", reference_time=datetime(2025, 8, 14, 10, 0))
+        )
+
+        assert result.data_ocorrencia == datetime(2025, 8, 11, 5, 0)
+        prompt = self.llm_service.generate_response.await_args.args[0]
+        assert "data_ocorrencia" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_unresolved_date_keeps_full_prompt(self) -> None:
+        from src.domain.entities import IncidentInfo
+        from src.domain.value_objects import ExtractionPrompt
+        from src.infrastructure.processors import PortugueseTemporalExtractor
+
+        use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            temporal_extractor=PortugueseTemporalExtractor(),
+            dateless_prompt=ExtractionPrompt.default_without_date(),
+        )
+        self.text_preprocessor.preprocess.return_value = "Falha em Recife"
+        self.llm_service.generate_response.return_value = "{}"
+        self.json_parser.parse.return_value = {}
+        self.text_postprocessor.normalize_field_names.return_value = {}
+        llm_info = IncidentInfo(datetime(2025, 8, 1), "Recife", "Falha", "")
+        self.text_postprocessor.build_incident_info.return_value = llm_info
+
+        result = await use_case.execute(IncidentText("texto"))
+
+        assert result == llm_info
+        prompt = self.llm_service.generate_response.await_args.args[0]
+        assert "data_ocorrencia" in prompt
+
+
+class TestExtractIncidentInfoUseCaseCache:
+    def setup_method(self) -> None:
+        from src.domain.entities import IncidentInfo
+
+        self.llm_service = AsyncMock()
+        self.text_preprocessor = Mock()
+        self.json_parser = Mock()
+        self.text_postprocessor = Mock()
+        self.cache = ExtractionResultCache(model="tinyllama")
+
+        self.text_preprocessor.preprocess.return_value = "Falha no servidor"
+        self.llm_service.generate_response.return_value = '{"local": "São Paulo"}'
+        self.text_postprocessor.build_incident_info.return_value = IncidentInfo(
+            data_ocorrencia=None,
+            local="São Paulo",
+            tipo_incidente="Falha no servidor",
+            impacto="Sistema indisponível"
+        )
+
+        self.use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=self.json_parser,
+            text_postprocessor=self.text_postprocessor,
+            result_cache=self.cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_served_from_cache(self) -> None:
+        first = await self.use_case.execute(IncidentText("Falha no servidor"))
+        second = await self.use_case.execute(IncidentText("Falha no servidor"))
+
+        assert first == second
+        assert self.llm_service.generate_response.await_count == 1
+        assert self.cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_policy_skips_cache(self) -> None:
+        await self.use_case.execute(IncidentText("Falha no servidor"))
+        await self.use_case.execute(
+            IncidentText("Falha no servidor"), cache_policy=CachePolicy.BYPASS
+        )
+
+        assert self.llm_service.generate_response.await_count == 2
+        assert self.cache.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_policy_recomputes_and_stores(self) -> None:
+        await self.use_case.execute(IncidentText("Falha no servidor"))
+        await self.use_case.execute(
+            IncidentText("Falha no servidor"), cache_policy=CachePolicy.REFRESH
+        )
+        await self.use_case.execute(IncidentText("Falha no servidor"))
+
+        assert self.llm_service.generate_response.await_count == 2
+        assert self.cache.stats()["hits"] == 1
+
+
+
+class TestBatchExtractIncidentInfoUseCase:
+    async def items(self, texts: list) -> AsyncIterator[BatchItem]:
+        for index, text in enumerate(texts):
+            yield BatchItem(index=index, text=text)
+
+    @pytest.mark.asyncio
+    async def test_results_are_tagged_and_errors_reported_inline(self) -> None:
+        from src.domain.entities import IncidentInfo
+
+        async def execute(incident_text: IncidentText, cache_policy: CachePolicy) -> IncidentInfo:
+            if incident_text.content == "erro":
+                raise LLMServiceError("Connection failed")
+            return IncidentInfo(None, incident_text.content, "Falha", "Nenhum")
+
+        use_case = Mock()
+        use_case.execute = execute
+        batch_use_case = BatchExtractIncidentInfoUseCase(use_case, max_concurrency=2)
+
+        results = [
+            result
+            async for result in batch_use_case.execute(self.items(["A", "erro", "C"]))
+        ]
+
+        by_index = {result.index: result for result in results}
+        assert by_index[0].incident_info.local == "A"
+        assert isinstance(by_index[1].error, LLMServiceError)
+        assert by_index[2].incident_info.local == "C"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        from src.domain.entities import IncidentInfo
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute(incident_text: IncidentText, cache_policy: CachePolicy) -> IncidentInfo:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return IncidentInfo(None, incident_text.content, "Falha", "Nenhum")
+
+        use_case = Mock()
+        use_case.execute = execute
+        batch_use_case = BatchExtractIncidentInfoUseCase(use_case, max_concurrency=3)
+
+        results = [
+            result
+            async for result in batch_use_case.execute(
+                self.items([str(i) for i in range(10)])
+            )
+        ]
+
+        assert sorted(result.index for result in results) == list(range(10))
+        assert max_in_flight == 3
+
+
+
+class TestExtractIncidentInfoUseCaseFastPath:
+    def setup_method(self) -> None:
+        from src.domain.entities import IncidentInfo
+
+        self.fast_path_info = IncidentInfo(
+            data_ocorrencia=datetime(2025, 8, 14, 14, 0),
+            local="São Paulo",
+            tipo_incidente="Falha no servidor",
+            impacto="Sistema indisponível",
+        )
+        self.llm_service = AsyncMock()
+        self.llm_service.generate_response.return_value = '{"local": "São Paulo"}'
+        self.text_preprocessor = Mock()
+        self.text_preprocessor.preprocess.return_value = "Falha no servidor"
+        self.text_postprocessor = Mock()
+        self.text_postprocessor.build_incident_info.return_value = self.fast_path_info
+        self.fast_path_extractor = Mock()
+        self.fast_path_extractor.should_compare.return_value = False
+
+        self.use_case = ExtractIncidentInfoUseCase(
+            llm_service=self.llm_service,
+            text_preprocessor=self.text_preprocessor,
+            json_parser=Mock(),
+            text_postprocessor=self.text_postprocessor,
+            fast_path_extractor=self.fast_path_extractor,
+        )
+
+    @pytest.mark.asyncio
+    async def test_confident_fast_path_skips_llm(self) -> None:
+        self.fast_path_extractor.extract.return_value = self.fast_path_info
+
+        result = await self.use_case.execute(IncidentText("Falha no servidor"))
+
+        assert result == self.fast_path_info
+        self.llm_service.generate_response.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_llm(self) -> None:
+        self.fast_path_extractor.extract.return_value = None
+
+        await self.use_case.execute(IncidentText("Falha no servidor"))
+
+        self.llm_service.generate_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sampled_result_is_compared_with_llm(self) -> None:
+        self.fast_path_extractor.extract.return_value = self.fast_path_info
+        self.fast_path_extractor.should_compare.return_value = True
+
+        result = await self.use_case.execute(IncidentText("Falha no servidor"))
+        await asyncio.sleep(0)
+
+        assert result == self.fast_path_info
+        self.fast_path_extractor.record_comparison.assert_called_once_with(
+            self.fast_path_info, self.fast_path_info
+        )
+
+
+class TokenLLMService(LLMServiceInterface):
+    def __init__(self, tokens: List[str]) -> None:
+        self.tokens = tokens
+        self.prompts: List[str] = []
+
+    async def generate_response(self, prompt: str) -> str:
+        raise AssertionError("streaming extraction must not wait for the full response")
+
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        self.prompts.append(prompt)
+        for token in self.tokens:
+            yield token
+
+
+class TestExtractIncidentInfoUseCaseStreaming:
+    tokens = [
+        '{"data_ocorrencia": "2025-08-13 14:00"',
+        ', "lugar": "Recife", "tipo_incidente": "Falha',
+        ' de rede", "impacto": "Sem acesso"',
+        "}",
+    ]
+
+    def use_case(self, llm_service: LLMServiceInterface, **kwargs) -> ExtractIncidentInfoUseCase:
+        from src.infrastructure.parsers import JsonParser
+        from src.infrastructure.processors import TextPostprocessor
+
+        text_preprocessor = Mock()
+        text_preprocessor.preprocess.side_effect = lambda text, reference_time=None: text
+        return ExtractIncidentInfoUseCase(
+            llm_service=llm_service,
+            text_preprocessor=text_preprocessor,
+            json_parser=JsonParser(),
+            text_postprocessor=TextPostprocessor(),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_streams_normalized_fields_then_result(self) -> None:
+        from src.application.use_cases import ExtractedField
+        from src.domain.entities import IncidentInfo
+
+        use_case = self.use_case(TokenLLMService(self.tokens))
+
+        events = [event async for event in use_case.execute_stream(IncidentText("Falha"))]
+
+        assert events == [
+            ExtractedField("data_ocorrencia", "2025-08-13 14:00"),
+            ExtractedField("local", "Recife"),
+            ExtractedField("tipo_incidente", "Falha de rede"),
+            ExtractedField("impacto", "Sem acesso"),
+            IncidentInfo(datetime(2025, 8, 13, 14, 0), "Recife", "Falha de rede", "Sem acesso"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resolved_date_is_sent_before_the_llm_runs(self) -> None:
+        from src.application.use_cases import ExtractedField
+        from src.domain.value_objects import ExtractionPrompt
+        from src.infrastructure.processors import PortugueseTemporalExtractor
+
+        llm_service = TokenLLMService(self.tokens)
+        use_case = self.use_case(
+            llm_service,
+            temporal_extractor=PortugueseTemporalExtractor(),
+            dateless_prompt=ExtractionPrompt.default_without_date(),
+        )
+
+        events = [
+            event
+            async for event in use_case.execute_stream(
+                IncidentText("Ontem às 9h falhou", reference_time=datetime(2025, 8, 14, 10, 0))
+            )
+        ]
+
+        assert events[0] == ExtractedField("data_ocorrencia", "2025-08-13 09:00")
+        assert [e.name for e in events[1:4]] == ["local", "tipo_incidente", "impacto"]
+        assert events[-1].data_ocorrencia == datetime(2025, 8, 13, 9, 0)
+        assert "data_ocorrencia" not in llm_service.prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_streamed_without_the_llm(self) -> None:
+        cache = ExtractionResultCache(model="tinyllama")
+        use_case = self.use_case(TokenLLMService(self.tokens), result_cache=cache)
+
+        first = [event async for event in use_case.execute_stream(IncidentText("Falha"))]
+        use_case._llm_service = TokenLLMService([])
+        second = [event async for event in use_case.execute_stream(IncidentText("Falha"))]
+
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_unparseable_stream_raises_invalid_json(self) -> None:
+        use_case = self.use_case(TokenLLMService(["sem", " json"]))
+
+        with pytest.raises(InvalidJsonResponseError):
+            [event async for event in use_case.execute_stream(IncidentText("Falha"))]